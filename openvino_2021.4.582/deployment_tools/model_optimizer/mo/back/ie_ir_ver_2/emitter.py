@@ -34,9 +34,16 @@ def serialize_constants(graph: Graph, bin_file_name: str, data_type=np.float32):
         @data_type: numpy data type to convert all blob elements to
 
     """
-    bin_hashes = {}
     with open(bin_file_name, 'wb') as bin_file:
-        serialize_constants_recursively(graph, bin_file, data_type, bin_hashes)
+        serialize_constants_to_stream(graph, bin_file, data_type)
+
+
+def serialize_constants_to_stream(graph: Graph, bin_file, data_type=np.float32):
+    """
+    The same as serialize_constants but writes blobs to the binary stream (opened file or io.BytesIO).
+    """
+    bin_hashes = {}
+    serialize_constants_recursively(graph, bin_file, data_type, bin_hashes)
 
 
 def update_offset_size_in_const_node(node: Node):
@@ -68,7 +75,7 @@ def serialize_constants_recursively(graph: Graph, bin_file, data_type, bin_hashe
                 update_offset_size_in_const_node(node)
             else:
                 start = bin_file.tell()
-                blob.tofile(bin_file)
+                bin_file.write(np.ascontiguousarray(blob).view(np.uint8).data)
                 end = bin_file.tell()
 
                 graph.node[node.node]['offset'] = start
@@ -406,6 +413,15 @@ def generate_ie_ir(graph: Graph, file_name: str, input_names: tuple = (), mean_o
         mean_offset: offset in binary file, where mean file values start
         mean_size: size of the mean file
     """
+    with open(file_name, 'wb') as file:
+        file.write(serialize_ie_ir(graph, input_names, mean_offset, mean_size, meta_info))
+
+
+def serialize_ie_ir(graph: Graph, input_names: tuple = (), mean_offset: tuple = (), mean_size: tuple = (),
+                    meta_info: dict = dict()):
+    """
+    The same as generate_ie_ir but returns the resulting IR XML as bytes instead of writing it to the file.
+    """
     net = Element('net')
     net.set('name', graph.name)
     net.set('version', str((graph.graph['ir_version'])))
@@ -431,8 +447,7 @@ def generate_ie_ir(graph: Graph, file_name: str, input_names: tuple = (), mean_o
         unsupported.report(log.error, "List of operations that cannot be converted to Inference Engine IR:")
         raise Error('Part of the nodes was not converted to IR. Stopped. ' +
                     refer_to_faq_msg(24))
-    with open(file_name, 'wb') as file:
-        file.write(bytes(pretty_xml_as_string, "UTF-8"))
+    return bytes(pretty_xml_as_string, "UTF-8")
 
 
 def port_renumber(graph: Graph):
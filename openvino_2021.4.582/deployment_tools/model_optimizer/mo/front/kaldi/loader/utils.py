@@ -3,6 +3,7 @@
 
 import io
 import os
+import re
 import struct
 
 import numpy as np
@@ -13,6 +14,14 @@ from mo.utils.utils import refer_to_faq_msg
 end_of_nnet_tag = '</Nnet>'
 end_of_component_tag = '<!EndOfComponent>'
 
+# tag is '<' followed by ascii symbols except '<' and '>' and closed by '>'
+tag_pattern = re.compile(rb'<[\x00-\x3b\x3d\x3f-\x7f]*>')
+tag_beginning_pattern = re.compile(rb'<[\x00-\x3b\x3d\x3f-\x7f]*')
+
+# the file is scanned by chunks, which size grows from the initial to the maximal one while searching
+initial_chunk_size = 64
+max_chunk_size = 1 << 20
+
 supported_components = [
     'addshift',
     'affinecomponent',
@@ -151,23 +160,28 @@ def find_next_tag(file_desc: io.BufferedReader) -> str:
     :param file_desc:file descriptor
     :return: string like '<sometag>'
     """
-    tag = b''
+    buffer_start = file_desc.tell()
+    buffer = b''
+    chunk_size = initial_chunk_size
     while True:
-        symbol = file_desc.read(1)
-        if symbol == b'':
+        chunk = file_desc.read(chunk_size)
+        if chunk == b'':
             raise Error('Unexpected end of Kaldi model')
-        if tag == b'' and symbol != b'<':
-            continue
-        elif symbol == b'<':
-            tag = b''
-        tag += symbol
-        if symbol != b'>':
-            continue
-        try:
-            return tag.decode('ascii')
-        except UnicodeDecodeError:
-            # Tag in Kaldi model always in ascii encoding
-            tag = b''
+        buffer += chunk
+        # Tag in Kaldi model always in ascii encoding
+        match = tag_pattern.search(buffer)
+        if match:
+            file_desc.seek(buffer_start + match.end())
+            return match.group().decode('ascii')
+        # keep the beginning of the tag which can be finished in the next chunk
+        tag_start = buffer.rfind(b'<')
+        if tag_start != -1 and tag_beginning_pattern.fullmatch(buffer, tag_start):
+            buffer_start += tag_start
+            buffer = buffer[tag_start:]
+        else:
+            buffer_start += len(buffer)
+            buffer = b''
+        chunk_size = min(2 * chunk_size, max_chunk_size)
 
 
 def read_placeholder(file_desc: io.BufferedReader, size=3) -> bytes:
@@ -272,12 +286,19 @@ def collect_until_whitespace(file_desc: io.BufferedReader):
     :return:
     """
     res = b''
+    chunk_size = initial_chunk_size
     while True:
-        new_sym = file_desc.read(1)
-        if new_sym == b' ' or new_sym == b'':
-            break
-        res += new_sym
-    return res
+        chunk_start = file_desc.tell()
+        chunk = file_desc.read(chunk_size)
+        whitespace_pos = chunk.find(b' ')
+        if whitespace_pos != -1:
+            # move the carriage right after the whitespace
+            file_desc.seek(chunk_start + whitespace_pos + 1)
+            return res + chunk[:whitespace_pos]
+        res += chunk
+        if chunk == b'':
+            return res
+        chunk_size = min(2 * chunk_size, max_chunk_size)
 
 
 def collect_until_token(file_desc: io.BufferedReader, token, size_search_zone=0):
@@ -352,6 +373,14 @@ def read_blob(file_desc: io.BufferedReader, size: int, dtype=np.float32):
         np.float32: 4,
         np.int32: 4
     }
+    if isinstance(file_desc, io.BytesIO):
+        # use memory of the buffer instead of copying the data
+        start = file_desc.tell()
+        data = file_desc.getbuffer()[start:start + size * dsizes[dtype]]
+        file_desc.seek(start + len(data))
+        blob = np.frombuffer(data, dtype=dtype)
+        blob.flags.writeable = False
+        return blob
     data = file_desc.read(size * dsizes[dtype])
     return np.frombuffer(data, dtype=dtype)
 
@@ -43,6 +43,7 @@ class Node:
             raise AttributeError("Attribute 'version' cannot be updated in {} node".format(self.name))
 
         attrs[k] = v
+        self.graph.mutation_epoch += 1
 
     def __getattr__(self, k):
         return self.graph.node[self.node][k]
@@ -54,6 +55,7 @@ class Node:
         if k == 'version' and self.graph.node[self.node].get(k, v) != v:
             raise AttributeError("Attribute 'version' cannot be updated in {} node".format(self.name))
         self.graph.node[self.node][k] = v
+        self.graph.mutation_epoch += 1
 
     def __contains__(self, k):
         return self.has(k)
@@ -70,6 +72,7 @@ class Node:
 
     def __delitem__(self, k):
         del self.graph.node[self.node][k]
+        self.graph.mutation_epoch += 1
 
     def add_input_port(self, idx, skip_if_exist=False, **kwargs):
         if not self.has_valid('_in_ports'):
@@ -555,6 +558,11 @@ class Graph(nx.MultiDiGraph):
     def __init__(self, data=None, **attr):
         self.stage = None
         self.strict_mode = True
+        # counter of graph modifications made through Graph and Node API, it is used to skip clean up and validation
+        # of the graph which has not been changed since the previous run
+        self.mutation_epoch = 0
+        self.clean_up_epoch = None
+        self.validation_epoch = None
         super().__init__(data, **attr)
 
         if not hasattr(self, 'node'):
@@ -570,9 +578,22 @@ class Graph(nx.MultiDiGraph):
     def add_node(self, node_for_adding, **attrs):
         # TODO: check required attrs for node
         super().add_node(node_for_adding, **attrs)
+        self.mutation_epoch += 1
         node = Node(self, node_for_adding)
         node.update_node()
 
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        super().add_nodes_from(nodes_for_adding, **attr)
+        self.mutation_epoch += 1
+
+    def remove_node(self, n):
+        super().remove_node(n)
+        self.mutation_epoch += 1
+
+    def remove_nodes_from(self, nodes):
+        super().remove_nodes_from(nodes)
+        self.mutation_epoch += 1
+
     def add_edge(self, u_for_edge, v_for_edge, key=None, **attr):
 
         # TODO: turn on strict mode
@@ -606,6 +627,7 @@ class Graph(nx.MultiDiGraph):
                     assert unode.has_port('out', attr['out']), "{} Node {} has no out port ({})" \
                                                                "".format(message, unode.name, attr['out'])
 
+        self.mutation_epoch += 1
         return super().add_edge(u_for_edge, v_for_edge, key=key, **attr)
 
     def add_edges_from(self, ebunch_to_add, **attr):
@@ -627,8 +649,13 @@ class Graph(nx.MultiDiGraph):
             self.add_edge(u, v, key=key, **ddd)
 
     def remove_edge(self, u, v, key=None):
+        self.mutation_epoch += 1
         return super().remove_edge(u, v, key=key)
 
+    def remove_edges_from(self, ebunch):
+        super().remove_edges_from(ebunch)
+        self.mutation_epoch += 1
+
     def erase_node(self, node: Node):
         """
         Erases node from the graph and reconnect edges from input node(s) to output node(s)
@@ -941,19 +968,18 @@ class Graph(nx.MultiDiGraph):
         :return: list of nodes in the DFS-visit order.
         """
         order = []
-        stack = [node_name]
+        visited.add(node_name)
+        # stack of nodes with iterators over their not yet checked children
+        stack = [(node_name, iter(self.out_edges(node_name)))]
         while len(stack) != 0:
-            node_name = stack[0]
-            stack.pop(0)
-            visited.add(node_name)
-            has_child = False
-            for _, out_node_name in self.out_edges(node_name):
+            node_name, out_edges = stack[-1]
+            for _, out_node_name in out_edges:
                 if out_node_name not in visited:
-                    stack.insert(0, node_name)
-                    stack.insert(0, out_node_name)
-                    has_child = True
+                    visited.add(out_node_name)
+                    stack.append((out_node_name, iter(self.out_edges(out_node_name))))
                     break
-            if not has_child:
+            else:
+                stack.pop()
                 order.append(node_name)
         return order
 
@@ -982,6 +1008,20 @@ class Graph(nx.MultiDiGraph):
         else:
             return list(reversed(order))
 
+    def pseudo_topological_sort_of_descendants(self, node_names: list):
+        """
+        The function performs pseudo topological sort of the part of the graph reachable from the given nodes, so
+        the nodes which can not be affected by the given ones are not visited.
+        :param node_names: names of nodes to start from.
+        :return: given nodes and their descendants in the pseudo-topological order.
+        """
+        order = list()
+        visited = set()
+        for node_name in node_names:
+            if node_name not in visited:
+                order.extend(self.dfs(node_name, visited))
+        return [Node(self, node) for node in reversed(order)]
+
     def clean_up(self, undead_node_types: list = None):
         if undead_node_types is None:
             undead_node_types = []
@@ -155,7 +155,14 @@ def add_constant_operations(graph):
 
 
 def shape_inference(graph):
-    for node in graph.pseudo_topological_sort():
+    """
+    Re-infers nodes marked with the 'need_shape_inference' attribute. Only these nodes and their descendants are
+    traversed because the rest of the graph can not be affected, so the call is cheap when nothing is changed.
+    """
+    marked_nodes = [node_id for node_id, attrs in graph.nodes(data=True) if attrs.get('need_shape_inference')]
+    if not marked_nodes:
+        return
+    for node in graph.pseudo_topological_sort_of_descendants(marked_nodes):
         if node.has_and_set('need_shape_inference'):
             old_out_shapes = [port.data.get_shape() for port in node.out_ports().values() if not port.disconnected()]
             node.infer(node)
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging as log
+from collections import deque
 
 import numpy as np
 from networkx.algorithms import isomorphism as ism
@@ -116,8 +117,7 @@ def edge_match(datasets1, datasets2):
     return values1 == values2
 
 
-def build_matcher(graph: Graph, nodes: list, edges: list, node_attrs: list = None,
-                  edge_attrs: list = None):
+def build_pattern_graph(nodes: list, edges: list, node_attrs: list = None, edge_attrs: list = None):
     if node_attrs is not None or edge_attrs is not None:
         log.warning('\'edge_attrs\' or `\'node_attrs\'` parameter was passed to function \'find_pattern_matches\', '
                     'but they are not used anymore. Pattern matching proceeds according to \'nodes\' and \'edges\' '
@@ -128,16 +128,166 @@ def build_matcher(graph: Graph, nodes: list, edges: list, node_attrs: list = Non
     subgraph = Graph(name='pattern')
     subgraph.add_nodes_from(nodes)
     subgraph.add_edges_from(edges)
+    return subgraph
+
+
+def build_matcher(graph: Graph, nodes: list, edges: list, node_attrs: list = None,
+                  edge_attrs: list = None):
+    subgraph = build_pattern_graph(nodes, edges, node_attrs, edge_attrs)
     return ism.MultiDiGraphMatcher(graph, subgraph, node_match, edge_match)
 
 
+# node attributes used to select candidates for pattern nodes without checking all nodes of the graph
+INDEXED_ATTRIBUTES = ['op', 'type', 'kind']
+
+
+def get_indexed_attrs(attrs: dict):
+    """
+    Returns list of (attribute, value) pairs of pattern node attributes which are compared with == and can be looked up
+    in the index
+    """
+    indexed_attrs = []
+    for attr in INDEXED_ATTRIBUTES:
+        if attr not in attrs:
+            continue
+        value = attrs[attr]
+        if callable(value) and not isinstance(value, type):
+            continue
+        try:
+            hash(value)
+        except TypeError:
+            continue
+        indexed_attrs.append((attr, value))
+    return indexed_attrs
+
+
+def build_attrs_index(graph: Graph, indexed_attrs: set):
+    """
+    Collects nodes of the graph having specific values of indexed attributes.
+    :param graph: graph to index
+    :param indexed_attrs: set of (attribute, value) pairs to collect nodes for
+    :return: dictionary {(attribute, value): [node ids]} and list of nodes which values can not be indexed
+    """
+    index = {key: [] for key in indexed_attrs}
+    attrs_to_index = set(attr for attr, _ in indexed_attrs)
+    not_indexed = []
+    for node_id, attrs in graph.nodes(data=True):
+        for attr in attrs_to_index:
+            try:
+                nodes = index.get((attr, attrs.get(attr, None)))
+            except TypeError:
+                # unhashable value can not be looked up, so the node is checked with node_match as it is
+                not_indexed.append(node_id)
+                break
+            if nodes is not None:
+                nodes.append(node_id)
+    return index, not_indexed
+
+
+def get_matching_order(pattern: Graph, candidates: dict):
+    """
+    Orders pattern nodes so that every node except the first node of each connected component is adjacent to some
+    previous one. Components start from the node with the least number of candidates.
+    :param pattern: pattern graph
+    :param candidates: dictionary {pattern node: list of candidate graph nodes} for nodes with indexed attributes
+    :return: list of (pattern node, (previous pattern node, edge direction) or None)
+    """
+    order = []
+    visited = set()
+    nodes = list(pattern.nodes())
+    while len(visited) != len(nodes):
+        not_visited = [node for node in nodes if node not in visited]
+        root = min(not_visited, key=lambda node: len(candidates[node]) if node in candidates else float('inf'))
+        visited.add(root)
+        order.append((root, None))
+        queue = deque([root])
+        while len(queue) != 0:
+            node = queue.popleft()
+            neighbours = [(out_node, 'out') for out_node in pattern.successors(node)] + \
+                         [(in_node, 'in') for in_node in pattern.predecessors(node)]
+            for neighbour, direction in neighbours:
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    order.append((neighbour, (node, direction)))
+                    queue.append(neighbour)
+    return order
+
+
+def number_of_edges(graph: Graph, u: str, v: str):
+    return len(graph.succ[u].get(v, {}))
+
+
 def find_pattern_matches(graph: Graph, nodes: list, edges: list, node_attrs: list = None,
                          edge_attrs: list = None):
     """
     Find all matches of a given sub-graph defined by [nodes, edges] in graph.
+    Matched nodes must induce the sub-graph isomorphic to the pattern, the same as for the networkx sub-graph
+    isomorphism. Instead of checking all nodes of the graph for each pattern node, the search starts from the nodes
+    having the same op/type/kind as the most selective pattern node and extends the match along the pattern edges.
+    Matches are ordered by the position of graph nodes matched to pattern nodes taken in the pattern order.
+    :return: iterator over dictionaries {graph node: pattern node}
     """
-    matcher = build_matcher(graph, nodes, edges, node_attrs, edge_attrs)
-    return matcher.subgraph_isomorphisms_iter()
+    pattern = build_pattern_graph(nodes, edges, node_attrs, edge_attrs)
+    pattern_nodes = list(pattern.nodes())
+    if len(pattern_nodes) == 0:
+        return iter([])
+
+    pattern_indexed_attrs = {node: get_indexed_attrs(pattern.node[node]) for node in pattern_nodes}
+    index, not_indexed = build_attrs_index(graph, set(key for attrs in pattern_indexed_attrs.values() for key in attrs))
+    candidates = {}
+    for node, indexed_attrs in pattern_indexed_attrs.items():
+        if indexed_attrs:
+            candidates[node] = min((index[key] for key in indexed_attrs), key=len) + not_indexed
+
+    matches = []
+    mapping = {}  # pattern node -> graph node
+    used = set()
+    order = get_matching_order(pattern, candidates)
+
+    def is_feasible(pattern_node, graph_node):
+        if not node_match(graph.node[graph_node], pattern.node[pattern_node]):
+            return False
+        for other_pattern_node, other_graph_node in list(mapping.items()) + [(pattern_node, graph_node)]:
+            for src, dst, pattern_src, pattern_dst in [(graph_node, other_graph_node, pattern_node, other_pattern_node),
+                                                       (other_graph_node, graph_node, other_pattern_node, pattern_node)]:
+                edges_num = number_of_edges(pattern, pattern_src, pattern_dst)
+                if number_of_edges(graph, src, dst) != edges_num:
+                    return False
+                if edges_num and not edge_match(graph.succ[src][dst], pattern.succ[pattern_src][pattern_dst]):
+                    return False
+                if src == dst:
+                    break
+        return True
+
+    def extend(position):
+        if position == len(order):
+            matches.append({graph_node: pattern_node for pattern_node, graph_node in mapping.items()})
+            return
+        pattern_node, parent = order[position]
+        if parent is None:
+            node_candidates = candidates[pattern_node] if pattern_node in candidates else graph.nodes()
+        else:
+            parent_pattern_node, direction = parent
+            neighbours = graph.successors if direction == 'out' else graph.predecessors
+            node_candidates = neighbours(mapping[parent_pattern_node])
+        for graph_node in node_candidates:
+            if graph_node in used or not is_feasible(pattern_node, graph_node):
+                continue
+            mapping[pattern_node] = graph_node
+            used.add(graph_node)
+            extend(position + 1)
+            used.remove(graph_node)
+            del mapping[pattern_node]
+
+    extend(0)
+
+    if len(matches) > 1:
+        matched_nodes = set(node for match in matches for node in match)
+        positions = {node: idx for idx, node in enumerate(graph.nodes()) if node in matched_nodes}
+        pattern_positions = {node: idx for idx, node in enumerate(pattern_nodes)}
+        matches.sort(key=lambda match: tuple(positions[graph_node] for graph_node in
+                                             sorted(match, key=lambda graph_node: pattern_positions[match[graph_node]])))
+    return iter(matches)
 
 
 def find_isomorphisms(graph: Graph, nodes: list, edges: list):
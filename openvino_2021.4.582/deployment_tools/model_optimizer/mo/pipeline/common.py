@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import argparse
+import io
 import logging as log
 import os
 from operator import itemgetter
@@ -12,7 +13,8 @@ from extensions.back.RemoveUselessConvert import RemoveUselessConvert
 from extensions.back.ResultRename import ResultRename
 from extensions.back.op_versioning import OpVersioning
 from extensions.ops.Cast import Cast
-from mo.back.ie_ir_ver_2.emitter import port_renumber, serialize_constants, generate_ie_ir, serialize_mean_image
+from mo.back.ie_ir_ver_2.emitter import port_renumber, serialize_constants, generate_ie_ir, serialize_mean_image, \
+    serialize_constants_to_stream, serialize_ie_ir
 from mo.graph.graph import Node, Graph
 from mo.middle.passes import tensor_names, convert_data_type
 from mo.middle.passes.convert_data_type import data_type_str_to_np
@@ -178,6 +180,47 @@ def prepare_emit_ir(graph: Graph, data_type: str, output_dir: str, output_model_
         input_names = []
     if meta_info is None:
         meta_info = {}
+    prepare_graph_for_emit(graph, data_type)
+
+    ir_path_suffix = "_tmp" if use_temporary_path else ""
+
+    bin_file = os.path.join(output_dir, '{}{}.bin'.format(output_model_name, ir_path_suffix))
+    serialize_constants(graph, bin_file)
+
+    mean_offset = None
+    mean_size = None
+    if mean_data:
+        mean_offset, mean_size = serialize_mean_image(bin_file, mean_data=mean_data)
+
+    generate_ie_ir(graph=graph,
+                   file_name=os.path.join(output_dir, '{}{}.xml'.format(output_model_name, ir_path_suffix)),
+                   input_names=input_names,
+                   mean_offset=mean_offset,
+                   mean_size=mean_size,
+                   meta_info=meta_info)
+    tensor_names.output_tensor_names_map(graph, os.path.join(output_dir, '{}{}.mapping'.format(output_model_name, ir_path_suffix)))
+
+
+def emit_ir_to_memory(graph: Graph, data_type: str, meta_info: dict = None):
+    """
+    Prepares the graph the same way as prepare_emit_ir but keeps the resulting IR in memory.
+    :param graph: Graph to serialize
+    :param data_type: data type of blobs
+    :param meta_info: meta information to add to the IR
+    :return: tuple of IR XML and weights as bytes
+    """
+    if meta_info is None:
+        meta_info = {}
+    prepare_graph_for_emit(graph, data_type)
+
+    with io.BytesIO() as bin_stream:
+        serialize_constants_to_stream(graph, bin_stream)
+        weights = bin_stream.getvalue()
+
+    return serialize_ie_ir(graph=graph, meta_info=meta_info), weights
+
+
+def prepare_graph_for_emit(graph: Graph, data_type: str):
     graph.strict_mode = False
 
     # convert Parameter data types
@@ -207,24 +250,6 @@ def prepare_emit_ir(graph: Graph, data_type: str, output_dir: str, output_model_
 
     tensor_names.propagate_op_name_to_tensor(graph)
 
-    ir_path_suffix = "_tmp" if use_temporary_path else ""
-
-    bin_file = os.path.join(output_dir, '{}{}.bin'.format(output_model_name, ir_path_suffix))
-    serialize_constants(graph, bin_file)
-
-    mean_offset = None
-    mean_size = None
-    if mean_data:
-        mean_offset, mean_size = serialize_mean_image(bin_file, mean_data=mean_data)
-
-    generate_ie_ir(graph=graph,
-                   file_name=os.path.join(output_dir, '{}{}.xml'.format(output_model_name, ir_path_suffix)),
-                   input_names=input_names,
-                   mean_offset=mean_offset,
-                   mean_size=mean_size,
-                   meta_info=meta_info)
-    tensor_names.output_tensor_names_map(graph, os.path.join(output_dir, '{}{}.mapping'.format(output_model_name, ir_path_suffix)))
-
 
 def get_ir_version(argv: argparse.Namespace):
     """
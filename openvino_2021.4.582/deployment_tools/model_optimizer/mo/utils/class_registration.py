@@ -12,6 +12,7 @@ from mo.middle.passes.eliminate import shape_inference
 from mo.middle.pattern_match import for_graph_and_each_sub_graph_recursively
 from mo.utils.error import Error, InternalError, FrameworkError
 from mo.utils.logger import progress_bar
+from mo.utils.transforms_profiler import TransformsProfiler, profile_stage, profile_transform
 from mo.utils.utils import refer_to_faq_msg
 
 _registered_classes_dict = {}
@@ -250,10 +251,39 @@ def get_replacers_order(transform_types: list):
     return replacers_order
 
 
+def clean_up_graph(graph: Graph, skip_unchanged: bool = False):
+    """
+    Cleans up the graph. If skip_unchanged is set, the graph which has not been modified since the previous clean up
+    is not cleaned up again
+    """
+    if skip_unchanged and graph.clean_up_epoch == graph.mutation_epoch:
+        return
+    graph.clean_up()
+    graph.clean_up_epoch = graph.mutation_epoch
+
+
+def validate_graph(graph: Graph, replacer_cls, skip_unchanged: bool = False):
+    """
+    Checks the graph after transformation execution. If skip_unchanged is set, the graph which has not been modified
+    since the previous check is not checked again
+    """
+    if skip_unchanged and graph.validation_epoch == graph.mutation_epoch:
+        return
+    graph.check_empty_graph(replacer_cls)
+    with profile_stage(graph, 'check_shapes_consistency'):
+        graph.check_shapes_consistency()
+    graph.validation_epoch = graph.mutation_epoch
+
+
 @progress_bar
-def apply_transform(graph: Graph, replacer_cls, **kwargs):
+def apply_transform(graph: Graph, replacer_cls, validate: bool = True, skip_unchanged: bool = False, **kwargs):
     """
     Safely executes transform if it should be and validates graph after transform execution
+    :param graph: graph to transform
+    :param replacer_cls: transformation class
+    :param validate: whether to check the graph after transformation execution
+    :param skip_unchanged: whether to skip clean up and check of the graph which has not been modified through
+    Graph and Node API since the previous clean up or check
     """
     replacer = replacer_cls()
     replacement_id = 'REPLACEMENT_ID'
@@ -272,23 +302,24 @@ def apply_transform(graph: Graph, replacer_cls, **kwargs):
     log.debug("Run replacer {}".format(replacer_cls))
 
     try:
-        if hasattr(replacer, 'run_not_recursively') and replacer.run_not_recursively:
-            replacer.find_and_replace_pattern(graph)
-        else:
-            for_graph_and_each_sub_graph_recursively(graph, replacer.find_and_replace_pattern)
+        with profile_transform(graph, replacer_cls):
+            with profile_stage(graph, 'find_and_replace_pattern'):
+                if hasattr(replacer, 'run_not_recursively') and replacer.run_not_recursively:
+                    replacer.find_and_replace_pattern(graph)
+                else:
+                    for_graph_and_each_sub_graph_recursively(graph, replacer.find_and_replace_pattern)
 
-        if hasattr(replacer, 'force_clean_up') and replacer.force_clean_up:
-            for_graph_and_each_sub_graph_recursively(graph, lambda G: G.clean_up())
+            if hasattr(replacer, 'force_clean_up') and replacer.force_clean_up:
+                with profile_stage(graph, 'clean_up'):
+                    for_graph_and_each_sub_graph_recursively(graph, lambda G: clean_up_graph(G, skip_unchanged))
 
-        if hasattr(replacer, 'force_shape_inference') and replacer.force_shape_inference:
-            shape_inference(graph)
+            if hasattr(replacer, 'force_shape_inference') and replacer.force_shape_inference:
+                with profile_stage(graph, 'shape_inference'):
+                    shape_inference(graph)
 
-        if hasattr(replacer, 'run_not_recursively') and replacer.run_not_recursively:
-            graph.check_empty_graph(replacer_cls)
-            graph.check_shapes_consistency()
-        else:
-            for_graph_and_each_sub_graph_recursively(graph, lambda _: graph.check_empty_graph(replacer_cls))
-            for_graph_and_each_sub_graph_recursively(graph, lambda _: graph.check_shapes_consistency())
+            if validate:
+                # checks are applied to the main graph only, sub-graphs are not checked
+                validate_graph(graph, replacer_cls, skip_unchanged)
 
     except Error as err:
         raise Error('Exception occurred during running replacer "{}" ({}): {}'.format(
@@ -310,13 +341,48 @@ def apply_replacements_list(graph: Graph, replacers_order: list):
     """
     Apply all transformations from replacers_order
     """
+    cmd_params = graph.graph.get('cmd_params', None)
+    profile = getattr(cmd_params, 'profile_transforms', False)
+    if profile:
+        graph.graph['transforms_profiler'] = TransformsProfiler()
+
+    validate_at_stage_boundaries = getattr(cmd_params, 'graph_validation', 'transform') == 'stage'
+    # attributes set directly through graph.node dicts do not modify the graph epoch, so skipping is opt-in
+    skip_unchanged = getattr(cmd_params, 'skip_unchanged_graph_checks', False)
+
     for i, replacer_cls in enumerate(replacers_order):
+        validate = True
+        if validate_at_stage_boundaries:
+            # validate the graph after the last transformation of each type (front, middle, back)
+            validate = i == len(replacers_order) - 1 or \
+                       get_class_type(replacer_cls) != get_class_type(replacers_order[i + 1])
         apply_transform(
             graph=graph,
             replacer_cls=replacer_cls,
+            validate=validate,
+            skip_unchanged=skip_unchanged,
             curr_transform_num=i,
             num_transforms=len(replacers_order))
 
+    if profile:
+        report_transforms_profile(graph.graph.pop('transforms_profiler'), cmd_params)
+
+
+def get_class_type(replacer_cls):
+    return replacer_cls.class_type() if hasattr(replacer_cls, 'class_type') else None
+
+
+def report_transforms_profile(profiler: TransformsProfiler, cmd_params):
+    """
+    Prints timings of transformations and saves them in Chrome trace format next to the generated IR
+    """
+    print('[ INFO ] Transformations profile:\n{}'.format(profiler.report()))
+    output_dir = getattr(cmd_params, 'output_dir', '.')
+    model_name = getattr(cmd_params, 'model_name', None) or 'model'
+    trace_path = os.path.join(output_dir, '{}_transforms_trace.json'.format(model_name))
+    profiler.dump_trace(trace_path)
+    print('[ INFO ] Transformations trace is saved to {}'.format(trace_path))
+
 
 def apply_replacements(graph: Graph, replacements_type: list):
     """
@@ -330,6 +330,22 @@ def get_common_cli_parser(parser: argparse.ArgumentParser = None):
     common_group.add_argument('--stream_output',
                               help='Switch model conversion progress display to a multiline mode.',
                               action='store_true', default=False)
+    common_group.add_argument('--graph_validation',
+                              help='Defines when the graph is checked for consistency: after every transformation '
+                                   '(\'transform\') or after the last transformation of each stage (front, middle, '
+                                   'back) only (\'stage\').',
+                              choices=['transform', 'stage'], default='transform')
+    common_group.add_argument('--skip_unchanged_graph_checks',
+                              help='Skip clean up and consistency check of the graph if it was not changed by the '
+                                   'transformation. Changes of node attributes made directly through graph.node '
+                                   'are not tracked, so use it only with transformations which modify the graph '
+                                   'through Graph and Node API.',
+                              action='store_true', default=False)
+    common_group.add_argument('--profile_transforms',
+                              help='Measure time, graph size change and peak memory usage of every transformation. '
+                                   'Prints a report sorted by time and saves a trace in Chrome trace format to '
+                                   'the output directory.',
+                              action='store_true', default=False)
     common_group.add_argument('--transformations_config',
                           help='Use the configuration file with transformations description.',
                           action=CanonicalizePathCheckExistenceAction)
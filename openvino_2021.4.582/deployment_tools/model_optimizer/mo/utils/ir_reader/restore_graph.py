@@ -12,7 +12,7 @@ from extensions.back.kaldi_remove_memory_output import KaldiRemoveMemoryOutputBa
 from mo.graph.graph import Graph
 from mo.middle.passes.convert_data_type import data_type_str_to_precision
 from mo.middle.pattern_match import for_graph_and_each_sub_graph_recursively
-from mo.pipeline.common import prepare_emit_ir
+from mo.pipeline.common import prepare_emit_ir, emit_ir_to_memory
 from mo.utils.class_registration import apply_replacements_list
 from mo.utils.ir_engine.ir_engine import IREngine
 from mo.utils.ir_reader.layer_to_class import copy_graph_with_ops, collect_extenders, collect_ops
@@ -54,6 +54,27 @@ def save_restored_graph(graph: Graph, path: str, meta_data, name=None):
     if name is None:
         name = graph.name
 
+    precision = apply_back_transformations(graph)
+    prepare_emit_ir(graph, precision, path, name, meta_info=meta_data)
+
+
+def serialize_restored_graph(graph: Graph, meta_data):
+    """
+    Function to apply all necessary transforms from back stage to restored graph and serialize it to memory.
+    :param graph: Graph to serialize
+    :param meta_data: Namespace with converting parameters restored from IR
+    :return: tuple of IR XML and weights as bytes
+    """
+    precision = apply_back_transformations(graph)
+    return emit_ir_to_memory(graph, precision, meta_info=meta_data)
+
+
+def apply_back_transformations(graph: Graph):
+    """
+    Function to apply transforms from back stage which are needed to emit restored graph.
+    :param graph: Graph to transform
+    :return: precision of the restored graph
+    """
     precision = data_type_str_to_precision(graph.graph['cmd_params'].data_type)
     assert precision in ['FP16', 'FP32'], 'Cannot define precision for restored model!'
 
@@ -75,4 +96,4 @@ def save_restored_graph(graph: Graph, path: str, meta_data, name=None):
     for_graph_and_each_sub_graph_recursively(graph, RemoveConstOps().find_and_replace_pattern)
     for_graph_and_each_sub_graph_recursively(graph, CreateConstNodesReplacement().find_and_replace_pattern)
 
-    prepare_emit_ir(graph, precision, path, name, meta_info=meta_data)
+    return precision
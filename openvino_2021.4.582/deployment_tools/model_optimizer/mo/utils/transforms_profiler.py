@@ -0,0 +1,147 @@
+# Copyright (C) 2018-2021 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from mo.graph.graph import Graph
+from mo.middle.pattern_match import for_graph_and_each_sub_graph_recursively
+
+PROFILED_STAGES = ['find_and_replace_pattern', 'clean_up', 'shape_inference', 'check_shapes_consistency']
+
+
+def get_peak_memory_usage():
+    """
+    Returns peak resident set size of the process in MB or None if it can not be measured on the platform
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    mem_usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    if sys.platform == 'darwin':
+        mem_usage = mem_usage / 1024
+    return mem_usage
+
+
+def get_graph_size(graph: Graph):
+    """
+    Returns total number of nodes and edges in the graph and all its sub-graphs
+    """
+    size = [0, 0]
+
+    def count(sub_graph: Graph):
+        size[0] += sub_graph.number_of_nodes()
+        size[1] += sub_graph.number_of_edges()
+
+    for_graph_and_each_sub_graph_recursively(graph, count)
+    return size[0], size[1]
+
+
+class TransformsProfiler:
+    """
+    Collects wall time, graph size change and peak memory usage for every applied transformation together with time
+    spent in its stages (pattern replacement, clean up, shape inference and shapes consistency check).
+    """
+
+    def __init__(self):
+        self.records = []
+        self.trace_events = []
+        self._start_time = time.perf_counter()
+        self._current_record = None
+
+    def _get_timestamp(self):
+        # Chrome trace format expects time in microseconds
+        return (time.perf_counter() - self._start_time) * 1e6
+
+    def _add_trace_event(self, name: str, category: str, start: float, duration: float, args: dict = None):
+        self.trace_events.append({'name': name, 'cat': category, 'ph': 'X', 'ts': start, 'dur': duration,
+                                  'pid': os.getpid(), 'tid': 0, 'args': args if args is not None else {}})
+
+    @contextmanager
+    def transform(self, graph: Graph, replacer_cls):
+        name = '{}.{}'.format(replacer_cls.__module__, replacer_cls.__name__)
+        nodes_before, edges_before = get_graph_size(graph)
+        record = {'name': name, 'stages': {}}
+        self._current_record = record
+        start = self._get_timestamp()
+        try:
+            yield
+        finally:
+            duration = self._get_timestamp() - start
+            self._current_record = None
+            nodes_after, edges_after = get_graph_size(graph)
+            record.update({'time': duration,
+                           'nodes_delta': nodes_after - nodes_before,
+                           'edges_delta': edges_after - edges_before,
+                           'peak_memory': get_peak_memory_usage()})
+            self.records.append(record)
+            self._add_trace_event(name, 'transform', start, duration,
+                                  {'nodes': nodes_after, 'edges': edges_after,
+                                   'nodes_delta': record['nodes_delta'], 'edges_delta': record['edges_delta'],
+                                   'peak_memory_mb': record['peak_memory']})
+
+    @contextmanager
+    def stage(self, name: str):
+        start = self._get_timestamp()
+        try:
+            yield
+        finally:
+            duration = self._get_timestamp() - start
+            if self._current_record is not None:
+                stages = self._current_record['stages']
+                stages[name] = stages.get(name, 0) + duration
+            self._add_trace_event(name, 'stage', start, duration)
+
+    def report(self):
+        """
+        Returns table of profiled transformations sorted by wall time
+        """
+        total_time = sum(record['time'] for record in self.records)
+        header = ['time, ms', '%'] + ['{}, ms'.format(stage) for stage in PROFILED_STAGES] + \
+                 ['nodes', 'edges', 'peak RSS, MB', 'transformation']
+        rows = []
+        for record in sorted(self.records, key=lambda r: r['time'], reverse=True):
+            row = ['{:.1f}'.format(record['time'] / 1e3),
+                   '{:.1f}'.format(record['time'] / total_time * 100 if total_time else 0)]
+            row += ['{:.1f}'.format(record['stages'].get(stage, 0) / 1e3) for stage in PROFILED_STAGES]
+            row += ['{:+d}'.format(record['nodes_delta']), '{:+d}'.format(record['edges_delta']),
+                    '{:.0f}'.format(record['peak_memory']) if record['peak_memory'] is not None else '-',
+                    record['name']]
+            rows.append(row)
+        # all columns except the transformation name are right-aligned
+        widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header) - 1)]
+        lines = ['  '.join([cell.rjust(width) for cell, width in zip(row, widths)] + [row[-1]])
+                 for row in [header] + rows]
+        lines.append('Total: {:.2f} seconds in {} transformations'.format(total_time / 1e6, len(self.records)))
+        return '\n'.join(lines)
+
+    def dump_trace(self, path: str):
+        """
+        Saves collected events in Chrome trace format (can be opened with chrome://tracing or Perfetto)
+        """
+        with open(path, 'w') as trace_file:
+            json.dump({'traceEvents': self.trace_events, 'displayTimeUnit': 'ms'}, trace_file)
+
+
+@contextmanager
+def profile_transform(graph: Graph, replacer_cls):
+    profiler = graph.graph.get('transforms_profiler', None)
+    if profiler is None:
+        yield
+    else:
+        with profiler.transform(graph, replacer_cls):
+            yield
+
+
+@contextmanager
+def profile_stage(graph: Graph, name: str):
+    profiler = graph.graph.get('transforms_profiler', None)
+    if profiler is None:
+        yield
+    else:
+        with profiler.stage(name):
+            yield
@@ -22,7 +22,7 @@ import numpy as np
 from ..adapters import Adapter
 from ..config import BoolField, NumberField, StringField, ConfigValidator, ListField, ConfigError
 from ..representation import DetectionPrediction
-from ..utils import get_or_parse_value
+from ..utils import get_or_parse_value, softmax
 
 DetectionBox = namedtuple('DetectionBox', ["x", "y", "w", "h", "confidence", "probabilities"])
 
@@ -38,6 +38,8 @@ class YoloOutputProcessor:
         self.width_normalizer, self.height_normalizer = size_normalizer
 
     def __call__(self, bbox, i, j, anchors=None):
+        # all corrections are element-wise (probabilities are corrected along the last axis), so bbox fields,
+        # cell indices and anchors can be either scalars or arrays of boxes
         if anchors is None:
             anchors = [1, 1]
         x = (self.coord_correct(bbox.x) + i) / self.x_normalizer
@@ -90,27 +92,22 @@ class TinyYOLOv1Adapter(Adapter):
             scale = np.reshape(scale, (CELLS_Y, CELLS_X, OBJECTS_PER_CELL))
             boxes = np.reshape(boxes, (CELLS_Y, CELLS_X, OBJECTS_PER_CELL, 4))
 
-            confidence = np.zeros((CELLS_Y, CELLS_X, OBJECTS_PER_CELL, CLASSES + 4))
-            for cls in range(CLASSES):
-                confidence[:, :, 0, cls] = np.multiply(probability[:, :, cls], scale[:, :, 0])
-                confidence[:, :, 1, cls] = np.multiply(probability[:, :, cls], scale[:, :, 1])
+            # boxes are enumerated in (x, y, object) order
+            confidence = (probability[:, :, np.newaxis, :] * scale[:, :, :, np.newaxis]).transpose(1, 0, 2, 3)
+            confidence = confidence.reshape(-1, CLASSES)
+            boxes = boxes.transpose(1, 0, 2, 3).reshape(-1, 4)
+            i, j, _ = np.indices((CELLS_X, CELLS_Y, OBJECTS_PER_CELL)).reshape(3, -1)
 
-            labels, scores, x_mins, y_mins, x_maxs, y_maxs = [], [], [], [], [], []
-            for i, j, k in np.ndindex((CELLS_X, CELLS_Y, OBJECTS_PER_CELL)):
-                box = boxes[j, i, k]
-                box = [(box[0] + i) / float(CELLS_X), (box[1] + j) / float(CELLS_Y), box[2] ** 2, box[3] ** 2]
+            centers_x = (boxes[:, 0] + i) / float(CELLS_X)
+            centers_y = (boxes[:, 1] + j) / float(CELLS_Y)
+            widths, heights = boxes[:, 2] ** 2, boxes[:, 3] ** 2
+            labels = np.argmax(confidence, axis=1)
+            scores = confidence[np.arange(labels.size), labels]
 
-                label = np.argmax(confidence[j, i, k, :CLASSES])
-                score = confidence[j, i, k, label]
-
-                labels.append(label)
-                scores.append(score)
-                x_mins.append(box[0] - box[2] / 2.0)
-                y_mins.append(box[1] - box[3] / 2.0)
-                x_maxs.append(box[0] + box[2] / 2.0)
-                y_maxs.append(box[1] + box[3] / 2.0)
-
-            result.append(DetectionPrediction(identifier, labels, scores, x_mins, y_mins, x_maxs, y_maxs))
+            result.append(DetectionPrediction(
+                identifier, labels, scores, centers_x - widths / 2.0, centers_y - heights / 2.0,
+                centers_x + widths / 2.0, centers_y + heights / 2.0
+            ))
 
         return result
 
@@ -122,33 +119,32 @@ def entry_index(w, h, n_coords, n_classes, pos, entry):
 
 
 def parse_output(predictions, cells, num, box_size, anchors, processor, threshold=0.001):
-    cells_x, cells_y = cells, cells
-
-    labels, scores, x_mins, y_mins, x_maxs, y_maxs = [], [], [], [], [], []
-
-    for x, y, n in np.ndindex((cells_x, cells_y, num)):
-        if predictions.shape[0] == predictions.shape[1]:
-            bbox = predictions[y, x, n*box_size:(n + 1)*box_size]
-        else:
-            bbox = predictions[n * box_size:(n + 1) * box_size, y, x]
-
-        raw_bbox = DetectionBox(bbox[0], bbox[1], bbox[2], bbox[3], bbox[4], bbox[5:])
-        processed_box = processor(raw_bbox, x, y, anchors[2*n:2*n+2])
-
-        if processed_box.confidence < threshold:
-            continue
-
-        classes_prob = processed_box.probabilities
-        label = np.argmax(classes_prob)
-
-        labels.append(label)
-        scores.append(processed_box.probabilities[label] * processed_box.confidence)
-        x_mins.append(processed_box.x - processed_box.w / 2.0)
-        y_mins.append(processed_box.y - processed_box.h / 2.0)
-        x_maxs.append(processed_box.x + processed_box.w / 2.0)
-        y_maxs.append(processed_box.y + processed_box.h / 2.0)
-
-    return labels, scores, x_mins, y_mins, x_maxs, y_maxs
+    if predictions.shape[0] == predictions.shape[1]:
+        boxes = predictions[:cells, :cells, :num * box_size].reshape(cells, cells, num, box_size)
+        boxes = boxes.transpose(1, 0, 2, 3)
+    else:
+        boxes = predictions[:num * box_size, :cells, :cells].reshape(num, box_size, cells, cells)
+        boxes = boxes.transpose(3, 2, 0, 1)
+    # boxes are enumerated in (x, y, anchor) order
+    boxes = boxes.reshape(-1, box_size)
+    x, y, n = np.indices((cells, cells, num)).reshape(3, -1)
+
+    confidence = processor.conf_correct(boxes[:, 4])
+    valid = confidence >= threshold
+    boxes, x, y, n = boxes[valid], x[valid], y[valid], n[valid]
+    anchors = np.reshape(anchors[:2 * num], (num, 2))[n]
+
+    raw_bbox = DetectionBox(boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3], boxes[:, 4], boxes[:, 5:])
+    processed_box = processor(raw_bbox, x, y, (anchors[:, 0], anchors[:, 1]))
+
+    labels = np.argmax(processed_box.probabilities, axis=1)
+    scores = processed_box.probabilities[np.arange(labels.size), labels] * processed_box.confidence
+
+    return (
+        labels, scores,
+        processed_box.x - processed_box.w / 2.0, processed_box.y - processed_box.h / 2.0,
+        processed_box.x + processed_box.w / 2.0, processed_box.y + processed_box.h / 2.0
+    )
 
 
 class YoloV2Adapter(Adapter):
@@ -215,7 +211,7 @@ class YoloV2Adapter(Adapter):
         if self.raw_output:
             self.processor = YoloOutputProcessor(coord_correct=lambda x: 1. / (1 + np.exp(-x)),
                                                  conf_correct=lambda x: 1. / (1 + np.exp(-x)),
-                                                 prob_correct=lambda x: np.exp(x) / np.sum(np.exp(x)),
+                                                 prob_correct=lambda x: softmax(x, axis=-1),
                                                  coord_normalizer=(self.cells, self.cells),
                                                  size_normalizer=(self.cells, self.cells))
         else:
@@ -408,7 +404,7 @@ class YoloV3Adapter(Adapter):
 
         box_size = self.coords + 1 + self.classes
         for identifier, prediction, meta in zip(identifiers, predictions, frame_meta):
-            detections = {'labels': [], 'scores': [], 'x_mins': [], 'y_mins': [], 'x_maxs': [], 'y_maxs': []}
+            detections = []
             input_shape = list(meta.get('input_shape', {'data': (1, 3, 416, 416)}).values())[0]
             nchw_layout = input_shape[1] == 3
             self.processor.width_normalizer = input_shape[3 if nchw_layout else 2]
@@ -439,20 +435,10 @@ class YoloV3Adapter(Adapter):
                 self.processor.x_normalizer = cells
                 self.processor.y_normalizer = cells
 
-                labels, scores, x_mins, y_mins, x_maxs, y_maxs = parse_output(p, cells, num,
-                                                                              box_size, anchors,
-                                                                              self.processor, self.threshold)
-                detections['labels'].extend(labels)
-                detections['scores'].extend(scores)
-                detections['x_mins'].extend(x_mins)
-                detections['y_mins'].extend(y_mins)
-                detections['x_maxs'].extend(x_maxs)
-                detections['y_maxs'].extend(y_maxs)
+                detections.append(parse_output(p, cells, num, box_size, anchors, self.processor, self.threshold))
 
-            result.append(DetectionPrediction(
-                identifier, detections['labels'], detections['scores'], detections['x_mins'], detections['y_mins'],
-                detections['x_maxs'], detections['y_maxs']
-            ))
+            labels, scores, x_mins, y_mins, x_maxs, y_maxs = map(np.concatenate, zip(*detections))
+            result.append(DetectionPrediction(identifier, labels, scores, x_mins, y_mins, x_maxs, y_maxs))
 
         return result
 
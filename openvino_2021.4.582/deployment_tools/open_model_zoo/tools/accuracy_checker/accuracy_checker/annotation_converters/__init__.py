@@ -16,6 +16,7 @@ limitations under the License.
 
 from .format_converter import BaseFormatConverter
 from .convert import make_subset, save_annotation, analyze_dataset, DatasetConversionInfo
+from .indexed_annotation import IndexedAnnotation, IndexedAnnotationWriter
 from .market1501 import Market1501Converter
 from .veri776 import VeRi776Converter
 from .mars import MARSConverter
@@ -114,6 +115,8 @@ from .calgarycampinas import KSpaceMRIConverter
 __all__ = [
     'BaseFormatConverter',
     'DatasetConversionInfo',
+    'IndexedAnnotation',
+    'IndexedAnnotationWriter',
     'make_subset',
     'save_annotation',
     'analyze_dataset',
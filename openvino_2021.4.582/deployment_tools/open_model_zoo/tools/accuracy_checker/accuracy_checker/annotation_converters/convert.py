@@ -20,7 +20,6 @@ import platform
 import copy
 import json
 from pathlib import Path
-import pickle
 from argparse import ArgumentParser
 from collections import namedtuple
 from functools import partial
@@ -37,6 +36,7 @@ from ..utils import (
 )
 from ..data_analyzer import BaseDataAnalyzer
 from .format_converter import BaseFormatConverter
+from .indexed_annotation import IndexedAnnotationWriter
 
 DatasetConversionInfo = namedtuple('DatasetConversionInfo',
                                    [
@@ -96,8 +96,13 @@ def make_subset(annotation, size, seed=666, shuffle=True):
     if isinstance(annotation[-1].identifier, (KaldiMatrixIdentifier, KaldiFrameIdentifier)):
         return make_subset_kaldi(annotation, size, shuffle)
 
-    result_annotation = list(np.random.choice(annotation, size=size, replace=False)) if shuffle else annotation[:size]
-    return result_annotation
+    if not shuffle:
+        return annotation[:size]
+    # selection by indices gives the same subset as choice over annotation itself, but touches only selected items
+    subset_indices = np.random.choice(dataset_size, size=size, replace=False)
+    if hasattr(annotation, 'subset'):
+        return annotation.subset(subset_indices)
+    return [annotation[idx] for idx in subset_indices]
 
 
 def make_subset_pairwise(annotation, size, shuffle=True):
@@ -285,11 +290,9 @@ def save_annotation(annotation, meta, annotation_file, meta_file, dataset_config
         annotation_dir = annotation_file.parent
         if not annotation_dir.exists():
             annotation_dir.mkdir(parents=True)
-        with annotation_file.open('wb') as file:
-            if conversion_meta:
-                pickle.dump(conversion_meta, file)
+        with IndexedAnnotationWriter(annotation_file, conversion_meta) as writer:
             for representation in annotation:
-                representation.dump(file)
+                writer.append(representation)
 
     if meta_file and meta:
         meta_dir = meta_file.parent
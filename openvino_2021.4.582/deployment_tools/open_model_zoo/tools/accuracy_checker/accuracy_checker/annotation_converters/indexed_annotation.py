@@ -0,0 +1,153 @@
+"""
+Copyright (c) 2018-2021 Intel Corporation
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pickle
+import warnings
+from collections.abc import Sequence
+from pathlib import Path
+from threading import Lock
+
+from ..representation import BaseRepresentation
+
+INDEX_VERSION = 1
+
+
+def get_index_file(annotation_file):
+    annotation_file = Path(annotation_file)
+    return annotation_file.parent / '{}.index'.format(annotation_file.name)
+
+
+class IndexedAnnotationWriter:
+    """
+    Writes annotation representations one by one to the pickle stream compatible with regular annotation file
+    and stores identifier->offset index in additional <annotation_file>.index file on close.
+    """
+
+    def __init__(self, annotation_file, conversion_meta=None):
+        self.annotation_file = Path(annotation_file)
+        self.index_file = get_index_file(self.annotation_file)
+        self._offsets = []
+        self._identifiers = []
+        self._file = self.annotation_file.open('wb')
+        if conversion_meta:
+            pickle.dump(conversion_meta, self._file)
+
+    def append(self, representation):
+        self._offsets.append(self._file.tell())
+        self._identifiers.append(representation.identifier)
+        representation.dump(self._file)
+
+    def close(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        index = {
+            'version': INDEX_VERSION,
+            'file_size': self.annotation_file.stat().st_size,
+            'offsets': self._offsets,
+            'identifiers': self._identifiers
+        }
+        with self.index_file.open('wb') as index_file:
+            pickle.dump(index, index_file)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class IndexedAnnotation(Sequence):
+    """
+    Lazy annotation sequence, which deserializes representations only on access.
+    Loaded representations are cached, so repeated access returns the same object like regular list does.
+    """
+
+    def __init__(self, annotation_file, offsets, identifiers, positions=None, storage=None):
+        self.annotation_file = Path(annotation_file)
+        self._offsets = offsets
+        self._identifiers = identifiers
+        self._positions = positions if positions is not None else range(len(offsets))
+        self._storage = storage if storage is not None else _AnnotationStorage(self.annotation_file)
+
+    @classmethod
+    def open(cls, annotation_file):
+        index = read_annotation_index(annotation_file)
+        if index is None:
+            return None
+        return cls(annotation_file, index['offsets'], index['identifiers'])
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.subset(self._positions[item], relative=False)
+        position = self._positions[item]
+        return self._storage.load(position, self._offsets[position])
+
+    @property
+    def identifiers(self):
+        return [self._identifiers[position] for position in self._positions]
+
+    def subset(self, indices, relative=True):
+        positions = [self._positions[idx] for idx in indices] if relative else indices
+        return IndexedAnnotation(self.annotation_file, self._offsets, self._identifiers, positions, self._storage)
+
+    @property
+    def loaded_size(self):
+        return len(self._storage.cache)
+
+
+class _AnnotationStorage:
+    def __init__(self, annotation_file):
+        self.annotation_file = annotation_file
+        self.cache = {}
+        self._file = None
+        self._lock = Lock()
+
+    def load(self, position, offset):
+        with self._lock:
+            if position not in self.cache:
+                if self._file is None:
+                    self._file = self.annotation_file.open('rb')
+                self._file.seek(offset)
+                self.cache[position] = BaseRepresentation.load(self._file)
+            return self.cache[position]
+
+    def __getstate__(self):
+        return {'annotation_file': self.annotation_file, 'cache': self.cache}
+
+    def __setstate__(self, state):
+        self.__init__(state['annotation_file'])
+        self.cache = state['cache']
+
+    def __del__(self):
+        if self._file is not None:
+            self._file.close()
+
+
+def read_annotation_index(annotation_file):
+    index_file = get_index_file(annotation_file)
+    if not index_file.exists():
+        return None
+    with index_file.open('rb') as content:
+        index = pickle.load(content)
+    if index.get('version') != INDEX_VERSION or index.get('file_size') != Path(annotation_file).stat().st_size:
+        warnings.warn('Annotation index {} is outdated and will be ignored'.format(index_file))
+        return None
+    return index
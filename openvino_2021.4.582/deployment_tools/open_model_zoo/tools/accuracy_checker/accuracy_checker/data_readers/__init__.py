@@ -53,7 +53,8 @@ from .data_reader import (
     create_identifier_key,
 
     create_reader,
-    REQUIRES_ANNOTATIONS
+    REQUIRES_ANNOTATIONS,
+    REQUIRES_SEQUENTIAL_READING
 )
 
 __all__ = [
@@ -93,6 +94,7 @@ __all__ = [
 
     'create_reader',
     'REQUIRES_ANNOTATIONS',
+    'REQUIRES_SEQUENTIAL_READING',
 
     'serialize_identifier',
     'deserialize_identifier',
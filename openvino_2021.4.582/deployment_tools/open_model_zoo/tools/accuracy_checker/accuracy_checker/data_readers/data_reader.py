@@ -61,6 +61,7 @@ except ImportError as import_error:
 
 REQUIRES_ANNOTATIONS = ['annotation_features_extractor', ]
 DOES_NOT_REQUIRED_DATA_SOURCE = REQUIRES_ANNOTATIONS + ['ncf_reader']
+REQUIRES_SEQUENTIAL_READING = ['opencv_capture']
 DATA_SOURCE_IS_FILE = ['opencv_capture']
 
 
@@ -228,6 +229,13 @@ class BaseReader(ClassProvider):
             'multi_infer': BoolField(
                 default=False, optional=True, description='Allows multi infer.'
             ),
+            'prefetch': NumberField(
+                value_type=int, min_value=0, default=0, optional=True,
+                description='Number of batches which should be read in advance.'
+            ),
+            'workers': NumberField(
+                value_type=int, min_value=1, optional=True, description='Number of threads for data prefetching.'
+            ),
         }
 
     def get_value_from_config(self, key):
@@ -15,15 +15,17 @@ limitations under the License.
 """
 
 from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from collections import OrderedDict
+from collections.abc import Mapping
 import warnings
 import pickle
 import numpy as np
 import yaml
 
 from .annotation_converters import (
-    BaseFormatConverter, DatasetConversionInfo, save_annotation, make_subset, analyze_dataset
+    BaseFormatConverter, DatasetConversionInfo, IndexedAnnotation, save_annotation, make_subset, analyze_dataset
 )
 from .metrics import  Metric
 from .preprocessor import Preprocessor
@@ -50,7 +52,7 @@ from .representation import (
     BaseRepresentation, ReIdentificationClassificationAnnotation, ReIdentificationAnnotation, PlaceRecognitionAnnotation
 )
 from .data_readers import (
-    DataReaderField, REQUIRES_ANNOTATIONS, BaseReader,
+    DataReaderField, REQUIRES_ANNOTATIONS, REQUIRES_SEQUENTIAL_READING, BaseReader,
     serialize_identifier, deserialize_identifier, create_identifier_key
 )
 from .logging import print_info
@@ -279,6 +281,9 @@ class Dataset:
     def provide_data_info(self, annotations, progress_reporter=None):
         return self.data_provider.provide_data_info(annotations, progress_reporter)
 
+    def annotation_batches(self):
+        return self.data_provider.annotation_batches()
+
     @classmethod
     def validate_config(cls, config, fetch_only=False, uri_prefix=''):
         dataset_config = ConfigValidator(
@@ -351,6 +356,10 @@ class Dataset:
 
 def read_annotation(annotation_file: Path):
     annotation_file = get_path(annotation_file)
+    indexed_annotation = IndexedAnnotation.open(annotation_file)
+    if indexed_annotation is not None:
+        read_conversion_info(annotation_file)
+        return indexed_annotation
 
     result = []
     with annotation_file.open('rb') as file:
@@ -371,6 +380,16 @@ def read_annotation(annotation_file: Path):
     return result
 
 
+def read_conversion_info(annotation_file):
+    with annotation_file.open('rb') as file:
+        try:
+            first_obj = pickle.load(file)
+        except EOFError:
+            return
+    if isinstance(first_obj, DatasetConversionInfo):
+        describe_cached_dataset(first_obj)
+
+
 def create_subset(annotation, subsample_size, subsample_seed, shuffle=True):
     if isinstance(subsample_size, str):
         if subsample_size.endswith('%'):
@@ -410,8 +429,11 @@ class AnnotationProvider:
     def __init__(self, annotations, meta, name='', config=None):
         self.name = name
         self.config = config
-        self._data_buffer = OrderedDict()
         self._meta = meta
+        if isinstance(annotations, IndexedAnnotation):
+            self._data_buffer = IndexedAnnotationBuffer(annotations)
+            return
+        self._data_buffer = OrderedDict()
         for ann in annotations:
             idx = create_identifier_key(ann.identifier)
             self._data_buffer[idx] = ann
@@ -523,6 +545,23 @@ class AnnotationProvider:
         return self._meta.get('label_map', {})
 
 
+class IndexedAnnotationBuffer(Mapping):
+    def __init__(self, annotation):
+        self._annotation = annotation
+        self._positions = OrderedDict(
+            (create_identifier_key(identifier), position) for position, identifier in enumerate(annotation.identifiers)
+        )
+
+    def __getitem__(self, item):
+        return self._annotation[self._positions[item]]
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __len__(self):
+        return len(self._positions)
+
+
 class DataProvider:
     def __init__(
             self, data_reader, annotation_provider=None, tag='', dataset_config=None, data_list=None, subset=None,
@@ -532,8 +571,11 @@ class DataProvider:
         self.data_reader = data_reader
         self.annotation_provider = annotation_provider
         self.dataset_config = dataset_config or {}
+        self._prefetch_executor = None
+        self._prefetched_batches = {}
         self.batch = batch if batch is not None else dataset_config.get('batch')
         self.subset = subset
+        self.configure_prefetching()
         self.create_data_list(data_list)
         if self.store_subset:
             self.sava_subset()
@@ -541,6 +583,8 @@ class DataProvider:
     def create_data_list(self, data_list=None):
         if data_list is not None:
             self._data_list = data_list
+            # explicitly provided data list is not a dataset subset, it should not be stored to subset_file
+            self.store_subset = False
             return
         self.store_subset = self.dataset_config.get('store_subset', False)
 
@@ -576,11 +620,8 @@ class DataProvider:
         if self.size <= item * self.batch:
             raise IndexError
         batch_annotation = []
-        batch_start = item * self.batch
-        batch_end = min(self.size, batch_start + self.batch)
-        batch_input_ids = self.subset[batch_start:batch_end] if self.subset else range(batch_start, batch_end)
-        batch_identifiers = [self._data_list[idx] for idx in batch_input_ids]
-        batch_input = [self.data_reader(identifier=identifier) for identifier in batch_identifiers]
+        batch_input_ids, batch_identifiers = self._get_batch_identifiers(item)
+        batch_input = self._read_batch(item, batch_identifiers)
         if self.annotation_provider:
             batch_annotation = [self.annotation_provider[idx] for idx in batch_identifiers]
 
@@ -589,6 +630,75 @@ class DataProvider:
 
         return batch_input_ids, batch_annotation, batch_input, batch_identifiers
 
+    def annotation_batches(self):
+        """
+        Yields batch input ids, annotations and identifiers without reading of input data
+        """
+        if self.batch is None:
+            self.batch = 1
+        for item in range((self.size + self.batch - 1) // self.batch):
+            batch_input_ids, batch_identifiers = self._get_batch_identifiers(item)
+            yield batch_input_ids, [self.annotation_provider[idx] for idx in batch_identifiers], batch_identifiers
+
+    def _get_batch_identifiers(self, item):
+        batch_start = item * self.batch
+        batch_end = min(self.size, batch_start + self.batch)
+        batch_input_ids = self.subset[batch_start:batch_end] if self.subset else range(batch_start, batch_end)
+        batch_identifiers = [self._data_list[idx] for idx in batch_input_ids]
+        return batch_input_ids, batch_identifiers
+
+    def configure_prefetching(self):
+        reader_config = self.dataset_config.get('reader')
+        if not isinstance(reader_config, dict):
+            reader_config = {}
+        self.prefetch = reader_config.get('prefetch', 0)
+        self.prefetch_workers = reader_config.get('workers') or 1
+        if self.prefetch_workers > 1 and self._requires_sequential_reading(self.data_reader):
+            warnings.warn('{} reader depends on reading order, data will be prefetched by single worker'.format(
+                self.data_reader.name
+            ))
+            self.prefetch_workers = 1
+
+    @staticmethod
+    def _requires_sequential_reading(data_reader):
+        if data_reader.name in REQUIRES_SEQUENTIAL_READING:
+            return True
+        reading_scheme = getattr(data_reader, 'reading_scheme', {})
+        return any(reader.name in REQUIRES_SEQUENTIAL_READING for reader in reading_scheme.values())
+
+    def _read_batch(self, item, batch_identifiers):
+        if not self.prefetch:
+            return [self.data_reader(identifier=identifier) for identifier in batch_identifiers]
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=self.prefetch_workers)
+        batch_data = self._prefetched_batches.pop(item, None)
+        if batch_data is None:
+            batch_data = self._submit_batch_reading(batch_identifiers)
+        # batches which will not be requested in sequential order are dropped for keeping memory bounded
+        next_batches = range(item + 1, min(item + 1 + self.prefetch, (self.size + self.batch - 1) // self.batch))
+        for batch_id in list(self._prefetched_batches):
+            if batch_id not in next_batches:
+                for data in self._prefetched_batches.pop(batch_id):
+                    data.cancel()
+        for batch_id in next_batches:
+            if batch_id not in self._prefetched_batches:
+                _, next_identifiers = self._get_batch_identifiers(batch_id)
+                self._prefetched_batches[batch_id] = self._submit_batch_reading(next_identifiers)
+
+        return [data.result() for data in batch_data]
+
+    def _submit_batch_reading(self, batch_identifiers):
+        return [self._prefetch_executor.submit(self.data_reader, identifier) for identifier in batch_identifiers]
+
+    def reset_prefetching(self):
+        for batch_data in self._prefetched_batches.values():
+            for data in batch_data:
+                data.cancel()
+        self._prefetched_batches = {}
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=True)
+            self._prefetch_executor = None
+
     def __len__(self):
         if self.subset is None:
             return len(self._data_list)
@@ -599,6 +709,7 @@ class DataProvider:
         return self._data_list
 
     def make_subset(self, ids=None, start=0, step=1, end=None, accept_pairs=False):
+        self.reset_prefetching()
         if self.annotation_provider:
             ids = self.annotation_provider.make_subset(ids, start, step, end, accept_pairs)
         if ids:
@@ -617,6 +728,7 @@ class DataProvider:
     @batch.setter
     def batch(self, batch):
         self._batch = batch
+        self.reset_prefetching()
 
     @property
     def labels(self):
@@ -629,6 +741,7 @@ class DataProvider:
         return {}
 
     def reset(self, reload_annotation=False):
+        self.reset_prefetching()
         if self.subset:
             self.subset = None
         if self.annotation_provider and reload_annotation:
@@ -680,6 +793,7 @@ class DataProvider:
             meta = analyze_dataset(annotation, meta)
             if meta.get('segmentation_masks_source'):
                 del meta['segmentation_masks_source']
+        self.reset_prefetching()
         self.annotation_provider = AnnotationProvider(annotation, meta)
         self.create_data_list()
 
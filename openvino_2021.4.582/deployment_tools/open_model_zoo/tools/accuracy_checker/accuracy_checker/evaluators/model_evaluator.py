@@ -17,11 +17,13 @@ limitations under the License.
 import copy
 import pickle
 import platform
+from queue import Queue, Empty, Full
+from threading import Thread, Event
 
 from ..utils import get_path, extract_image_representations, is_path
 from ..dataset import Dataset
 from ..launcher import create_launcher, DummyLauncher, InputFeeder, Launcher
-from ..launcher.loaders import StoredPredictionBatch
+from ..launcher.loaders import StoredPredictionBatch, ColumnarPredictionsStorage
 from ..logging import print_info, warning
 from ..metrics import MetricsExecutor
 from ..postprocessor import PostprocessingExecutor
@@ -52,6 +54,7 @@ class ModelEvaluator(BaseEvaluator):
         self._annotations = []
         self._predictions = []
         self._metrics_results = []
+        self._predictions_storage = None
 
     @classmethod
     def from_configs(cls, model_config, delayed_annotation_loading=False):
@@ -256,6 +259,7 @@ class ModelEvaluator(BaseEvaluator):
 
         store_only = kwargs.get('store_only', False)
         prepare_dataset(store_only)
+        self._configure_predictions_storage(stored_predictions, store_only, kwargs)
 
         if (
                 self.launcher.allow_reshape_input or self.input_feeder.lstm_inputs or
@@ -327,23 +331,34 @@ class ModelEvaluator(BaseEvaluator):
             self.dataset.batch = self.launcher.batch
         if store_only and self._is_stored(stored_predictions):
             self._reset_stored_predictions(stored_predictions)
+        self._configure_predictions_storage(stored_predictions, store_only, kwargs)
         output_callback = kwargs.get('output_callback')
         metric_config = self._configure_metrics(kwargs, output_callback)
         enable_profiling, compute_intermediate_metric_res, metric_interval, ignore_results_formatting = metric_config
-        for batch_id, (batch_input_ids, batch_annotation, batch_input, batch_identifiers) in enumerate(self.dataset):
-            filled_inputs, batch_meta = self._get_batch_input(batch_annotation, batch_input)
-            batch_predictions = self.launcher.predict(filled_inputs, batch_meta, **kwargs)
-            if stored_predictions:
-                self.prepare_prediction_to_store(batch_predictions, batch_identifiers, batch_meta, stored_predictions)
-            if not store_only:
-                self._process_batch_results(
-                    batch_predictions, batch_annotation, batch_identifiers,
-                    batch_input_ids, batch_meta, enable_profiling, output_callback)
+        pipelined = kwargs.get('pipelined', False)
+        if pipelined and self.input_feeder.lstm_inputs:
+            warning('Model with recurrent inputs can not be processed in pipelined mode. Switched to sync.')
+            pipelined = False
+        if pipelined:
+            self._process_dataset_pipelined(stored_predictions, progress_reporter, metric_config, **kwargs)
+        else:
+            for batch_id, batch in enumerate(self.dataset):
+                batch_input_ids, batch_annotation, batch_input, batch_identifiers = batch
+                filled_inputs, batch_meta = self._get_batch_input(batch_annotation, batch_input)
+                batch_predictions = self.launcher.predict(filled_inputs, batch_meta, **kwargs)
+                if stored_predictions:
+                    self.prepare_prediction_to_store(
+                        batch_predictions, batch_identifiers, batch_meta, stored_predictions
+                    )
+                if not store_only:
+                    self._process_batch_results(
+                        batch_predictions, batch_annotation, batch_identifiers,
+                        batch_input_ids, batch_meta, enable_profiling, output_callback)
 
-            if progress_reporter:
-                progress_reporter.update(batch_id, len(batch_identifiers))
-                if compute_intermediate_metric_res and progress_reporter.current % metric_interval == 0:
-                    self.compute_metrics(print_results=True, ignore_results_formatting=ignore_results_formatting)
+                if progress_reporter:
+                    progress_reporter.update(batch_id, len(batch_identifiers))
+                    if compute_intermediate_metric_res and progress_reporter.current % metric_interval == 0:
+                        self.compute_metrics(print_results=True, ignore_results_formatting=ignore_results_formatting)
 
         if progress_reporter:
             progress_reporter.finish()
@@ -352,6 +367,102 @@ class ModelEvaluator(BaseEvaluator):
             print_info("prediction objects are save to {}".format(stored_predictions))
         return self._annotations, self._predictions
 
+    def _process_dataset_pipelined(self, stored_predictions, progress_reporter, metric_config, **kwargs):
+        # data reading with preprocessing, inference and results processing are executed as separated stages
+        # connected by bounded FIFO queues, so batches order is the same as in sync mode
+        store_only = kwargs.get('store_only', False)
+        output_callback = kwargs.get('output_callback')
+        enable_profiling, compute_intermediate_metric_res, metric_interval, ignore_results_formatting = metric_config
+        queue_size = kwargs.get('pipeline_queue_size') or 2
+        prepared_batches, predicted_batches = Queue(queue_size), Queue(queue_size)
+        stop_event = Event()
+        stage_errors = []
+
+        def put(stage_queue, item):
+            while not stop_event.is_set():
+                try:
+                    stage_queue.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def get(stage_queue):
+            while not stop_event.is_set():
+                try:
+                    return stage_queue.get(timeout=0.1)
+                except Empty:
+                    continue
+            return None
+
+        def run_stage(stage_func):
+            try:
+                stage_func()
+            except Exception as error:  # pylint:disable=W0703
+                stage_errors.append(error)
+                stop_event.set()
+
+        def prepare_batches():
+            for batch_id, (batch_input_ids, batch_annotation, batch_input, batch_identifiers) in enumerate(
+                    self.dataset):
+                filled_inputs, batch_meta = self._get_batch_input(batch_annotation, batch_input)
+                if not put(prepared_batches, (
+                        batch_id, batch_input_ids, batch_annotation, batch_identifiers, filled_inputs, batch_meta
+                )):
+                    return
+            put(prepared_batches, None)
+
+        def process_results():
+            while True:
+                predicted_batch = get(predicted_batches)
+                if predicted_batch is None:
+                    return
+                batch_id, batch_input_ids, batch_annotation, batch_identifiers, batch_meta, batch_predictions = (
+                    predicted_batch
+                )
+                if stored_predictions:
+                    self.prepare_prediction_to_store(
+                        batch_predictions, batch_identifiers, batch_meta, stored_predictions
+                    )
+                if not store_only:
+                    self._process_batch_results(
+                        batch_predictions, batch_annotation, batch_identifiers,
+                        batch_input_ids, batch_meta, enable_profiling, output_callback)
+
+                if progress_reporter:
+                    progress_reporter.update(batch_id, len(batch_identifiers))
+                    if compute_intermediate_metric_res and progress_reporter.current % metric_interval == 0:
+                        self.compute_metrics(print_results=True, ignore_results_formatting=ignore_results_formatting)
+
+        stages = [
+            Thread(target=run_stage, args=(prepare_batches,), daemon=True),
+            Thread(target=run_stage, args=(process_results,), daemon=True)
+        ]
+        for stage in stages:
+            stage.start()
+        try:
+            while True:
+                prepared_batch = get(prepared_batches)
+                if prepared_batch is None:
+                    break
+                batch_id, batch_input_ids, batch_annotation, batch_identifiers, filled_inputs, batch_meta = (
+                    prepared_batch
+                )
+                batch_predictions = self.launcher.predict(filled_inputs, batch_meta, **kwargs)
+                if not put(predicted_batches, (
+                        batch_id, batch_input_ids, batch_annotation, batch_identifiers, batch_meta, batch_predictions
+                )):
+                    break
+            put(predicted_batches, None)
+        except BaseException:
+            stop_event.set()
+            raise
+        finally:
+            for stage in stages:
+                stage.join()
+        if stage_errors:
+            raise stage_errors[0]
+
     def _process_batch_results(
             self, batch_predictions, batch_annotations, batch_identifiers, batch_input_ids, batch_meta,
             enable_profiling=False, output_callback=None):
@@ -378,13 +489,25 @@ class ModelEvaluator(BaseEvaluator):
         if not stored_predictions:
             return False
 
+        if ColumnarPredictionsStorage.is_storage(stored_predictions):
+            return True
+
         try:
             get_path(stored_predictions)
             return True
         except OSError:
             return False
 
+    def _configure_predictions_storage(self, stored_predictions, store_only, config):
+        self._predictions_storage = None
+        if not stored_predictions or (self._is_stored(stored_predictions) and not store_only):
+            return
+        if config.get('stored_predictions_format', 'pickle') == 'columnar':
+            self._predictions_storage = ColumnarPredictionsStorage(stored_predictions)
+
     def _load_stored_predictions(self, stored_predictions, progress_reporter):
+        if ColumnarPredictionsStorage.is_storage(stored_predictions) and not self.postprocessor.has_dataset_processors:
+            return self._load_stored_predictions_by_batches(stored_predictions, progress_reporter)
         predictions = self.load(stored_predictions, progress_reporter)
         annotations = self.dataset.annotation
         if self.postprocessor.has_processors:
@@ -400,6 +523,29 @@ class ModelEvaluator(BaseEvaluator):
 
         return annotations, predictions
 
+    def _load_stored_predictions_by_batches(self, stored_predictions, progress_reporter):
+        # columnar storage reads only requested batches, so predictions are loaded, processed and released by batches
+        launcher = self._get_stored_predictions_launcher(stored_predictions, progress_reporter)
+        if progress_reporter:
+            progress_reporter.reset(self.dataset.size)
+        for batch_id, (batch_input_ids, batch_annotation, batch_identifiers) in enumerate(
+                self.dataset.annotation_batches()):
+            batch_predictions = launcher.predict(batch_identifiers)
+            if self.postprocessor.has_processors:
+                self.dataset.provide_data_info(batch_annotation)
+            annotations, predictions = self.postprocessor.process_batch(batch_annotation, batch_predictions)
+            self.metric_executor.update_metrics_on_batch(batch_input_ids, annotations, predictions)
+            if self.metric_executor.need_store_predictions:
+                self._annotations.extend(annotations)
+                self._predictions.extend(predictions)
+            if progress_reporter:
+                progress_reporter.update(batch_id, len(batch_identifiers))
+
+        if progress_reporter:
+            progress_reporter.finish()
+
+        return self._annotations, self._predictions
+
     def _fill_free_irs(self, free_irs, queued_irs, infer_requests_pool, dataset_iterator):
         for ir_id in free_irs:
             try:
@@ -510,23 +656,27 @@ class ModelEvaluator(BaseEvaluator):
             presenter.write_result(metric_result, ignore_results_formatting)
 
     def load(self, stored_predictions, progress_reporter):
-        launcher = self.launcher
-        identifiers = self.dataset.identifiers
-        if not isinstance(launcher, DummyLauncher):
-            launcher = DummyLauncher({
-                'framework': 'dummy',
-                'loader': 'pickle',
-                'data_path': stored_predictions,
-            }, adapter=self.adapter, identifiers=identifiers, progress=progress_reporter)
-
-        predictions = launcher.predict(identifiers)
+        launcher = self._get_stored_predictions_launcher(stored_predictions, progress_reporter)
+        predictions = launcher.predict(self.dataset.identifiers)
         if progress_reporter:
             progress_reporter.finish(False)
 
         return predictions
 
+    def _get_stored_predictions_launcher(self, stored_predictions, progress_reporter):
+        if isinstance(self.launcher, DummyLauncher):
+            return self.launcher
+        return DummyLauncher({
+            'framework': 'dummy',
+            'loader': 'columnar' if ColumnarPredictionsStorage.is_storage(stored_predictions) else 'pickle',
+            'data_path': stored_predictions,
+        }, adapter=self.adapter, identifiers=self.dataset.identifiers, progress=progress_reporter)
+
     def prepare_prediction_to_store(self, batch_predictions, batch_identifiers, batch_meta, stored_predictions):
         prediction_to_store = StoredPredictionBatch(batch_predictions, batch_identifiers, batch_meta)
+        if self._predictions_storage is not None:
+            self._predictions_storage.append(prediction_to_store)
+            return
         self.store_predictions(stored_predictions, prediction_to_store)
 
     @property
@@ -567,6 +717,10 @@ class ModelEvaluator(BaseEvaluator):
 
     @staticmethod
     def _reset_stored_predictions(stored_predictions):
+        if ColumnarPredictionsStorage.is_storage(stored_predictions):
+            ColumnarPredictionsStorage.reset(stored_predictions)
+            print_info("Directory {} will be cleared for storing predictions".format(stored_predictions))
+            return
         with open(stored_predictions, 'wb'):
             print_info("File {} will be cleared for storing predictions".format(stored_predictions))
 
@@ -16,6 +16,9 @@ limitations under the License.
 
 import subprocess
 import multiprocessing
+import hashlib
+import json
+import tempfile
 from pathlib import Path
 import os
 import platform
@@ -129,7 +132,11 @@ class DLSDKLauncher(Launcher):
                 optional=True, choices=VPU_LOG_LEVELS, description="VPU LOG level: {}".format(', '.join(VPU_LOG_LEVELS))
             ),
             '_prev_bitstream': PathField(optional=True, description="path to bitstream from previous run (FPGA only)"),
-            '_model_is_blob': BoolField(optional=True, description='hint for auto model search')
+            '_model_is_blob': BoolField(optional=True, description='hint for auto model search'),
+            '_compiled_network_cache_dir': PathField(
+                optional=True, is_directory=True, check_exists=False,
+                description='directory for caching exported compiled networks'
+            )
         })
 
         return parameters
@@ -163,6 +170,8 @@ class DLSDKLauncher(Launcher):
         self._output_layouts = {}
         self._output_precisions = {}
         self.preprocessor = preprocessor
+        self._network_hash = (None, None)
+        self._import_export_supported = None
 
         if not delayed_model_loading:
             if dlsdk_launcher_config.need_conversion:
@@ -555,7 +564,7 @@ class DLSDKLauncher(Launcher):
         if hasattr(self, 'exec_network'):
             del self.exec_network
         self.network.reshape(shapes)
-        self.exec_network = self.ie_core.load_network(self.network, self.device, num_requests=self._num_requests)
+        self.exec_network = self._load_exec_network()
 
     def _set_batch_size(self, batch_size):
         # in some cases we can not use explicit property for setting batch size, so we need to use reshape instead
@@ -736,6 +745,10 @@ class DLSDKLauncher(Launcher):
             ))
 
     def _create_network(self, input_shapes=None):
+        if self._is_ir_in_memory():
+            self.network = self.read_network(self._model, self._weights)
+            self._configure_network(input_shapes)
+            return
         model_path = Path(self._model)
         compiled_model = model_path.suffix == '.blob'
         if compiled_model:
@@ -757,6 +770,9 @@ class DLSDKLauncher(Launcher):
         if self._weights is None and self._model.suffix != '.onnx':
             self._weights = model_path.parent / (model_path.name.split(model_path.suffix)[0] + '.bin')
         self.network = self.read_network(self._model, self._weights)
+        self._configure_network(input_shapes)
+
+    def _configure_network(self, input_shapes=None):
         self.original_outputs = self.network.outputs
         outputs = self.config.get('outputs')
         if outputs:
@@ -793,9 +809,7 @@ class DLSDKLauncher(Launcher):
             if preprocessing:
                 self._set_preprocess(preprocessing)
             if self.network and not preprocessing:
-                self.exec_network = self.ie_core.load_network(
-                    self.network, self._device, num_requests=self.num_requests
-                )
+                self.exec_network = self._load_exec_network()
 
     def update_input_configuration(self, input_config):
         self.config['inputs'] = input_config
@@ -805,16 +819,116 @@ class DLSDKLauncher(Launcher):
         if self.preprocessor:
             self._set_preprocess(self.preprocessor)
         if self.network:
-            self.exec_network = self.ie_core.load_network(
-                self.network, self._device, num_requests=self.num_requests
-            )
+            self.exec_network = self._load_exec_network()
+
+    def _load_exec_network(self):
+        cache_dir = self.config.get('_compiled_network_cache_dir')
+        if not cache_dir or self._is_multi() or not hasattr(self.network, 'serialize') or \
+                not self._is_import_export_supported():
+            return self.ie_core.load_network(self.network, self._device, num_requests=self.num_requests)
+        compiled_network = Path(cache_dir) / '{}.blob'.format(self._compiled_network_key())
+        if compiled_network.exists():
+            try:
+                exec_network = self.ie_core.import_network(
+                    str(compiled_network), self._device, num_requests=self.num_requests
+                )
+                print_info('Compiled network loaded from cache: {}'.format(compiled_network))
+                return exec_network
+            except RuntimeError as error:
+                warning('Compiled network {} can not be imported: {}'.format(compiled_network, error))
+        exec_network = self.ie_core.load_network(self.network, self._device, num_requests=self.num_requests)
+        if not self._export_exec_network(exec_network, compiled_network):
+            self._import_export_supported = False
+        return exec_network
+
+    def _is_import_export_supported(self):
+        if self._import_export_supported is None:
+            try:
+                supported_metrics = self.ie_core.get_metric(self._device, 'SUPPORTED_METRICS')
+                self._import_export_supported = 'IMPORT_EXPORT_SUPPORT' in supported_metrics and bool(
+                    self.ie_core.get_metric(self._device, 'IMPORT_EXPORT_SUPPORT')
+                )
+            except RuntimeError:
+                self._import_export_supported = False
+            if not self._import_export_supported:
+                warning('{} device does not support compiled network export, compiled network cache is disabled'.format(
+                    self._device
+                ))
+        return self._import_export_supported
+
+    @staticmethod
+    def _export_exec_network(exec_network, compiled_network):
+        compiled_network.parent.mkdir(parents=True, exist_ok=True)
+        # export to temporary file first to prevent reading of partially written network by other processes
+        tmp_network = compiled_network.with_suffix('.{}.tmp'.format(os.getpid()))
+        try:
+            exec_network.export(str(tmp_network))
+            os.replace(str(tmp_network), str(compiled_network))
+        except RuntimeError as error:
+            warning('Compiled network can not be cached: {}'.format(error))
+            if tmp_network.exists():
+                tmp_network.unlink()
+            return False
+        return True
+
+    def _compiled_network_key(self):
+        has_info = hasattr(self.network, 'input_info')
+        ie_input_info = self.network.input_info if has_info else self.network.inputs
+        inputs = []
+        for name, info in ie_input_info.items():
+            data = info.input_data if has_info else info
+            preprocess_info = []
+            if has_info:
+                preprocess = info.preprocess_info
+                preprocess_info = [
+                    str(preprocess.resize_algorithm), str(preprocess.color_format), str(preprocess.mean_variant)
+                ]
+                for channel in range(preprocess.get_number_of_channels()):
+                    preprocess_info.append([preprocess[channel].mean_value, preprocess[channel].std_scale])
+            inputs.append([name, data.shape, data.precision, data.layout, preprocess_info])
+        outputs = [[name, data.shape, data.precision, data.layout] for name, data in self.network.outputs.items()]
+        key_info = {
+            'ie_version': ie.get_version(),
+            'model': self._model_hash(),
+            'device': self._device,
+            'launcher_config': {
+                key: self.config.get(key) for key in (
+                    'device_config', 'cpu_extensions', 'gpu_extensions', 'affinity_map', 'async_mode', '_vpu_log_level'
+                )
+            },
+            'inputs': inputs,
+            'outputs': outputs
+        }
+        return hashlib.sha256(json.dumps(key_info, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _model_hash(self):
+        # hash serialized network instead of source files: network can be provided externally or modified in memory.
+        # Shapes, precisions and outputs are included into the key separately, so the hash is reused for the same
+        # network object after reshape or num_requests changes
+        if self._network_hash[0] is self.network:
+            return self._network_hash[1]
+        model_hash = hashlib.sha256()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_files = (Path(tmp_dir) / 'model.xml', Path(tmp_dir) / 'model.bin')
+            self.network.serialize(str(model_files[0]), str(model_files[1]))
+            for model_file in model_files:
+                with open(str(model_file), 'rb') as content:
+                    for chunk in iter(lambda: content.read(1 << 20), b''):
+                        model_hash.update(chunk)
+        self._network_hash = (self.network, model_hash.hexdigest())
+        return self._network_hash[1]
 
     def load_ir(self, xml_path, bin_path, log=False):
+        """
+        Loads IR model. xml_path and bin_path can be paths to IR files or IR xml and weights content as bytes.
+        """
         self._model = xml_path
         self._weights = bin_path
         self.load_network(log=log)
 
     def read_network(self, model, weights):
+        if isinstance(model, bytes):
+            return self.ie_core.read_network(model=model, weights=weights, init_from_buffer=True)
         if 'read_network' in ie.IECore.__dict__:
             network = self.ie_core.read_network(model=str(model), weights=str(weights))
         else:
@@ -980,7 +1094,10 @@ class DLSDKLauncher(Launcher):
         self.disable_resize_to_input = preprocess.ie_processor.has_resize()
 
     def get_model_file_type(self):
-        return self._model.suffix
+        return '.xml' if self._is_ir_in_memory() else self._model.suffix
+
+    def _is_ir_in_memory(self):
+        return isinstance(self._model, bytes)
 
     def release(self):
         if 'network' in self.__dict__:
@@ -19,12 +19,15 @@ from .loader import Loader, StoredPredictionBatch
 from .pickle_loader import PickleLoader
 from .xml_loader import XMLLoader
 from .json_loader import JSONLoader
+from .columnar_loader import ColumnarLoader, ColumnarPredictionsStorage
 
 __all__ = [
     'Loader',
     'PickleLoader',
     'XMLLoader',
     'JSONLoader',
+    'ColumnarLoader',
+    'ColumnarPredictionsStorage',
 
     'StoredPredictionBatch'
 ]
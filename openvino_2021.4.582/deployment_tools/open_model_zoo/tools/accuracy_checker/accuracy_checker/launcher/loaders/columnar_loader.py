@@ -0,0 +1,149 @@
+"""
+Copyright (c) 2018-2021 Intel Corporation
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pickle
+from pathlib import Path
+from collections import namedtuple
+import numpy as np
+
+from .loader import Loader, StoredPredictionBatch
+
+
+ArrayReference = namedtuple('ArrayReference', ['shard', 'offset', 'dtype', 'shape'])
+
+INDEX_FILE = 'index.pickle'
+SHARD_TEMPLATE = 'predictions_{}.bin'
+SHARD_ALIGNMENT = 64
+
+
+class ColumnarPredictionsStorage:
+    """
+    Writes raw predictions batches to directory: numpy arrays are appended to binary shards,
+    batch identifiers, meta and array locations are stored in index file.
+    """
+
+    def __init__(self, data_path, shard_size=1 << 30):
+        self._data_path = Path(data_path)
+        self._shard_size = shard_size
+        self.reset(self._data_path)
+        self._data_path.mkdir(parents=True, exist_ok=True)
+        self._shard_id = 0
+        self._shard_offset = 0
+
+    @staticmethod
+    def is_storage(data_path):
+        return Path(data_path).is_dir() and (Path(data_path) / INDEX_FILE).exists()
+
+    @staticmethod
+    def reset(data_path):
+        data_path = Path(data_path)
+        if not data_path.is_dir():
+            return
+        for stored_file in [data_path / INDEX_FILE, *data_path.glob(SHARD_TEMPLATE.format('*'))]:
+            if stored_file.exists():
+                stored_file.unlink()
+
+    def append(self, batch: StoredPredictionBatch):
+        raw_predictions = self._store_arrays(batch.raw_predictions)
+        with open(str(self._data_path / INDEX_FILE), 'ab') as index_file:
+            pickle.dump(StoredPredictionBatch(raw_predictions, batch.identifiers, batch.meta), index_file)
+
+    def _store_arrays(self, data):
+        if isinstance(data, np.ndarray) and data.dtype != object:
+            return self._write_array(data)
+        if isinstance(data, dict):
+            return type(data)((key, self._store_arrays(value)) for key, value in data.items())
+        if isinstance(data, (list, tuple)) and not hasattr(data, '_fields'):
+            return type(data)(self._store_arrays(value) for value in data)
+        return data
+
+    def _write_array(self, array):
+        if self._shard_offset and self._shard_offset + array.nbytes > self._shard_size:
+            self._shard_id += 1
+            self._shard_offset = 0
+        shard = SHARD_TEMPLATE.format(self._shard_id)
+        offset = self._shard_offset
+        with open(str(self._data_path / shard), 'ab') as shard_file:
+            shard_file.write(np.ascontiguousarray(array).tobytes())
+            padding = -array.nbytes % SHARD_ALIGNMENT
+            shard_file.write(b'\0' * padding)
+        self._shard_offset += array.nbytes + padding
+
+        return ArrayReference(shard, offset, array.dtype.str, array.shape)
+
+
+class ColumnarLoader(Loader):
+    """
+    Class for loading predictions stored by ColumnarPredictionsStorage.
+    Arrays are memory mapped and batches are processed by adapter only when their predictions are requested.
+    """
+
+    __provider__ = 'columnar'
+
+    def __init__(self, data_path: Path, *args, **kwargs):
+        super().__init__(data_path, *args, **kwargs)
+        self._adapter = kwargs.get('adapter')
+        self._batches = self.read_index(data_path)
+        self._batch_by_identifier = {}
+        for batch_id, batch in enumerate(self._batches):
+            for identifier in batch.identifiers:
+                self._batch_by_identifier[identifier] = batch_id
+        self._loaded = {}
+
+    def __len__(self):
+        return len(self._batch_by_identifier)
+
+    def __getitem__(self, item):
+        if item not in self._loaded:
+            if item not in self._batch_by_identifier:
+                raise IndexError('There is no prediction object for "{}" input data'.format(item))
+            self._load_batch(self._batches[self._batch_by_identifier[item]])
+
+        return self._loaded.pop(item)
+
+    def _load_batch(self, batch):
+        batch = StoredPredictionBatch(self._map_arrays(batch.raw_predictions), batch.identifiers, batch.meta)
+        if not self._adapter:
+            self._loaded.update({identifier: batch for identifier in batch.identifiers})
+            return
+        for prediction in self._adapter.process(*batch):
+            self._loaded[prediction.identifier] = prediction
+
+    def _map_arrays(self, data):
+        if isinstance(data, ArrayReference):
+            if not np.prod(data.shape):
+                return np.empty(data.shape, dtype=data.dtype)
+            # copy on write mode allows adapters to modify arrays without changing stored data
+            return np.memmap(
+                str(self._data_path / data.shard), dtype=np.dtype(data.dtype), mode='c',
+                offset=data.offset, shape=data.shape
+            )
+        if isinstance(data, dict):
+            return type(data)((key, self._map_arrays(value)) for key, value in data.items())
+        if isinstance(data, (list, tuple)) and not hasattr(data, '_fields'):
+            return type(data)(self._map_arrays(value) for value in data)
+        return data
+
+    @staticmethod
+    def read_index(data_path):
+        batches = []
+        with open(str(Path(data_path) / INDEX_FILE), 'rb') as index_file:
+            while True:
+                try:
+                    batches.append(pickle.load(index_file))
+                except EOFError:
+                    break
+        return batches
@@ -16,16 +16,18 @@ limitations under the License.
 
 import json
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 from pathlib import Path
-from argparse import ArgumentParser
+from argparse import ArgumentParser, ArgumentTypeError
 from functools import partial
 from csv import DictWriter
 
 import cv2
 
 from .config import ConfigReader
-from .logging import print_info, add_file_handler, exception
+from .logging import print_info, add_file_handler, exception, warning
 from .evaluators import ModelEvaluator, ModuleEvaluator
 from .progress_reporters import ProgressReporter
 from .utils import (
@@ -46,6 +48,13 @@ EVALUATION_MODE = {
 }
 
 
+def positive_int(value):
+    int_value = int(value)
+    if int_value <= 0:
+        raise ArgumentTypeError('{} is not a positive integer'.format(value))
+    return int_value
+
+
 def add_common_args(parser):
     common_args = parser.add_argument_group('Common arguments')
     common_args.add_argument(
@@ -221,6 +230,41 @@ def add_tool_settings_args(parser):
         default=False,
         required=False
     )
+    tool_settings_args.add_argument(
+        '--stored_predictions_format',
+        help='format for storing predictions: pickle file or directory with memory mapped arrays (columnar)',
+        choices=['pickle', 'columnar'],
+        default='pickle',
+        required=False
+    )
+    tool_settings_args.add_argument(
+        '--pipelined',
+        help='allow overlapping data reading with preprocessing, inference and results processing in separated stages',
+        type=cast_to_bool,
+        default=False,
+        required=False
+    )
+    tool_settings_args.add_argument(
+        '--pipeline_queue_size',
+        help='the number of batches buffered between pipeline stages',
+        type=positive_int,
+        default=2,
+        required=False
+    )
+    tool_settings_args.add_argument(
+        '--jobs',
+        help='the number of config entries evaluated in parallel worker processes',
+        type=positive_int,
+        default=1,
+        required=False
+    )
+    tool_settings_args.add_argument(
+        '--jobs_per_device',
+        help='the maximal number of config entries evaluated in parallel on the same device if --jobs > 1. '
+             'By default only --jobs limit is applied',
+        type=positive_int,
+        required=False
+    )
     tool_settings_args.add_argument(
         '-l', '--log_file',
         help='file for additional logging results',
@@ -321,6 +365,12 @@ def add_openvino_specific_args(parser):
         default=Path.cwd(),
         required=False
     )
+    openvino_specific_args.add_argument(
+        '--compiled_network_cache_dir',
+        help='directory for caching compiled networks between runs. Used for DLSDK launcher only',
+        type=partial(get_path, is_directory=True, check_exists=False),
+        required=False
+    )
     openvino_specific_args.add_argument(
         '--aocl',
         help='path to aocl executable for FPGA bitstream programming',
@@ -390,6 +440,10 @@ def main():
         evaluator_kwargs['metrics_interval'] = args.metrics_interval
         evaluator_kwargs['ignore_result_formatting'] = args.ignore_result_formatting
     evaluator_kwargs['store_only'] = args.store_only
+    evaluator_kwargs['stored_predictions_format'] = args.stored_predictions_format
+    if args.pipelined:
+        evaluator_kwargs['pipelined'] = args.pipelined
+        evaluator_kwargs['pipeline_queue_size'] = args.pipeline_queue_size
     details = {
         'mode': "online" if not args.store_only else "offline",
         'metric_profiling': args.profile,
@@ -402,6 +456,13 @@ def main():
         send_telemetry_event(tm, 'error', 'Unknown evaluation mode')
         end_telemetry(tm)
         raise ValueError('Unknown evaluation mode')
+    if args.jobs > 1 and args.stored_predictions:
+        warning('parallel evaluation is not supported with stored predictions, entries will be evaluated one by one')
+        args.jobs = 1
+    if args.jobs > 1:
+        return_code = evaluate_in_parallel(config[mode], mode, args, evaluator_kwargs, details, tm)
+        end_telemetry(tm)
+        sys.exit(return_code)
     for config_entry in config[mode]:
         details.update({'status': 'started', "error": None})
         config_entry.update({
@@ -442,6 +503,131 @@ def main():
     sys.exit(return_code)
 
 
+def evaluate_in_parallel(config_entries, mode, args, evaluator_kwargs, details, tm):
+    """
+    Evaluates config entries in worker processes.
+    Entries which convert the same annotation are not run simultaneously, so converted annotation is saved
+    by the first entry and reused by the others. Csv results and telemetry are written from the main process.
+    """
+    evaluator_class = EVALUATION_MODE[mode]
+    max_device_jobs = args.jobs_per_device or args.jobs
+    pending_entries = []
+    for config_entry in config_entries:
+        config_entry.update({
+            '_store_only': args.store_only,
+            '_stored_data': args.stored_predictions
+        })
+        devices = get_entry_devices(evaluator_class, config_entry)
+        pending_entries.append((config_entry, devices, get_converted_annotation_files(config_entry)))
+
+    return_code = 0
+    running_entries = {}
+    device_jobs = Counter()
+    converted_annotations = set()
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        while pending_entries or running_entries:
+            for entry in list(pending_entries):
+                if len(running_entries) >= args.jobs:
+                    break
+                config_entry, devices, annotation_files = entry
+                if any(device_jobs[device] >= max_device_jobs for device in devices):
+                    continue
+                if annotation_files & converted_annotations:
+                    continue
+                pending_entries.remove(entry)
+                device_jobs.update(devices)
+                converted_annotations.update(annotation_files)
+                future = executor.submit(
+                    evaluate_config_entry, config_entry, mode, args, evaluator_kwargs, tm is not None
+                )
+                running_entries[future] = entry
+
+            finished, _ = wait(running_entries, return_when=FIRST_COMPLETED)
+            for future in finished:
+                _, devices, annotation_files = running_entries.pop(future)
+                device_jobs.subtract(devices)
+                converted_annotations.difference_update(annotation_files)
+                try:
+                    result = future.result()
+                except Exception as e:  # pylint:disable=W0703
+                    exception(e)
+                    result = {'details': {}, 'error': str(type(e))}
+                entry_details = {**details, **result['details'], 'status': 'started', 'error': None}
+                send_telemetry_event(tm, 'model_run', entry_details)
+                if result['error']:
+                    entry_details.update({'status': 'error', 'error': result['error']})
+                    send_telemetry_event(tm, 'model_run', json.dumps(entry_details))
+                    return_code = 1
+                    continue
+                if args.csv_result and result['metrics_results'] is not None:
+                    write_csv_result(
+                        args.csv_result, result['processing_info'], result['metrics_results'],
+                        result['dataset_size'], result['metrics_meta']
+                    )
+                entry_details['status'] = 'finished'
+                send_telemetry_event(tm, 'model_run', entry_details)
+
+    return return_code
+
+
+def evaluate_config_entry(config_entry, mode, args, evaluator_kwargs, collect_processing_info=False):
+    evaluator_class = EVALUATION_MODE[mode]
+    progress_bar_provider = args.progress if ':' not in args.progress else args.progress.split(':')[0]
+    progress_reporter = ProgressReporter.provide(progress_bar_provider, None, print_interval=args.progress_interval)
+    result = {
+        'details': {}, 'error': None, 'processing_info': None,
+        'metrics_results': None, 'metrics_meta': None, 'dataset_size': None
+    }
+    try:
+        processing_info = evaluator_class.get_processing_info(config_entry)
+        print_processing_info(*processing_info)
+        result['processing_info'] = processing_info
+        evaluator = evaluator_class.from_configs(config_entry)
+        # telemetry sender itself is available only in the main process, here it is used only as a flag
+        result['details'] = evaluator.send_processing_info(True if collect_processing_info else None)
+        if args.profile:
+            setup_profiling(args.profiler_log_dir, evaluator)
+        evaluator.process_dataset(
+            stored_predictions=args.stored_predictions, progress_reporter=progress_reporter, **evaluator_kwargs
+        )
+        if not args.store_only:
+            result['metrics_results'], result['metrics_meta'] = evaluator.extract_metrics_results(
+                print_results=True, ignore_results_formatting=args.ignore_result_formatting
+            )
+            result['dataset_size'] = evaluator.dataset_size
+        evaluator.release()
+    except Exception as e:  # pylint:disable=W0703
+        exception(e)
+        result['error'] = str(type(e))
+
+    return result
+
+
+def get_entry_devices(evaluator_class, config_entry):
+    try:
+        device = evaluator_class.get_processing_info(config_entry)[2]
+    except Exception:  # pylint:disable=W0703
+        return []
+    device = device.upper()
+    if ':' in device:
+        # HETERO, MULTI and AUTO plugins occupy all listed devices
+        device = device.split(':', 1)[1]
+
+    return sorted({device_name for device_name in device.split(',') if device_name})
+
+
+def get_converted_annotation_files(config_entry):
+    datasets = config_entry.get('datasets') or config_entry.get('module_config', {}).get('datasets', [])
+    annotation_files = set()
+    for dataset_config in datasets:
+        if 'annotation' in dataset_config and 'annotation_conversion' in dataset_config:
+            annotation_file = Path(dataset_config['annotation'])
+            if not annotation_file.exists():
+                annotation_files.add(annotation_file.resolve())
+
+    return annotation_files
+
+
 def print_processing_info(model, launcher, device, tags, dataset):
     print_info('Processing info:')
     print_info('model: {}'.format(model))
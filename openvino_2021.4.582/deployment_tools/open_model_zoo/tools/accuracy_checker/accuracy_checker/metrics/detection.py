@@ -21,7 +21,7 @@ from typing import List
 from collections import defaultdict
 import numpy as np
 
-from ..utils import finalize_metric_result
+from ..utils import finalize_metric_result, zipped_transform
 from .overlap import Overlap, IOA
 from ..config import BoolField, NumberField, StringField, ConfigError
 from ..representation import (
@@ -39,6 +39,9 @@ class APIntegralType(enum.Enum):
 
 
 class BaseDetectionMetricMixin(Metric):
+    # number of per image matching results stored for class before merging them into single array
+    max_accumulated_chunks = 256
+
     @classmethod
     def parameters(cls):
         parameters = super().parameters()
@@ -94,51 +97,25 @@ class BaseDetectionMetricMixin(Metric):
         self.labels = list(labels.keys())
         valid_labels = list(filter(lambda x: x != self.dataset.metadata.get('background_label'), self.labels))
         self.meta['names'] = [labels[name] for name in valid_labels]
+        self._label_matches = {}
+        self._accumulated_images = 0
 
-    def per_class_detection_statistics(self, annotations, predictions, labels, profile_boxes=False):
+    def per_class_detection_statistics(
+            self, annotations, predictions, labels, profile_boxes=False, accumulate_matches=False
+    ):
         labels_stat = {}
+        matcher = BoxMatcher(
+            annotations, predictions, self.overlap_method, self.overlap_threshold,
+            self.ignore_difficult, self.allow_multiple_matches_per_ignored, self.include_boundaries,
+            self.use_filtered_tp, stable_sort=accumulate_matches
+        )
         for label in labels:
-            tp, fp, conf, n, matched, dt_boxes, iou = bbox_match(
-                annotations, predictions, int(label),
-                self.overlap_method, self.overlap_threshold,
-                self.ignore_difficult, self.allow_multiple_matches_per_ignored, self.include_boundaries,
-                self.use_filtered_tp
-            )
-            gt_boxes = [np.array(ann.boxes)[ann.labels == label] for ann in annotations]
-
-            if not tp.size:
-                labels_stat[label] = {
-                    'precision': np.array([]),
-                    'recall': np.array([]),
-                    'thresholds': conf,
-                    'fppi': np.array([])
-                }
-                if profile_boxes:
-                    labels_stat[label].update({
-                        'scores': conf,
-                        'dt': dt_boxes,
-                        'gt': gt_boxes[0],
-                        'matched': matched,
-                        'iou': iou
-                    })
-                continue
-
-            # select only values for distinct confidences
-            if self.distinct_conf:
-                distinct_value_indices = np.where(np.diff(conf))[0]
-                threshold_indexes = np.r_[distinct_value_indices, tp.size - 1]
-            else:
-                threshold_indexes = np.arange(conf.size)
-
-            tp, fp = np.cumsum(tp)[threshold_indexes], np.cumsum(fp)[threshold_indexes]
-
-            labels_stat[label] = {
-                'precision': tp / np.maximum(tp + fp, np.finfo(np.float64).eps),
-                'recall': tp / np.maximum(n, np.finfo(np.float64).eps),
-                'thresholds': conf[threshold_indexes],
-                'fppi': fp / len(annotations)
-            }
+            tp, fp, conf, n, matched, dt_boxes, iou = matcher.match(int(label))
+            if accumulate_matches:
+                self._accumulate_label_matches(int(label), predictions, tp, fp, conf, n)
+            labels_stat[label] = self._label_statistics(tp, fp, conf, n, len(annotations))
             if profile_boxes:
+                gt_boxes = [np.array(ann.boxes)[ann.labels == label] for ann in annotations]
                 labels_stat[label].update({
                     'scores': conf,
                     'dt': dt_boxes,
@@ -146,9 +123,79 @@ class BaseDetectionMetricMixin(Metric):
                     'matched': matched,
                     'iou': iou
                 })
+        if accumulate_matches:
+            self._accumulated_images += len(annotations)
+
+        return labels_stat
+
+    def accumulated_detection_statistics(self, labels):
+        """
+        Returns per class statistics for all images submitted with accumulate_matches,
+        results are the same as for per_class_detection_statistics on the whole dataset
+        if detections with equal scores are matched in the dataset order.
+        """
+        labels_stat = {}
+        for label in labels:
+            self._merge_label_matches(int(label))
+            label_matches = self._label_matches.get(int(label), {'scores': [], 'tp': [], 'fp': [], 'num_gt': 0})
+            conf, tp, fp = (
+                label_matches[key][0] if label_matches[key] else np.array([]) for key in ('scores', 'tp', 'fp')
+            )
+            sorted_order = np.argsort(-conf, kind='stable')
+            labels_stat[label] = self._label_statistics(
+                tp[sorted_order], fp[sorted_order], conf[sorted_order], label_matches['num_gt'],
+                self._accumulated_images
+            )
 
         return labels_stat
 
+    def _label_statistics(self, tp, fp, conf, n, num_images):
+        if not tp.size:
+            return {
+                'precision': np.array([]),
+                'recall': np.array([]),
+                'thresholds': conf,
+                'fppi': np.array([])
+            }
+
+        # select only values for distinct confidences
+        if self.distinct_conf:
+            distinct_value_indices = np.where(np.diff(conf))[0]
+            threshold_indexes = np.r_[distinct_value_indices, tp.size - 1]
+        else:
+            threshold_indexes = np.arange(conf.size)
+
+        tp, fp = np.cumsum(tp)[threshold_indexes], np.cumsum(fp)[threshold_indexes]
+
+        return {
+            'precision': tp / np.maximum(tp + fp, np.finfo(np.float64).eps),
+            'recall': tp / np.maximum(n, np.finfo(np.float64).eps),
+            'thresholds': conf[threshold_indexes],
+            'fppi': fp / num_images
+        }
+
+    def _accumulate_label_matches(self, label, predictions, tp, fp, conf, n):
+        label_matches = self._label_matches.setdefault(label, {'scores': [], 'tp': [], 'fp': [], 'num_gt': 0})
+        label_matches['num_gt'] += n
+        if not tp.size:
+            return
+        # matches are stored in the order of boxes in predictions, so stable sorting of all accumulated scores
+        # gives the same order as matching on the whole dataset, including boxes with equal scores
+        label_scores = np.concatenate([prediction.scores[prediction.labels == label] for prediction in predictions])
+        restore_order = np.argsort(np.argsort(-label_scores, kind='stable'), kind='stable')
+        for key, values in zip(('scores', 'tp', 'fp'), (conf, tp, fp)):
+            label_matches[key].append(values[restore_order])
+        if len(label_matches['scores']) > self.max_accumulated_chunks:
+            self._merge_label_matches(label)
+
+    def _merge_label_matches(self, label):
+        label_matches = self._label_matches.get(label)
+        if not label_matches:
+            return
+        for key in ('scores', 'tp', 'fp'):
+            if len(label_matches[key]) > 1:
+                label_matches[key] = [np.concatenate(label_matches[key])]
+
     def evaluate(self, annotations, predictions):
         if self.profiler:
             self.profiler.finish()
@@ -158,11 +205,30 @@ class BaseDetectionMetricMixin(Metric):
         dataset_labels = self.dataset.metadata.get(label_map, {})
         valid_labels = list(filter(lambda x: x != self.dataset.metadata.get('background_label'), dataset_labels))
         self.meta['names'] = [dataset_labels[name] for name in valid_labels]
+        self._label_matches = {}
+        self._accumulated_images = 0
         if self.profiler:
             self.profiler.reset()
 
 
-class DetectionMAP(BaseDetectionMetricMixin, FullDatasetEvaluationMetric, PerImageEvaluationMetric):
+class StreamingDetectionMetricMixin(BaseDetectionMetricMixin):
+    """
+    Detection metric which accumulates compact per class matching results in update,
+    so predictions are not stored for the whole dataset. If annotations and predictions are provided
+    for evaluation directly, statistics are calculated on them.
+    """
+
+    def submit_all(self, annotations, predictions):
+        annotations, predictions = zipped_transform(self._resolve_representation_containers, annotations, predictions)
+        return self.evaluate(annotations, predictions)
+
+    def detection_statistics(self, annotations, predictions, labels):
+        if annotations:
+            return self.per_class_detection_statistics(annotations, predictions, labels)
+        return self.accumulated_detection_statistics(labels)
+
+
+class DetectionMAP(StreamingDetectionMetricMixin, PerImageEvaluationMetric):
     """
     Class for evaluating mAP metric of detection models.
     """
@@ -191,11 +257,16 @@ class DetectionMAP(BaseDetectionMetricMixin, FullDatasetEvaluationMetric, PerIma
         self.integral = APIntegralType(self.get_value_from_config('integral'))
 
     def update(self, annotation, prediction):
-        return self._calculate_map([annotation], [prediction], self.profiler is not None)
+        valid_labels = get_valid_labels(self.labels, self.dataset.metadata.get('background_label'))
+        labels_stat = self.per_class_detection_statistics(
+            [annotation], [prediction], valid_labels, self.profiler is not None, accumulate_matches=True
+        )
+        return self._calculate_map(labels_stat, annotation.identifier if self.profiler else None)
 
     def evaluate(self, annotations, predictions):
         super().evaluate(annotations, predictions)
-        average_precisions = self._calculate_map(annotations, predictions)
+        valid_labels = get_valid_labels(self.labels, self.dataset.metadata.get('background_label'))
+        average_precisions = self._calculate_map(self.detection_statistics(annotations, predictions, valid_labels))
         average_precisions, self.meta['names'] = finalize_metric_result(average_precisions, self.meta['names'])
         if not average_precisions:
             warnings.warn("No detections to compute mAP")
@@ -203,10 +274,7 @@ class DetectionMAP(BaseDetectionMetricMixin, FullDatasetEvaluationMetric, PerIma
 
         return average_precisions
 
-    def _calculate_map(self, annotations, predictions, profile_boxes=False):
-        valid_labels = get_valid_labels(self.labels, self.dataset.metadata.get('background_label'))
-        labels_stat = self.per_class_detection_statistics(annotations, predictions, valid_labels, profile_boxes)
-
+    def _calculate_map(self, labels_stat, profiled_identifier=None):
         average_precisions = []
         for label in labels_stat:
             label_precision = labels_stat[label]['precision']
@@ -216,14 +284,14 @@ class DetectionMAP(BaseDetectionMetricMixin, FullDatasetEvaluationMetric, PerIma
                 average_precisions.append(ap)
             else:
                 average_precisions.append(np.nan)
-            if profile_boxes:
+            if profiled_identifier is not None:
                 labels_stat[label]['result'] = average_precisions[-1]
-        if profile_boxes:
-            self.profiler.update(annotations[0].identifier, labels_stat, self.name, np.nanmean(average_precisions))
+        if profiled_identifier is not None:
+            self.profiler.update(profiled_identifier, labels_stat, self.name, np.nanmean(average_precisions))
         return average_precisions
 
 
-class MissRate(BaseDetectionMetricMixin, FullDatasetEvaluationMetric, PerImageEvaluationMetric):
+class MissRate(StreamingDetectionMetricMixin, PerImageEvaluationMetric):
     """
     Class for evaluating Miss Rate metric of detection models.
     """
@@ -248,7 +316,7 @@ class MissRate(BaseDetectionMetricMixin, FullDatasetEvaluationMetric, PerImageEv
     def update(self, annotation, prediction):
         valid_labels = get_valid_labels(self.labels, self.dataset.metadata.get('background_label'))
         labels_stat = self.per_class_detection_statistics(
-            [annotation], [prediction], valid_labels, self.profiler is not None
+            [annotation], [prediction], valid_labels, self.profiler is not None, accumulate_matches=True
         )
         miss_rates = []
         for label in labels_stat:
@@ -269,7 +337,7 @@ class MissRate(BaseDetectionMetricMixin, FullDatasetEvaluationMetric, PerImageEv
     def evaluate(self, annotations, predictions):
         super().evaluate(annotations, predictions)
         valid_labels = get_valid_labels(self.labels, self.dataset.metadata.get('background_label'))
-        labels_stat = self.per_class_detection_statistics(annotations, predictions, valid_labels)
+        labels_stat = self.detection_statistics(annotations, predictions, valid_labels)
 
         miss_rates = []
         for label in labels_stat:
@@ -284,7 +352,7 @@ class MissRate(BaseDetectionMetricMixin, FullDatasetEvaluationMetric, PerImageEv
         return miss_rates
 
 
-class Recall(BaseDetectionMetricMixin, FullDatasetEvaluationMetric, PerImageEvaluationMetric):
+class Recall(StreamingDetectionMetricMixin, PerImageEvaluationMetric):
     """
     Class for evaluating recall metric of detection models.
     """
@@ -295,11 +363,16 @@ class Recall(BaseDetectionMetricMixin, FullDatasetEvaluationMetric, PerImageEval
     prediction_types = (DetectionPrediction, ActionDetectionPrediction)
 
     def update(self, annotation, prediction):
-        return self._calculate_recall([annotation], [prediction], self.profiler is not None)
+        valid_labels = get_valid_labels(self.labels, self.dataset.metadata.get('background_label'))
+        labels_stat = self.per_class_detection_statistics(
+            [annotation], [prediction], valid_labels, self.profiler is not None, accumulate_matches=True
+        )
+        return self._calculate_recall(labels_stat, annotation.identifier if self.profiler else None)
 
     def evaluate(self, annotations, predictions):
         super().evaluate(annotations, predictions)
-        recalls = self._calculate_recall(annotations, predictions)
+        valid_labels = get_valid_labels(self.labels, self.dataset.metadata.get('background_label'))
+        recalls = self._calculate_recall(self.detection_statistics(annotations, predictions, valid_labels))
         recalls, self.meta['names'] = finalize_metric_result(recalls, self.meta['names'])
         if not recalls:
             warnings.warn("No detections to compute mAP")
@@ -307,10 +380,7 @@ class Recall(BaseDetectionMetricMixin, FullDatasetEvaluationMetric, PerImageEval
 
         return recalls
 
-    def _calculate_recall(self, annotations, predictions, profile_boxes=False):
-        valid_labels = get_valid_labels(self.labels, self.dataset.metadata.get('background_label'))
-        labels_stat = self.per_class_detection_statistics(annotations, predictions, valid_labels, profile_boxes)
-
+    def _calculate_recall(self, labels_stat, profiled_identifier=None):
         recalls = []
         for label in labels_stat:
             label_recall = labels_stat[label]['recall']
@@ -319,10 +389,10 @@ class Recall(BaseDetectionMetricMixin, FullDatasetEvaluationMetric, PerImageEval
                 recalls.append(max_recall)
             else:
                 recalls.append(np.nan)
-            if profile_boxes:
+            if profiled_identifier is not None:
                 labels_stat[label]['result'] = recalls[-1]
-        if profile_boxes:
-            self.profiler.update(annotations[0].identifier, labels_stat, self.name, np.nanmean(recalls))
+        if profiled_identifier is not None:
+            self.profiler.update(profiled_identifier, labels_stat, self.name, np.nanmean(recalls))
 
         return recalls
 
@@ -497,7 +567,7 @@ def average_precision(precision, recall, integral):
 
 def bbox_match(annotation: List[DetectionAnnotation], prediction: List[DetectionPrediction], label, overlap_evaluator,
                overlap_thresh=0.5, ignore_difficult=True, allow_multiple_matches_per_ignored=True,
-               include_boundaries=True, use_filtered_tp=False):
+               include_boundaries=True, use_filtered_tp=False, stable_sort=False):
     """
     Args:
         annotation: ground truth bounding boxes.
@@ -509,6 +579,7 @@ def bbox_match(annotation: List[DetectionAnnotation], prediction: List[Detection
         allow_multiple_matches_per_ignored: allows multiple matches per ignored.
         include_boundaries: if is True then width and height of box is calculated by max - min + 1.
         use_filtered_tp: if is True then ignored object are counted during evaluation.
+        stable_sort: if is True then detections with equal scores are matched in the dataset order.
     Returns:
         tp: tp[i] == 1 if detection with i-th highest score is true positive.
         fp: fp[i] == 1 if detection with i-th highest score is false positive.
@@ -520,7 +591,7 @@ def bbox_match(annotation: List[DetectionAnnotation], prediction: List[Detection
         annotation, ignore_difficult, label
     )
     prediction_boxes, prediction_images, difficult_boxes_prediction = _prepare_prediction_boxes(
-        label, prediction, ignore_difficult
+        label, prediction, ignore_difficult, stable_sort
     )
 
     tp = np.zeros_like(prediction_images)
@@ -614,7 +685,7 @@ def _prepare_annotation_boxes(annotation, ignore_difficult, label):
     return used_boxes, num_ground_truth, difficult_boxes
 
 
-def _prepare_prediction_boxes(label, predictions, ignore_difficult):
+def _prepare_prediction_boxes(label, predictions, ignore_difficult, stable_sort=False):
     prediction_images = []
     prediction_boxes = []
     indexes = []
@@ -649,7 +720,7 @@ def _prepare_prediction_boxes(label, predictions, ignore_difficult):
 
     prediction_boxes = np.concatenate(prediction_boxes)
     difficult_boxes = np.concatenate(difficult_boxes)
-    sorted_order = np.argsort(-prediction_boxes[:, 0])
+    sorted_order = np.argsort(-prediction_boxes[:, 0], kind='stable' if stable_sort else None)
     prediction_boxes = prediction_boxes[sorted_order]
     prediction_images = np.concatenate(prediction_images)[sorted_order]
     difficult_boxes = difficult_boxes[all_label_indices]
@@ -658,6 +729,196 @@ def _prepare_prediction_boxes(label, predictions, ignore_difficult):
     return prediction_boxes, prediction_images, difficult_boxes
 
 
+class BoxMatcher:
+    """
+    Matches predicted boxes with ground truth boxes for all labels at once.
+    Overlaps between predicted and ground truth boxes of the same label are computed once per image and
+    greedy matching is resolved with vectorized operations. Results are the same as for bbox_match.
+    """
+
+    def __init__(
+            self, annotation: List[DetectionAnnotation], prediction: List[DetectionPrediction], overlap_evaluator,
+            overlap_thresh=0.5, ignore_difficult=True, allow_multiple_matches_per_ignored=True,
+            include_boundaries=True, use_filtered_tp=False, stable_sort=False
+    ):
+        self.annotation = annotation
+        self.prediction = prediction
+        self.overlap_evaluator = overlap_evaluator
+        self.overlap_thresh = overlap_thresh
+        self.ignore_difficult = ignore_difficult
+        self.allow_multiple_matches_per_ignored = allow_multiple_matches_per_ignored
+        self.include_boundaries = include_boundaries
+        self.use_filtered_tp = use_filtered_tp
+        self.stable_sort = stable_sort
+        self._prepare_annotation()
+        self._prepare_prediction()
+
+    def _difficult_mask(self, representation):
+        difficult_box_mask = np.zeros(np.shape(representation.labels), dtype=bool)
+        if self.ignore_difficult:
+            difficult_box_mask[representation.metadata.get('difficult_boxes', [])] = True
+        return difficult_box_mask
+
+    def _prepare_annotation(self):
+        identifiers = {}
+        gt_labels, gt_difficult, image_ids = [], [], []
+        for ground_truth in self.annotation:
+            gt_labels.append(ground_truth.labels)
+            gt_difficult.append(self._difficult_mask(ground_truth))
+            image_ids.append(identifiers.setdefault(ground_truth.identifier, len(identifiers)))
+        self._gt_labels = np.concatenate(gt_labels) if gt_labels else np.array([])
+        self._gt_difficult = np.concatenate(gt_difficult) if gt_difficult else np.array([], dtype=bool)
+        # used boxes are tracked per identifier, the same way as in bbox_match
+        self._image_ids = np.array(image_ids, dtype=int)
+        self._max_boxes = max([np.size(labels) for labels in gt_labels], default=0) + 1
+
+    def _prepare_prediction(self):
+        boxes, labels, images, difficult, matching = [], [], [], [], []
+        for image, prediction in enumerate(self.prediction):
+            image_boxes = np.c_[
+                prediction.scores, prediction.x_mins, prediction.y_mins, prediction.x_maxs, prediction.y_maxs
+            ]
+            boxes.append(image_boxes)
+            labels.append(prediction.labels)
+            images.append(np.full(np.shape(prediction.labels), image, dtype=int))
+            difficult.append(self._difficult_mask(prediction))
+            matching.append(self._match_image(image_boxes[:, 1:], prediction.labels, self.annotation[image]))
+        if not boxes:
+            boxes, labels, images, difficult = [np.zeros((0, 5))], [np.array([])], [np.array([], dtype=int)], [
+                np.array([], dtype=bool)
+            ]
+            matching = [(np.array([]), np.array([], dtype=int)) + (np.array([], dtype=bool), ) * 3]
+        self._boxes, self._labels, self._images, self._difficult = (
+            np.concatenate(values) for values in (boxes, labels, images, difficult)
+        )
+        self._max_overlaps, self._matched_gt, self._ties, self._has_gt, self._matched_difficult = (
+            np.concatenate(values) for values in zip(*matching)
+        )
+
+    def _match_image(self, prediction_boxes, prediction_labels, ground_truth):
+        num_predictions, num_gt = np.size(prediction_labels), np.size(ground_truth.labels)
+        same_label = np.reshape(
+            np.asarray(prediction_labels)[:, np.newaxis] == np.asarray(ground_truth.labels)[np.newaxis, :],
+            (num_predictions, num_gt)
+        )
+        if not num_gt:
+            empty = np.zeros(num_predictions, dtype=bool)
+            return np.full(num_predictions, -np.inf), np.zeros(num_predictions, dtype=int), empty, empty, empty
+
+        annotation_difficult = self._difficult_mask(ground_truth)
+        prediction_box = tuple(prediction_boxes[:, coord, np.newaxis] for coord in range(4))
+        annotation_boxes = ground_truth.x_mins, ground_truth.y_mins, ground_truth.x_maxs, ground_truth.y_maxs
+        overlaps = self.overlap_evaluator(prediction_box, annotation_boxes)
+        if self.ignore_difficult and self.allow_multiple_matches_per_ignored and annotation_difficult.any():
+            ignored_overlaps = IOA(self.include_boundaries).evaluate(prediction_box, annotation_boxes)
+            overlaps = np.where(annotation_difficult, ignored_overlaps, overlaps)
+
+        ignored = same_label & annotation_difficult
+        max_overlap = np.max(np.where(same_label & ~annotation_difficult, overlaps, -np.inf), axis=1)
+        max_ignored_overlap = np.max(np.where(ignored, overlaps, -np.inf), axis=1)
+        use_ignored = (max_overlap < self.overlap_thresh) & ignored.any(axis=1)
+        max_overlap = np.where(use_ignored, max_ignored_overlap, max_overlap)
+        max_overlapped = same_label & (overlaps == max_overlap[:, np.newaxis])
+        matched_gt = np.argmax(max_overlapped, axis=1)
+
+        return (
+            max_overlap, matched_gt, np.sum(max_overlapped, axis=1) > 1, same_label.any(axis=1),
+            annotation_difficult[matched_gt]
+        )
+
+    def number_ground_truth(self, label):
+        label_boxes = self._gt_labels == label
+        if not self.ignore_difficult:
+            return np.sum(label_boxes)
+        return np.sum(label_boxes) - np.sum(label_boxes & self._gt_difficult)
+
+    def match(self, label):
+        """
+        Returns the same values as bbox_match for provided label.
+        """
+        label_mask = self._labels == label
+        sorted_order = np.argsort(-self._boxes[label_mask][:, 0], kind='stable' if self.stable_sort else None)
+        prediction_boxes, prediction_images, difficult_prediction = (
+            values[label_mask][sorted_order] for values in (self._boxes, self._images, self._difficult)
+        )
+        max_overlaps, matched_gt, ties, has_gt, matched_difficult = (
+            values[label_mask][sorted_order]
+            for values in (self._max_overlaps, self._matched_gt, self._ties, self._has_gt, self._matched_difficult)
+        )
+        matched = has_gt & (max_overlaps >= self.overlap_thresh)
+        if np.any(ties & matched):
+            # several ground truth boxes have the same overlap, each of them may be already used
+            return bbox_match(
+                self.annotation, self.prediction, label, self.overlap_evaluator, self.overlap_thresh,
+                self.ignore_difficult, self.allow_multiple_matches_per_ignored, self.include_boundaries,
+                self.use_filtered_tp, self.stable_sort
+            )
+
+        tp = np.zeros_like(prediction_images)
+        fp = np.zeros_like(prediction_images)
+        false_positive = (~difficult_prediction).astype(fp.dtype)
+        fp[~has_gt] = 1
+        below_threshold = has_gt & ~matched
+        fp[below_threshold] = false_positive[below_threshold]
+
+        keys = self._image_ids[prediction_images] * self._max_boxes + matched_gt
+        regular = matched & ~matched_difficult
+        eligible = regular & (not self.ignore_difficult or self.use_filtered_tp or ~difficult_prediction)
+        first_used = self._first_positions(keys, eligible)
+        true_positive = eligible & (first_used == np.arange(keys.size))
+        tp[true_positive] = 1
+        used_before = regular & (first_used < np.arange(keys.size))
+        fp[used_before] = false_positive[used_before]
+
+        if self.ignore_difficult and not self.allow_multiple_matches_per_ignored:
+            ignored = matched & matched_difficult
+            used_before = ignored & (self._first_positions(keys, ignored) < np.arange(keys.size))
+            fp[used_before] = false_positive[used_before]
+
+        max_overlapped_dt = defaultdict(list)
+        for box_index in np.where(true_positive)[0]:
+            ground_truth = self.annotation[prediction_images[box_index]]
+            label_box_index = np.sum(ground_truth.labels[:matched_gt[box_index]] == label)
+            max_overlapped_dt[box_index].append(np.array([label_box_index]))
+
+        overlaps = self._last_overlaps(prediction_boxes, prediction_images, has_gt, label)
+
+        return (
+            tp, fp, prediction_boxes[:, 0], self.number_ground_truth(label),
+            max_overlapped_dt, prediction_boxes[:, 1:], overlaps
+        )
+
+    @staticmethod
+    def _first_positions(keys, marked):
+        # position of the first marked box for each key, number of boxes if key is not marked
+        first_positions = np.full(keys.size, keys.size)
+        if not np.any(marked):
+            return first_positions
+        marked_keys, first_index = np.unique(keys[marked], return_index=True)
+        key_index = np.minimum(np.searchsorted(marked_keys, keys), marked_keys.size - 1)
+        found = marked_keys[key_index] == keys
+        first_positions[found] = np.where(marked)[0][first_index][key_index[found]]
+        return first_positions
+
+    def _last_overlaps(self, prediction_boxes, prediction_images, has_gt, label):
+        evaluated = np.where(has_gt)[0]
+        if not evaluated.size:
+            return np.array([])
+        box_index = evaluated[-1]
+        ground_truth = self.annotation[prediction_images[box_index]]
+        idx = ground_truth.labels == label
+        prediction_box = prediction_boxes[box_index][1:]
+        annotation_boxes = (
+            ground_truth.x_mins[idx], ground_truth.y_mins[idx], ground_truth.x_maxs[idx], ground_truth.y_maxs[idx]
+        )
+        overlaps = self.overlap_evaluator(prediction_box, annotation_boxes)
+        if self.ignore_difficult and self.allow_multiple_matches_per_ignored:
+            ignored = np.where(self._difficult_mask(ground_truth)[idx])[0]
+            ignored_annotation_boxes = tuple(boxes[ignored] for boxes in annotation_boxes)
+            overlaps[ignored] = IOA(self.include_boundaries).evaluate(prediction_box, ignored_annotation_boxes)
+        return overlaps
+
+
 def get_valid_labels(labels, background):
     return list(filter(lambda label: label != background, labels))
 
@@ -46,6 +46,110 @@ def set_scores(prediction, scores):
 def set_box_scores(prediction, scores):
     prediction.bbox_scores = scores
 
+
+def remove_suppressed(prediction, keep):
+    suppressed = np.ones(len(prediction.x_mins), dtype=bool)
+    suppressed[np.asarray(keep, dtype=int)] = False
+    prediction.remove(np.flatnonzero(suppressed))
+
+
+def box_overlaps(x1, y1, x2, y2, rows, cols, include_boundaries=True, use_min_area=False, distance_penalty=False):
+    """
+    Computes overlap matrix between boxes with indexes rows and boxes with indexes cols.
+    Element-wise operations are the same as in one box to many boxes comparison, so results are bit-identical.
+    """
+    b = 1 if include_boundaries else 0
+    rx1, ry1, rx2, ry2 = x1[rows, np.newaxis], y1[rows, np.newaxis], x2[rows, np.newaxis], y2[rows, np.newaxis]
+    cx1, cy1, cx2, cy2 = x1[np.newaxis, cols], y1[np.newaxis, cols], x2[np.newaxis, cols], y2[np.newaxis, cols]
+    rows_areas = (rx2 - rx1 + b) * (ry2 - ry1 + b)
+    cols_areas = (cx2 - cx1 + b) * (cy2 - cy1 + b)
+
+    w = np.maximum(0.0, np.minimum(rx2, cx2) - np.maximum(rx1, cx1) + b)
+    h = np.maximum(0.0, np.minimum(ry2, cy2) - np.maximum(ry1, cy1) + b)
+    intersection = w * h
+
+    if use_min_area:
+        base_area = np.minimum(rows_areas, cols_areas)
+    else:
+        base_area = (rows_areas + cols_areas - intersection)
+
+    overlap = np.divide(
+        intersection,
+        base_area,
+        out=np.zeros_like(intersection, dtype=float),
+        where=base_area != 0
+    )
+    if not distance_penalty:
+        return overlap
+
+    cw = np.maximum(rx2, cx2) - np.minimum(rx1, cx1)
+    ch = np.maximum(ry2, cy2) - np.minimum(ry1, cy1)
+    c_area = cw**2 + ch**2 + 1e-16
+    d_1 = ((cx2 + cx1) - (rx2 + rx1))**2 / 4
+    d_2 = ((cy2 + cy1) - (ry2 + ry1))**2 / 4
+    d_area = d_1 + d_2
+
+    return overlap - pow(d_area / c_area, 0.6)
+
+
+def batched_nms(
+        x1, y1, x2, y2, scores, thresh, labels=None, include_boundaries=True, keep_top_k=None,
+        use_min_area=False, distance_penalty=False, block_size=256
+):
+    """
+    Greedy NMS for all boxes at once. If labels provided, boxes suppress only boxes with the same label.
+    """
+    x1, y1, x2, y2, scores = (np.asarray(values) for values in (x1, y1, x2, y2, scores))
+    if labels is None:
+        orders = [scores.argsort()[::-1]]
+    else:
+        labels = np.asarray(labels)
+        orders = []
+        for label in np.unique(labels):
+            label_ids = np.flatnonzero(labels == label)
+            orders.append(label_ids[scores[label_ids].argsort()[::-1]])
+
+    keep = []
+    for order in orders:
+        if keep_top_k:
+            order = order[:keep_top_k]
+        keep.extend(order[~greedy_suppression(
+            x1, y1, x2, y2, order, thresh, include_boundaries, use_min_area, distance_penalty, block_size
+        )])
+
+    return keep
+
+
+def greedy_suppression(
+        x1, y1, x2, y2, order, thresh, include_boundaries=True, use_min_area=False, distance_penalty=False,
+        block_size=256
+):
+    """
+    Returns suppression mask for boxes sorted by score in order.
+    Boxes are processed by blocks: greedy selection is resolved inside the block,
+    then all kept boxes of the block suppress the remaining boxes at once.
+    """
+    suppressed = np.zeros(order.size, dtype=bool)
+    for start in range(0, order.size, block_size):
+        # positions of not suppressed boxes, first ones up to the block end are candidates for keeping
+        remaining = start + np.flatnonzero(~suppressed[start:])
+        block = np.searchsorted(remaining, start + block_size)
+        if not block:
+            continue
+        overlaps = box_overlaps(
+            x1, y1, x2, y2, order[remaining[:block]], order[remaining], include_boundaries, use_min_area,
+            distance_penalty
+        )
+        suppress = ~(overlaps <= thresh)
+        kept = np.ones(block, dtype=bool)
+        for row in range(block):
+            if kept[row]:
+                kept[row + 1:] &= ~suppress[row, row + 1:block]
+        suppressed[remaining[:block][~kept]] = True
+        suppressed[remaining[block:]] |= np.any(suppress[kept, block:], axis=0)
+
+    return suppressed
+
 class NMS(Postprocessor):
     __provider__ = 'nms'
 
@@ -67,6 +171,9 @@ class NMS(Postprocessor):
             'use_min_area': BoolField(
                 optional=True, default=False,
                 description="Use minimum area of two bounding boxes as base area to calculate overlap"
+            ),
+            'per_class': BoolField(
+                optional=True, default=False, description="Suppress only detections with the same label."
             )
         })
         return parameters
@@ -76,60 +183,27 @@ class NMS(Postprocessor):
         self.include_boundaries = self.get_value_from_config('include_boundaries')
         self.keep_top_k = self.get_value_from_config('keep_top_k')
         self.use_min_area = self.get_value_from_config('use_min_area')
+        self.per_class = self.get_value_from_config('per_class')
 
     def process_image(self, annotations, predictions):
         for prediction in predictions:
             scores = get_scores(prediction)
             keep = self.nms(
                 prediction.x_mins, prediction.y_mins, prediction.x_maxs, prediction.y_maxs, scores,
-                self.overlap, self.include_boundaries, self.keep_top_k, self.use_min_area
+                self.overlap, self.include_boundaries, self.keep_top_k, self.use_min_area,
+                prediction.labels if self.per_class else None
             )
-            prediction.remove([box for box in range(len(prediction.x_mins)) if box not in keep])
+            remove_suppressed(prediction, keep)
 
         return annotations, predictions
 
     @staticmethod
-    def nms(x1, y1, x2, y2, scores, thresh, include_boundaries=True, keep_top_k=None, use_min_area=False):
-        """
-        Pure Python NMS baseline.
-        """
-        b = 1 if include_boundaries else 0
-
-        areas = (x2 - x1 + b) * (y2 - y1 + b)
-        order = scores.argsort()[::-1]
-
-        if keep_top_k:
-            order = order[:keep_top_k]
-
-        keep = []
-
-        while order.size > 0:
-            i = order[0]
-            keep.append(i)
-
-            xx1 = np.maximum(x1[i], x1[order[1:]])
-            yy1 = np.maximum(y1[i], y1[order[1:]])
-            xx2 = np.minimum(x2[i], x2[order[1:]])
-            yy2 = np.minimum(y2[i], y2[order[1:]])
-
-            w = np.maximum(0.0, xx2 - xx1 + b)
-            h = np.maximum(0.0, yy2 - yy1 + b)
-            intersection = w * h
-
-            if use_min_area:
-                base_area = np.minimum(areas[i], areas[order[1:]])
-            else:
-                base_area = (areas[i] + areas[order[1:]] - intersection)
-
-            overlap = np.divide(
-                intersection,
-                base_area,
-                out=np.zeros_like(intersection, dtype=float),
-                where=base_area != 0
-            )
-            order = order[np.where(overlap <= thresh)[0] + 1] # pylint: disable=W0143
-
-        return keep
+    def nms(
+            x1, y1, x2, y2, scores, thresh, include_boundaries=True, keep_top_k=None, use_min_area=False, labels=None
+    ):
+        return batched_nms(
+            x1, y1, x2, y2, scores, thresh, labels, include_boundaries, keep_top_k, use_min_area
+        )
 
 class SoftNMS(Postprocessor):
     __provider__ = 'soft_nms'
@@ -170,7 +244,7 @@ class SoftNMS(Postprocessor):
             keep, new_scores = self._nms(
                 np.c_[prediction.x_mins, prediction.y_mins, prediction.x_maxs, prediction.y_maxs], scores,
             )
-            prediction.remove([box for box in range(len(prediction.x_mins)) if box not in keep])
+            remove_suppressed(prediction, keep)
             set_scores(prediction, new_scores)
 
         return annotations, predictions
@@ -248,7 +322,10 @@ class DIoUNMS(Postprocessor):
             'include_boundaries': BoolField(
                 optional=True, default=True, description="Shows if boundaries are included."
             ),
-            'keep_top_k': NumberField(min_value=0, optional=True, description="Keep top K.")
+            'keep_top_k': NumberField(min_value=0, optional=True, description="Keep top K."),
+            'per_class': BoolField(
+                optional=True, default=False, description="Suppress only detections with the same label."
+            )
         })
         return parameters
 
@@ -256,59 +333,25 @@ class DIoUNMS(Postprocessor):
         self.overlap = self.get_value_from_config('overlap')
         self.include_boundaries = self.get_value_from_config('include_boundaries')
         self.keep_top_k = self.get_value_from_config('keep_top_k')
+        self.per_class = self.get_value_from_config('per_class')
 
     def process_image(self, annotations, predictions):
         for prediction in predictions:
             scores = get_scores(prediction)
             keep = self.diou_nms(
                 prediction.x_mins, prediction.y_mins, prediction.x_maxs, prediction.y_maxs, scores,
-                self.overlap, self.include_boundaries, self.keep_top_k
+                self.overlap, self.include_boundaries, self.keep_top_k,
+                labels=prediction.labels if self.per_class else None
             )
-            prediction.remove([box for box in range(len(prediction.x_mins)) if box not in keep])
+            remove_suppressed(prediction, keep)
 
         return annotations, predictions
 
     @staticmethod
-    def diou_nms(x1, y1, x2, y2, scores, thresh, include_boundaries=True, keep_top_k=None, use_min_area=False):
-
-        b = 1 if include_boundaries else 0
-
-        areas = (x2 - x1 + b) * (y2 - y1 + b)
-        order = scores.argsort()[::-1]
-
-        if keep_top_k:
-            order = order[:keep_top_k]
-
-        keep = []
-
-        while order.size > 0:
-            i = order[0]
-            keep.append(i)
-
-            xx1 = np.maximum(x1[i], x1[order[1:]])
-            yy1 = np.maximum(y1[i], y1[order[1:]])
-            xx2 = np.minimum(x2[i], x2[order[1:]])
-            yy2 = np.minimum(y2[i], y2[order[1:]])
-
-            w = np.maximum(0.0, xx2 - xx1 + b)
-            h = np.maximum(0.0, yy2 - yy1 + b)
-            intersection = w * h
-
-            cw = np.maximum(x2[i], x2[order[1:]]) - np.minimum(x1[i], x1[order[1:]])
-            ch = np.maximum(y2[i], y2[order[1:]]) - np.minimum(y1[i], y1[order[1:]])
-            c_area = cw**2 + ch**2 + 1e-16
-            d_1 = ((x2[order[1:]] + x1[order[1:]]) - (x2[i] + x1[i]))**2 / 4
-            d_2 = ((y2[order[1:]] + y1[order[1:]]) - (y2[i] + y1[i]))**2 / 4
-            d_area = d_1 + d_2
-
-            base_area = (areas[i] + areas[order[1:]] - intersection)
-
-            overlap = np.divide(
-                intersection,
-                base_area,
-                out=np.zeros_like(intersection, dtype=float),
-                where=base_area != 0
-            ) - pow(d_area / c_area, 0.6)
-            order = order[np.where(overlap <= thresh)[0] + 1] # pylint: disable=W0143
-
-        return keep
+    def diou_nms(
+            x1, y1, x2, y2, scores, thresh, include_boundaries=True, keep_top_k=None, use_min_area=False, labels=None
+    ):
+        return batched_nms(
+            x1, y1, x2, y2, scores, thresh, labels, include_boundaries, keep_top_k, use_min_area,
+            distance_penalty=True
+        )
@@ -17,7 +17,7 @@ limitations under the License.
 import numpy as np
 import pytest
 
-from accuracy_checker.adapters import SSDAdapter, Adapter
+from accuracy_checker.adapters import SSDAdapter, Adapter, YoloV3Adapter
 from accuracy_checker.config import ConfigError
 from .common import make_representation
 
@@ -74,6 +74,24 @@ def test_detection_adapter_batch_2():
     assert np.array_equal(actual, expected)
 
 
+def test_yolo_v3_adapter_decodes_boxes_above_threshold():
+    output = np.zeros((1, 7, 2, 2), dtype=np.float32)
+    output[0, :, 0, 1] = [0.5, 0.25, 0, 0, 0.9, 0.2, 0.8]
+    output[0, :, 1, 0] = [0.5, 0.5, 0, 0, 0.05, 0.6, 0.4]
+    adapter = YoloV3Adapter({
+        'type': 'yolo_v3', 'classes': 2, 'num': 1, 'anchors': '2,3', 'outputs': ['out'], 'cells': [2],
+        'threshold': 0.1
+    })
+
+    prediction = adapter.process({'out': output}, ['0'], [{'input_shape': {'data': (1, 3, 4, 4)}}])[0]
+
+    assert np.array_equal(prediction.labels, [1])
+    assert np.allclose(prediction.scores, [0.72])
+    assert np.allclose(
+        [prediction.x_mins, prediction.y_mins, prediction.x_maxs, prediction.y_maxs], [[0.5], [-0.25], [1], [0.5]]
+    )
+
+
 def test_dictionary_adapter_no_raise_warning_on_specific_args():
     adapter_config = {'type': 'age_gender', 'gender_out': 'gender', 'age_out': 'age'}
     with pytest.warns(None) as record:
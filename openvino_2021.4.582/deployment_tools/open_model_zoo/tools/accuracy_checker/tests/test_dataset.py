@@ -19,9 +19,10 @@ from pathlib import Path
 import pytest
 from .common import make_representation
 from accuracy_checker.config import ConfigError
+from accuracy_checker.annotation_converters import IndexedAnnotation, make_subset, save_annotation
 from accuracy_checker.annotation_converters.format_converter import ConverterReturn
 
-from accuracy_checker.dataset import Dataset
+from accuracy_checker.dataset import Dataset, DataProvider, AnnotationProvider, read_annotation
 
 
 def copy_dataset_config(config):
@@ -386,3 +387,153 @@ class TestAnnotationConversion:
         assert len(dataset.data_provider) == 1
         assert dataset.identifiers == ['1']
         assert dataset.data_provider.full_size == 2
+
+
+class MockDataReader:
+    name = 'mock_reader'
+    data_source = None
+
+    def __init__(self):
+        self.read_identifiers = []
+
+    def __call__(self, identifier):
+        self.read_identifiers.append(identifier)
+        return 'data_{}'.format(identifier)
+
+    def reset(self):
+        pass
+
+
+class TestDataProviderDataList:
+    def test_explicit_data_list_is_not_stored_as_subset(self, tmp_path):
+        subset_file = tmp_path / 'subset.yml'
+        provider = DataProvider(
+            MockDataReader(), dataset_config={
+                'name': 'custom', 'store_subset': True, 'subset_file': str(subset_file)
+            }, data_list=[0, 1]
+        )
+
+        assert provider.identifiers == [0, 1]
+        assert not provider.store_subset
+        assert not subset_file.exists()
+
+
+class TestDataProviderPrefetching:
+    @staticmethod
+    def create_provider(reader_config, batch=2):
+        return DataProvider(
+            MockDataReader(), dataset_config={'name': 'custom', 'reader': reader_config},
+            data_list=list(range(7)), batch=batch
+        )
+
+    def test_prefetching_disabled_by_default(self):
+        provider = self.create_provider('opencv_imread')
+
+        _, _, batch_input, _ = provider[0]
+
+        assert provider.prefetch == 0
+        assert batch_input == ['data_0', 'data_1']
+        assert provider.data_reader.read_identifiers == [0, 1]
+
+    def test_prefetching_returns_batches_in_order(self):
+        provider = self.create_provider({'type': 'opencv_imread', 'prefetch': 2, 'workers': 3})
+
+        batches = [provider[batch_id] for batch_id in range(4)]
+
+        assert [batch_input for _, _, batch_input, _ in batches] == [
+            ['data_0', 'data_1'], ['data_2', 'data_3'], ['data_4', 'data_5'], ['data_6']
+        ]
+        assert sorted(provider.data_reader.read_identifiers) == list(range(7))
+
+    def test_prefetching_respects_subset(self):
+        provider = self.create_provider({'type': 'opencv_imread', 'prefetch': 1})
+        provider.make_subset(ids=[5, 3, 1])
+
+        batches = [provider[batch_id] for batch_id in range(2)]
+
+        assert [batch_input for _, _, batch_input, _ in batches] == [['data_5', 'data_3'], ['data_1']]
+        assert [batch_identifiers for _, _, _, batch_identifiers in batches] == [[5, 3], [1]]
+
+    def test_prefetching_uses_single_worker_by_default(self):
+        provider = self.create_provider({'type': 'opencv_imread', 'prefetch': 4})
+
+        assert provider.prefetch == 4
+        assert provider.prefetch_workers == 1
+
+    def test_prefetching_uses_single_worker_for_sequential_reader(self):
+        data_reader = MockDataReader()
+        data_reader.name = 'opencv_capture'
+
+        with pytest.warns(UserWarning):
+            provider = DataProvider(
+                data_reader, dataset_config={'name': 'custom', 'reader': {'prefetch': 2, 'workers': 4}},
+                data_list=list(range(7)), batch=2
+            )
+
+        assert provider.prefetch_workers == 1
+
+    def test_prefetched_batches_dropped_on_reset(self):
+        provider = self.create_provider({'type': 'opencv_imread', 'prefetch': 2})
+        provider[0]
+
+        provider.reset()
+
+        assert not provider._prefetched_batches
+        assert provider._prefetch_executor is None
+
+
+class TestIndexedAnnotation:
+    def test_saved_annotation_read_lazily(self, tmp_path):
+        annotation = make_representation(['0 0 0 5 5', '0 1 1 10 10', '1 2 2 6 6'], True)
+        annotation_file = tmp_path / 'annotation.pickle'
+        save_annotation(annotation, None, annotation_file, None, {'name': 'custom'})
+
+        loaded_annotation = read_annotation(annotation_file)
+
+        assert isinstance(loaded_annotation, IndexedAnnotation)
+        assert len(loaded_annotation) == 3
+        assert loaded_annotation.loaded_size == 0
+        assert loaded_annotation.identifiers == [ann.identifier for ann in annotation]
+        assert loaded_annotation[1].identifier == annotation[1].identifier
+        assert loaded_annotation[1] is loaded_annotation[1]
+        assert loaded_annotation.loaded_size == 1
+
+    def test_indexed_annotation_subset_loads_only_selected(self, tmp_path):
+        annotation = make_representation(['0 {} 0 5 5'.format(idx) for idx in range(10)], True)
+        annotation_file = tmp_path / 'annotation.pickle'
+        save_annotation(annotation, None, annotation_file, None)
+
+        loaded_annotation = read_annotation(annotation_file)
+        subset = make_subset(loaded_annotation, 3, 666)
+
+        assert [ann.identifier for ann in subset] == [
+            ann.identifier for ann in make_subset(annotation, 3, 666)
+        ]
+        assert loaded_annotation.loaded_size == 4
+
+    def test_annotation_provider_with_indexed_annotation(self, tmp_path):
+        annotation = make_representation(['0 0 0 5 5', '0 1 1 10 10'], True)
+        annotation_file = tmp_path / 'annotation.pickle'
+        save_annotation(annotation, None, annotation_file, None)
+        loaded_annotation = read_annotation(annotation_file)
+
+        provider = AnnotationProvider(loaded_annotation, {})
+
+        assert len(provider) == 2
+        assert provider.identifiers == [ann.identifier for ann in annotation]
+        assert loaded_annotation.loaded_size == 0
+        assert provider[annotation[1].identifier].identifier == annotation[1].identifier
+        assert loaded_annotation.loaded_size == 1
+
+    def test_outdated_index_ignored(self, tmp_path):
+        annotation = make_representation(['0 0 0 5 5', '0 1 1 10 10'], True)
+        annotation_file = tmp_path / 'annotation.pickle'
+        save_annotation(annotation, None, annotation_file, None)
+        with annotation_file.open('ab') as content:
+            annotation[0].dump(content)
+
+        with pytest.warns(UserWarning):
+            loaded_annotation = read_annotation(annotation_file)
+
+        assert isinstance(loaded_annotation, list)
+        assert len(loaded_annotation) == 3
@@ -17,7 +17,7 @@ limitations under the License.
 import pytest
 import numpy as np
 from accuracy_checker.metrics import DetectionMAP
-from accuracy_checker.metrics.detection import Recall, bbox_match
+from accuracy_checker.metrics.detection import Recall, BoxMatcher, bbox_match
 from accuracy_checker.metrics.overlap import IOU, IOA
 from tests.common import (make_representation, single_class_dataset, multi_class_dataset,
                           multi_class_dataset_without_background)
@@ -319,6 +319,51 @@ class TestBoxMatch:
         assert fp[1] == 1
 
 
+class TestBoxMatcher:
+    @staticmethod
+    def _assert_same_as_bbox_match(gt, pred, labels, **kwargs):
+        overlap_evaluator = IOU({})
+        matcher = BoxMatcher(gt, pred, overlap_evaluator, **kwargs)
+        for label in labels:
+            expected = bbox_match(gt, pred, label, overlap_evaluator, **kwargs)
+            actual = matcher.match(label)
+            for expected_value, actual_value in zip(expected[:4], actual[:4]):
+                assert np.array_equal(expected_value, actual_value)
+            assert expected[4].keys() == actual[4].keys()
+            assert np.array_equal(expected[5], actual[5])
+            assert np.array_equal(expected[6], actual[6])
+
+    def test_multiple_labels(self):
+        gt = make_representation(["0 0 0 5 5; 1 10 10 20 20", "1 0 0 5 5; 0 3 3 9 9"], is_ground_truth=True)
+        pred = make_representation(
+            ["0.9 0 0 0 5 5; 0.8 1 10 10 20 20; 0.7 0 0 0 5 5", "0.6 1 0 0 5 5; 0.5 0 10 10 20 20"]
+        )
+
+        self._assert_same_as_bbox_match(gt, pred, [0, 1])
+
+    def test_difficult_boxes(self):
+        gt = make_representation(["0 0 0 5 5; 0 10 10 20 20", "0 0 0 5 5"], is_ground_truth=True)
+        pred = make_representation(["1 0 0 0 5 5; 0.9 0 10 10 20 20; 0.8 0 10 10 20 20", "0.7 0 0 0 5 5"])
+        gt[0].metadata['difficult_boxes'] = [1]
+        pred[1].metadata['difficult_boxes'] = [0]
+
+        self._assert_same_as_bbox_match(gt, pred, [0], allow_multiple_matches_per_ignored=False)
+        self._assert_same_as_bbox_match(gt, pred, [0], allow_multiple_matches_per_ignored=True)
+        self._assert_same_as_bbox_match(gt, pred, [0], ignore_difficult=False)
+
+    def test_equal_overlaps(self):
+        gt = make_representation("0 0 0 10 10; 0 0 0 10 10", is_ground_truth=True)
+        pred = make_representation("1 0 0 0 10 10; 0.9 0 0 0 10 10; 0.8 0 0 0 10 10")
+
+        self._assert_same_as_bbox_match(gt, pred, [0])
+
+    def test_no_predictions(self):
+        gt = make_representation("0 0 0 5 5", is_ground_truth=True)
+        pred = make_representation("", score=1)
+
+        self._assert_same_as_bbox_match(gt, pred, [0])
+
+
 class TestRecall:
     def test_one_object(self):
         gt = make_representation(["0 0 0 5 5"], is_ground_truth=True)
@@ -457,3 +502,58 @@ class TestMAP:
         metric = _test_metric_wrapper(Recall, multi_class_dataset_without_background())
         assert 0 == metric(gt, pred)[0]
         assert metric.meta.get('names') == ['cat']
+
+    def test_accumulated_statistics_equal_to_full_dataset(self):
+        gt = make_representation(["0 0 0 5 5; 1 10 10 20 20", "1 0 0 5 5; 0 0 0 5 5"], is_ground_truth=True)
+        pred = make_representation(
+            ["0.9 0 0 0 5 5; 0.8 1 10 10 20 20; 0.7 0 10 10 20 20", "0.6 1 0 0 5 5; 0.5 0 0 0 6 6"]
+        )
+        full_dataset_map = _test_metric_wrapper(DetectionMAP, multi_class_dataset())(gt, pred)
+
+        metric = _test_metric_wrapper(DetectionMAP, multi_class_dataset())
+        for annotation, prediction in zip(gt, pred):
+            metric.submit(annotation, prediction)
+
+        assert metric([], []) == full_dataset_map
+
+    def test_accumulated_statistics_equal_to_stable_full_dataset_matching_with_tied_scores(self):
+        rng = np.random.RandomState(0)
+        gt, pred = [], []
+        for _ in range(20):
+            gt_boxes = rng.randint(0, 20, size=(3, 2))
+            pred_boxes = rng.randint(0, 20, size=(40, 2))
+            gt.append('; '.join('{} {} {} {} {}'.format(rng.randint(2), x, y, x + 5, y + 5) for x, y in gt_boxes))
+            pred.append('; '.join('{} {} {} {} {} {}'.format(
+                rng.choice([0.3, 0.6, 0.9]), rng.randint(2), x, y, x + 5, y + 5
+            ) for x, y in pred_boxes))
+        gt = make_representation(gt, is_ground_truth=True)
+        pred = make_representation(pred)
+
+        metric = _test_metric_wrapper(DetectionMAP, multi_class_dataset())
+        for annotation, prediction in zip(gt, pred):
+            metric.submit(annotation, prediction)
+        accumulated_stat = metric.accumulated_detection_statistics([0, 1])
+
+        matcher = BoxMatcher(
+            gt, pred, metric.overlap_method, metric.overlap_threshold, metric.ignore_difficult,
+            metric.allow_multiple_matches_per_ignored, metric.include_boundaries, metric.use_filtered_tp,
+            stable_sort=True
+        )
+        for label in [0, 1]:
+            tp, fp, conf, n = matcher.match(label)[:4]
+            expected_stat = metric._label_statistics(tp, fp, conf, n, len(gt))
+            for key in ('precision', 'recall', 'thresholds', 'fppi'):
+                assert np.array_equal(accumulated_stat[label][key], expected_stat[key])
+
+    def test_reset_clears_accumulated_statistics(self):
+        gt = make_representation(["0 0 0 5 5"], is_ground_truth=True)
+        pred = make_representation(["0 10 10 20 20"], score=1)
+        metric = _test_metric_wrapper(Recall, single_class_dataset())
+        metric.submit(gt[0], pred[0])
+        metric.reset()
+
+        gt = make_representation(["0 0 0 5 5"], is_ground_truth=True)
+        pred = make_representation(["0 0 0 5 5"], score=1)
+        metric.submit(gt[0], pred[0])
+
+        assert metric([], []) == [1.0]
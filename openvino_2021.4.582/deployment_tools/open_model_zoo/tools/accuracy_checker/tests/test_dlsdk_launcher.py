@@ -154,6 +154,27 @@ class TestDLSDKLauncherInfer:
         dlsdk_test_model = get_dlsdk_test_model(models_dir, {'batch': 2})
         assert dlsdk_test_model.batch == 2
 
+    def test_dlsdk_launcher_compiled_network_key_depends_on_input_shapes(self, models_dir, tmp_path):
+        cache_config = {'_compiled_network_cache_dir': str(tmp_path)}
+        first_model = get_dlsdk_test_model(models_dir, cache_config)
+        second_model = get_dlsdk_test_model(models_dir, cache_config)
+        batched_model = get_dlsdk_test_model(models_dir, {**cache_config, 'batch': 2})
+
+        assert first_model._compiled_network_key() == second_model._compiled_network_key()
+        assert first_model._compiled_network_key() != batched_model._compiled_network_key()
+
+    def test_dlsdk_launcher_compiled_network_key_depends_on_provided_network(self, models_dir, tmp_path):
+        cache_config = {'_compiled_network_cache_dir': str(tmp_path)}
+        dlsdk_test_model = get_dlsdk_test_model(models_dir, cache_config)
+        original_key = dlsdk_test_model._compiled_network_key()
+        network = dlsdk_test_model.network
+        input_name = next(iter(network.input_info))
+        input_shape = list(network.input_info[input_name].input_data.shape)
+        network.reshape({input_name: [2] + input_shape[1:]})
+        dlsdk_test_model.load_network(network)
+
+        assert dlsdk_test_model._compiled_network_key() != original_key
+
     @pytest.mark.skipif(no_available_myriad(), reason='no myriad device in the system')
     def test_dlsdk_launcher_import_network(self, data_dir, models_dir):
         dlsdk_test_model = get_dlsdk_test_blob(models_dir)
@@ -253,6 +274,44 @@ class TestDLSDKLauncher:
         subprocess_mock.assert_called_once_with(['aocl', 'program', 'acl0', 'custom_bitstream'], check=True)
         launcher.release()
 
+    def test_compiled_network_cache_skipped_for_device_without_export_support(self):
+        config = {
+            'framework': 'dlsdk',
+            'weights': 'custom_weights',
+            'model': 'custom_model',
+            'device': 'cpu',
+            'adapter': 'classification',
+            '_compiled_network_cache_dir': Path('compiled_networks')
+        }
+        launcher = create_launcher(config, model_name='custom')
+        launcher.ie_core.get_metric.reset_mock()
+        launcher.ie_core.get_metric.return_value = []
+        launcher.network.serialize.reset_mock()
+        launcher._import_export_supported = None
+
+        launcher._load_exec_network()
+        launcher._load_exec_network()
+
+        assert launcher.ie_core.get_metric.call_count == 1
+        assert not launcher.ie_core.import_network.called
+        assert not launcher.network.serialize.called
+
+    def test_compiled_network_hash_computed_once_for_network(self, mocker):
+        mocker.patch('builtins.open', mocker.mock_open(read_data=b''))
+        config = {
+            'framework': 'dlsdk',
+            'weights': 'custom_weights',
+            'model': 'custom_model',
+            'device': 'cpu',
+            'adapter': 'classification'
+        }
+        launcher = create_launcher(config, model_name='custom')
+
+        launcher._compiled_network_key()
+        launcher._compiled_network_key()
+
+        launcher.network.serialize.assert_called_once()
+
     def test_program_bitstream_when_fpga_in_hetero_device(self, mocker):
         subprocess_mock = mocker.patch('subprocess.run')
         config = {
@@ -17,7 +17,7 @@ limitations under the License.
 import pytest
 import numpy as np
 from accuracy_checker.launcher import DummyLauncher
-from accuracy_checker.launcher.loaders import StoredPredictionBatch
+from accuracy_checker.launcher.loaders import StoredPredictionBatch, ColumnarPredictionsStorage
 from accuracy_checker.adapters import ClassificationAdapter
 from accuracy_checker.representation import ClassificationPrediction
 
@@ -81,3 +81,25 @@ class TestDummyLauncher:
         assert isinstance(prediction[0], ClassificationPrediction)
         assert prediction[0].identifier == expected_prediction.identifier
         assert np.array_equal(prediction[0].scores, expected_prediction.scores)
+
+
+def test_columnar_predictions_storing_and_loading(tmp_path):
+    storage = ColumnarPredictionsStorage(tmp_path / 'predictions')
+    first_batch = StoredPredictionBatch(
+        {'prediction': np.array([[0, 1], [1, 0]], dtype=np.float32)}, [1, 2], [{}, {}]
+    )
+    second_batch = StoredPredictionBatch({'prediction': np.array([[0.5, 0.5]])}, [3], [{}])
+    storage.append(first_batch)
+    storage.append(second_batch)
+    launcher_config = {
+        'framework': 'dummy',
+        'loader': 'columnar',
+        'data_path': str(tmp_path / 'predictions')
+    }
+    launcher = DummyLauncher(launcher_config, adapter=ClassificationAdapter({'type': 'classification'}))
+    assert len(launcher._loader) == 3
+    predictions = launcher.predict([3, 1, 2])
+    assert [prediction.identifier for prediction in predictions] == [3, 1, 2]
+    assert np.array_equal(predictions[0].scores, second_batch.raw_predictions['prediction'][0])
+    assert np.array_equal(predictions[1].scores, first_batch.raw_predictions['prediction'][0])
+    assert np.array_equal(predictions[2].scores, first_batch.raw_predictions['prediction'][1])
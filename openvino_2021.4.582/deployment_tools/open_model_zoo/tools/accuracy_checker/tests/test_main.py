@@ -0,0 +1,115 @@
+"""
+Copyright (c) 2018-2021 Intel Corporation
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import csv
+import pytest
+from accuracy_checker.evaluators import ModelEvaluator
+from accuracy_checker.main import (
+    EVALUATION_MODE, build_arguments_parser, evaluate_in_parallel, get_entry_devices, get_converted_annotation_files
+)
+
+
+class DummyEvaluator:
+    def __init__(self, config):
+        self.config = config
+
+    @staticmethod
+    def get_processing_info(config):
+        return config['name'], 'dummy', config['device'], None, 'dataset'
+
+    @classmethod
+    def from_configs(cls, config):
+        if config.get('fail'):
+            raise ValueError('evaluation failed')
+        return cls(config)
+
+    def send_processing_info(self, sender):
+        return {'device': self.config['device']} if sender else {}
+
+    def process_dataset(self, *args, **kwargs):
+        pass
+
+    def extract_metrics_results(self, *args, **kwargs):
+        return [{'name': 'accuracy', 'type': 'accuracy', 'value': self.config['value']}], [{}]
+
+    @property
+    def dataset_size(self):
+        return 1
+
+    def release(self):
+        pass
+
+
+def test_entry_devices_for_single_device():
+    entry = {'name': 'model', 'launchers': [{'framework': 'dlsdk', 'device': 'cpu'}], 'datasets': [{'name': 'data'}]}
+
+    assert get_entry_devices(ModelEvaluator, entry) == ['CPU']
+
+
+def test_entry_devices_for_hetero_device():
+    entry = {
+        'name': 'model', 'launchers': [{'framework': 'dlsdk', 'device': 'HETERO:GPU,CPU'}],
+        'datasets': [{'name': 'data'}]
+    }
+
+    assert get_entry_devices(ModelEvaluator, entry) == ['CPU', 'GPU']
+
+
+def test_converted_annotation_files_contain_only_not_existing_annotation(tmp_path):
+    existing_annotation = tmp_path / 'existing.pickle'
+    existing_annotation.touch()
+    entry = {'datasets': [
+        {'name': 'a', 'annotation': str(existing_annotation), 'annotation_conversion': {'converter': 'dummy'}},
+        {'name': 'b', 'annotation': str(tmp_path / 'new.pickle'), 'annotation_conversion': {'converter': 'dummy'}},
+        {'name': 'c', 'annotation_conversion': {'converter': 'dummy'}}
+    ]}
+
+    assert get_converted_annotation_files(entry) == {(tmp_path / 'new.pickle').resolve()}
+
+
+def test_evaluate_in_parallel_writes_all_results_to_csv(tmp_path, monkeypatch):
+    monkeypatch.setitem(EVALUATION_MODE, 'dummy', DummyEvaluator)
+    config_file = tmp_path / 'config.yml'
+    config_file.touch()
+    csv_file = tmp_path / 'result.csv'
+    args = build_arguments_parser().parse_args(
+        ['-c', str(config_file), '--jobs', '2', '--jobs_per_device', '1', '--csv_result', str(csv_file)]
+    )
+    entries = [
+        {'name': 'model_{}'.format(idx), 'device': device, 'value': idx}
+        for idx, device in enumerate(['CPU', 'GPU', 'CPU'])
+    ]
+    entries.append({'name': 'failed', 'device': 'CPU', 'value': 0, 'fail': True})
+
+    return_code = evaluate_in_parallel(entries, 'dummy', args, {}, {}, None)
+
+    assert return_code == 1
+    with csv_file.open() as content:
+        rows = list(csv.DictReader(content))
+    assert sorted((row['model'], row['device'], row['metric_value']) for row in rows) == [
+        ('model_0', 'CPU', '0'), ('model_1', 'GPU', '1'), ('model_2', 'CPU', '2')
+    ]
+
+
+@pytest.mark.parametrize('option', ['--jobs', '--jobs_per_device', '--pipeline_queue_size'])
+def test_non_positive_number_rejected_with_option_name(tmp_path, capsys, option):
+    config_file = tmp_path / 'config.yml'
+    config_file.touch()
+
+    with pytest.raises(SystemExit):
+        build_arguments_parser().parse_args(['-c', str(config_file), option, '0'])
+
+    assert 'argument {}'.format(option) in capsys.readouterr().err
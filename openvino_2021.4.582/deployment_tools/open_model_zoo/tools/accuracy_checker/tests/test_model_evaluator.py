@@ -16,7 +16,11 @@ limitations under the License.
 
 from unittest.mock import Mock, MagicMock
 
+import numpy as np
+import pytest
+
 from accuracy_checker.evaluators import ModelEvaluator
+from accuracy_checker.launcher.loaders import StoredPredictionBatch, ColumnarPredictionsStorage
 
 
 class TestModelEvaluator:
@@ -143,6 +147,32 @@ class TestModelEvaluator:
         assert self.postprocessor.full_process.called
 
 
+    def test_process_dataset_with_loading_columnar_predictions_by_batches(self, tmp_path):
+        stored_predictions = tmp_path / 'predictions'
+        storage = ColumnarPredictionsStorage(stored_predictions)
+        storage.append(StoredPredictionBatch({'prediction': np.array([[0, 1]])}, [0], [{}]))
+        storage.append(StoredPredictionBatch({'prediction': np.array([[1, 0]])}, [1], [{}]))
+        self.postprocessor.has_dataset_processors = False
+        self.postprocessor.process_batch = Mock(side_effect=lambda annotations, predictions: (annotations, predictions))
+        self.dataset.identifiers = [0, 1]
+        self.dataset.annotation_batches.return_value = [
+            (range(0, 1), self.annotations[0], [0]), (range(1, 2), self.annotations[1], [1])
+        ]
+        self.evaluator.adapter = None
+
+        self.evaluator.process_dataset(str(stored_predictions), None)
+
+        assert not self.evaluator.load.called
+        assert not self.launcher.predict.called
+        assert not self.postprocessor.full_process.called
+        assert self.metric.update_metrics_on_batch.call_count == 2
+        processed_batches = [call[0] for call in self.metric.update_metrics_on_batch.call_args_list]
+        assert [batch_input_ids for batch_input_ids, _, _ in processed_batches] == [range(0, 1), range(1, 2)]
+        assert [
+            [prediction.identifiers for prediction in predictions] for _, _, predictions in processed_batches
+        ] == [[[0]], [[1]]]
+
+
 class TestModelEvaluatorAsync:
     def setup_method(self):
         self.launcher = MagicMock()
@@ -279,3 +309,91 @@ class TestModelEvaluatorAsync:
         assert self.launcher.predict.called
         assert not self.launcher.predict_async.called
         assert self.metric.update_metrics_on_batch.call_count == len(self.annotations)
+
+
+class TestModelEvaluatorPipelined:
+    def setup_method(self):
+        self.launcher = Mock()
+        self.launcher.predict.side_effect = lambda inputs, meta, **kwargs: [inputs]
+        data = MagicMock(data=MagicMock(), metadata=MagicMock(), identifier=0)
+        self.preprocessor = Mock()
+        self.preprocessor.process = Mock(return_value=data)
+        self.postprocessor = Mock()
+        self.adapter = MagicMock(return_value=[])
+        self.input_feeder = Mock()
+        self.input_feeder.lstm_inputs = []
+        self.input_feeder.fill_inputs = Mock(side_effect=['input_0', 'input_1', 'input_2'])
+
+        self.annotations = []
+        dataset_batches = []
+        for identifier in range(3):
+            annotation = MagicMock()
+            annotation.identifier = identifier
+            self.annotations.append([annotation])
+            dataset_batches.append((range(identifier, identifier + 1), [annotation], data, [identifier]))
+
+        self.dataset = MagicMock()
+        self.dataset.__iter__.return_value = dataset_batches
+        self.postprocessor.process_batch = Mock(side_effect=lambda annotations, predictions, meta: (
+            annotations, predictions
+        ))
+        self.adapter.process = Mock(side_effect=lambda predictions, identifiers, meta: predictions)
+
+        self.metric = Mock()
+        self.metric.update_metrics_on_batch = Mock(return_value=[{}, {}])
+        self.metric.need_store_predictions = True
+
+        self.evaluator = ModelEvaluator(
+            self.launcher,
+            self.input_feeder,
+            self.adapter,
+            self.preprocessor,
+            self.postprocessor,
+            self.dataset,
+            self.metric,
+            False,
+            {}
+        )
+        self.evaluator.store_predictions = Mock()
+        self.evaluator.load = Mock()
+
+    def test_process_dataset_pipelined_keeps_batches_order(self):
+        annotations, predictions = self.evaluator.process_dataset(None, None, pipelined=True, pipeline_queue_size=1)
+
+        assert self.launcher.predict.call_count == len(self.annotations)
+        assert self.metric.update_metrics_on_batch.call_count == len(self.annotations)
+        processed_ids = [call[0][0] for call in self.metric.update_metrics_on_batch.call_args_list]
+        assert processed_ids == [range(0, 1), range(1, 2), range(2, 3)]
+        assert [annotation.identifier for annotation in annotations] == [0, 1, 2]
+        assert predictions == ['input_0', 'input_1', 'input_2']
+        assert not self.evaluator.store_predictions.called
+
+    def test_process_dataset_pipelined_store_only(self):
+        self.evaluator.process_dataset('path', None, pipelined=True, store_only=True)
+
+        assert self.evaluator.store_predictions.call_count == len(self.annotations)
+        assert not self.postprocessor.process_batch.called
+        assert not self.metric.update_metrics_on_batch.called
+
+    def test_process_dataset_pipelined_finishes_progress(self):
+        progress_reporter = MagicMock()
+
+        self.evaluator.process_dataset(None, progress_reporter, pipelined=True)
+
+        assert progress_reporter.update.call_count == len(self.annotations)
+        progress_reporter.finish.assert_called_once()
+
+    def test_process_dataset_pipelined_raises_stage_error(self):
+        self.postprocessor.process_batch.side_effect = ValueError('postprocessing failed')
+
+        with pytest.raises(ValueError):
+            self.evaluator.process_dataset(None, None, pipelined=True)
+
+    def test_process_dataset_pipelined_switched_to_sync_for_lstm_inputs(self, mocker):
+        self.input_feeder.lstm_inputs = ['lstm_input']
+        pipeline_mock = mocker.patch.object(self.evaluator, '_process_dataset_pipelined')
+
+        self.evaluator.process_dataset(None, None, pipelined=True)
+
+        assert not pipeline_mock.called
+        assert self.launcher.predict.call_count == len(self.annotations)
@@ -804,6 +804,24 @@ class TestPostprocessor:
         postprocess_data(PostprocessingExecutor(config), [], [])
         mock.assert_called_once_with([], [])
 
+    def test_nms_removes_overlapped_boxes_with_lower_scores(self):
+        config = [{'type': 'nms', 'overlap': 0.4, 'include_boundaries': False}]
+        prediction = make_representation('0.9 0 0 0 10 10; 0.8 1 1 1 11 11; 0.7 0 20 20 30 30; 0.6 0 21 20 31 30')[0]
+        expected = make_representation('0.9 0 0 0 10 10; 0.7 0 20 20 30 30')[0]
+
+        postprocess_data(PostprocessingExecutor(config), [None], [prediction])
+
+        assert prediction == expected
+
+    def test_nms_per_class_keeps_overlapped_boxes_with_different_labels(self):
+        config = [{'type': 'nms', 'overlap': 0.4, 'include_boundaries': False, 'per_class': True}]
+        prediction = make_representation('0.9 0 0 0 10 10; 0.8 1 1 1 11 11; 0.7 0 20 20 30 30; 0.6 0 21 20 31 30')[0]
+        expected = make_representation('0.9 0 0 0 10 10; 0.8 1 1 1 11 11; 0.7 0 20 20 30 30')[0]
+
+        postprocess_data(PostprocessingExecutor(config), [None], [prediction])
+
+        assert prediction == expected
+
     def test_resize_prediction_boxes(self):
         config = [{'type': 'resize_prediction_boxes'}]
         annotation = DetectionAnnotation(metadata={'image_size': [(100, 100, 3)]})
@@ -176,7 +176,8 @@ class LinearModule(torch.nn.Module):
         node_weight = get_weight_node(node)
         weights = nu.get_node_value(node_weight)
         self.weights_dtype = weights.dtype
-        weights = torch.from_numpy(weights).to(torch.float32)
+        # copy values, because constants are shared between model copies and must not be changed in place
+        weights = torch.tensor(weights, dtype=torch.float32)
         weights = weights.to(device)
         self.weights = torch.nn.Parameter(weights)
 
@@ -185,7 +186,7 @@ class LinearModule(torch.nn.Module):
         if bias_node is not None:
             bias = nu.get_node_value(bias_node)
             self.bias_dtype = bias.dtype
-            bias = torch.from_numpy(bias).to(torch.float32).squeeze()
+            bias = torch.tensor(bias, dtype=torch.float32).squeeze()
             bias = bias if bias.shape else bias.reshape(1)
             bias = bias.to(device)
             self.bias = torch.nn.Parameter(bias)
@@ -12,7 +12,6 @@
 
 import os
 import random
-from copy import deepcopy
 from sys import maxsize
 
 import numpy as np
@@ -23,6 +22,8 @@ from ..utils import load_hardware_config
 from ...algorithm import Algorithm
 from ...algorithm_selector import COMPRESSION_ALGORITHMS
 from ....algorithms.quantization import utils as eu
+from ....engines.ac_engine import ACEngine
+from ....engines.ac_engine_pool import ACEnginePool
 from ....graph import node_utils as nu
 from ....graph.model_utils import save_model, get_nodes_by_type
 from ....graph.transformer import GraphTransformer
@@ -53,7 +54,8 @@ class AccuracyAwareQuantization(Algorithm):
             'annotation_free': False,
             'tune_hyperparams': False,
             'annotation_conf_threshold': 0.6,
-            'convert_to_mixed_preset': False
+            'convert_to_mixed_preset': False,
+            'ranking_workers_number': 1
         }
 
         for setting in default_config:
@@ -61,6 +63,11 @@ class AccuracyAwareQuantization(Algorithm):
                 self._config[setting] = default_config[setting]
         self._config.convert_to_mixed_preset = self._config.convert_to_mixed_preset and \
                                                is_preset_performance(self._config)
+        if self._config.ranking_workers_number > 1 and \
+                (not isinstance(engine, ACEngine) or self._config.annotation_free):
+            logger.warning('Parallel layers ranking is supported only for AccuracyChecker engine '
+                           'in the annotation-based mode. Layers will be ranked sequentially.')
+            self._config.ranking_workers_number = 1
         save_dir = self._config.get('exec_log_dir', os.path.curdir)
         self._config.intermediate_log_dir = os.path.join(save_dir, 'accuracy_aware_intermediate')
         self._engine.calculate_metrics = True
@@ -165,7 +172,7 @@ class AccuracyAwareQuantization(Algorithm):
 
         # quantize model
         quantized_model, metrics_accuracy_drop, quantized_metrics_per_sample = \
-            self._quantize_and_evaluate(deepcopy(model),
+            self._quantize_and_evaluate(model.snapshot(),
                                         self._quantize_model,
                                         print_progress=print_progress)
 
@@ -179,7 +186,7 @@ class AccuracyAwareQuantization(Algorithm):
         # change quantization preset of the model if possible
         if self._config.convert_to_mixed_preset:
             quantized_model, metrics_accuracy_drop, quantized_metrics_per_sample = \
-                self._quantize_and_evaluate(deepcopy(model),
+                self._quantize_and_evaluate(model.snapshot(),
                                             self._convert_model_to_mixed_preset,
                                             print_progress=print_progress)
 
@@ -201,7 +208,7 @@ class AccuracyAwareQuantization(Algorithm):
                                                          self._metrics_config)
             self._engine.allow_pairwise_subset = True
             updated_quantized_model, updated_metrics_accuracy_drop, updated_quantized_metrics_per_sample = \
-                self._quantize_and_evaluate(deepcopy(model),
+                self._quantize_and_evaluate(model.snapshot(),
                                             self._search_optimal_parameters,
                                             print_progress=print_progress)
             default_mean_drop = np.mean([value for name, value in metrics_accuracy_drop.items()])
@@ -260,8 +267,9 @@ class AccuracyAwareQuantization(Algorithm):
         iteration = 0
         for iteration in range(self._config.max_iter_num):
             # save model and metrics from previous iteration
-            model_prev_iter = deepcopy(model)
-            metrics_prev_iter = deepcopy(quantized_metrics_per_sample)
+            model_prev_iter = model.snapshot()
+            # per-sample metrics are replaced by evaluation, not changed in place
+            metrics_prev_iter = quantized_metrics_per_sample
 
             # greedy removal of the FQ node with the highest importance score
             fq_name_to_remove = node_importance.pop(0)
@@ -373,23 +381,31 @@ class AccuracyAwareQuantization(Algorithm):
 
         return node_importance
 
-    def _get_ranking_subset(self, qmodel_per_sample_metrics, metric_name, from_id=0):
+    def _get_ranking_subset(self, qmodel_per_sample_metrics, metric_name, from_id=0,
+                            sorted_sample_importance=None):
         """Determines samples on which the quantized model predicts worse than on the original model
         :param qmodel_per_sample_metrics: per-sample metrics values of the quantized model
         :param metric_name: metric to take into account
+        :param sorted_sample_importance: precomputed result of _sort_samples_by_importance (optional)
         :return a list of image ids
         """
-        persample_metric = self._metrics_config[metric_name].persample
-        sorted_sample_importance = \
-            persample_metric.sort_fn(self._original_per_sample_metrics[persample_metric.name],
-                                     qmodel_per_sample_metrics[persample_metric.name],
-                                     reverse=True)
+        if sorted_sample_importance is None:
+            sorted_sample_importance = self._sort_samples_by_importance(qmodel_per_sample_metrics, metric_name)
         to_id = from_id + self._config.ranking_subset_size
         ranking_subset = \
             np.array(self._diff_subset_indices)[sorted_sample_importance[from_id:to_id]]
 
         return ranking_subset
 
+    def _sort_samples_by_importance(self, qmodel_per_sample_metrics, metric_name):
+        """Sorts samples by degradation of the per-sample metric of the quantized model
+        :return array of sample positions, the most degraded first
+        """
+        persample_metric = self._metrics_config[metric_name].persample
+        return persample_metric.sort_fn(self._original_per_sample_metrics[persample_metric.name],
+                                        qmodel_per_sample_metrics[persample_metric.name],
+                                        reverse=True)
+
     def _calculate_node_importance_scores(self, model, ranking_subset, metric_name):
         """Cuts out FQ layers one after another and measures metric value on ranking subset.
         The higher the value, the more important the node.
@@ -398,31 +414,57 @@ class AccuracyAwareQuantization(Algorithm):
         :param metric_name: metric to take into account
         :return a dictionary of node importance {metric_name: score}
         """
-        cut_fqs = []
         node_importance_score = {}
         eu.select_evaluation_dataset(self._engine)
 
-        fake_quantize_nodes = get_nodes_by_type(model, ['FakeQuantize'])
-        for node in fake_quantize_nodes:
+        ranking_metric = self._metrics_config[metric_name].ranking
+        ranking_models = self._get_ranking_models(model)
+        for node_name, metrics in self._evaluate_ranking_models(ranking_models, ranking_subset):
+            logger.update_progress(self._config.ranking_subset_size)
+            node_importance_score[node_name] = ranking_metric.comparator(metrics[ranking_metric.name])
+
+        eu.reset_dataset_to_default(self._engine)
+
+        return node_importance_score
+
+    def _get_ranking_models(self, model):
+        """Generates models with FQ layers cut out one after another
+        :param model: graph from which to cut nodes
+        :return generator of (node name, model without the node) pairs
+        """
+        cut_fqs = []
+        for node in self._get_nodes_to_rank(model):
             if node.name not in cut_fqs:
                 cut_model, cut_fq_layers, _ = self._modify_model_in_scope(model, [node.name])
                 logger.debug('Removed a block of %d FQ layers: %s', len(cut_fq_layers), cut_fq_layers)
                 cut_fqs += cut_fq_layers
-                self._engine.set_model(cut_model)
-                self._engine.allow_pairwise_subset = True
-                index_sampler = create_sampler(self._engine, samples=list(ranking_subset))
-                metrics, *_ = self._engine.predict(sampler=index_sampler)
-                self._engine.allow_pairwise_subset = False
-                logger.update_progress(self._config.ranking_subset_size)
-                ranking_metric = self._metrics_config[metric_name].ranking
-                node_importance_score[node.name] = ranking_metric.comparator(metrics[ranking_metric.name])
+                yield node.name, cut_model
 
-        eu.reset_dataset_to_default(self._engine)
+    def _get_nodes_to_rank(self, model):
+        return get_nodes_by_type(model, ['FakeQuantize'])
 
-        return node_importance_score
+    def _evaluate_ranking_models(self, ranking_models, ranking_subset):
+        """Measures metrics of the models on the ranking subset.
+        Models are evaluated by a pool of engines if ranking_workers_number > 1.
+        :param ranking_models: iterable of (node name, model) pairs
+        :param ranking_subset: subset on which the metrics will be calculated
+        :return generator of (node name, metrics) pairs in the same order as ranking_models
+        """
+        if self._config.ranking_workers_number > 1:
+            with ACEnginePool(self._engine, self._config.ranking_workers_number) as engine_pool:
+                yield from engine_pool.evaluate(ranking_models, ranking_subset)
+            return
+
+        for node_name, cut_model in ranking_models:
+            self._engine.set_model(cut_model)
+            self._engine.allow_pairwise_subset = True
+            index_sampler = create_sampler(self._engine, samples=list(ranking_subset))
+            metrics, *_ = self._engine.predict(sampler=index_sampler)
+            self._engine.allow_pairwise_subset = False
+            yield node_name, metrics
 
     def _modify_model_in_scope(self, model, node_names):
-        return self._graph_transformer.remove_fq_nodes(deepcopy(model), node_names)
+        return self._graph_transformer.remove_fq_nodes(model.snapshot(), node_names)
 
     def compute_total_exec_steps(self, model=None):
         total_steps = 0
@@ -493,13 +535,17 @@ class AccuracyAwareQuantization(Algorithm):
         logger.debug('Intermediate model is saved in %s', self._config.intermediate_log_dir)
 
     def _create_hardest_ranking_subset(self, metrics_per_sample):
+        # samples order does not change between iterations, so it is computed once for every metric
+        sorted_samples = {metric_name: self._sort_samples_by_importance(metrics_per_sample, metric_name)
+                          for metric_name in metrics_per_sample}
         worst_ranking_subset = []
         while len(worst_ranking_subset) < self._config.ranking_subset_size:
             needed_subset_size = self._config.ranking_subset_size - len(worst_ranking_subset)
             top_n_samples = int(np.ceil(needed_subset_size / len(metrics_per_sample.keys())))
             local_ranking_subset = []
             for metric_name in metrics_per_sample:
-                ranking_subset = self._get_ranking_subset(metrics_per_sample, metric_name, len(worst_ranking_subset))
+                ranking_subset = self._get_ranking_subset(metrics_per_sample, metric_name, len(worst_ranking_subset),
+                                                          sorted_samples[metric_name])
                 local_ranking_subset.extend(ranking_subset[:top_n_samples])
             worst_ranking_subset.extend(list(set(local_ranking_subset)))
         return list(set(worst_ranking_subset))
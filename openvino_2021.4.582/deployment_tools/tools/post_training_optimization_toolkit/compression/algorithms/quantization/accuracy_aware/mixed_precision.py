@@ -17,12 +17,10 @@ from addict import Dict
 
 from .algorithm import AccuracyAwareQuantization
 from ...algorithm_selector import COMPRESSION_ALGORITHMS
-from ....algorithms.quantization import utils as eu
 from ....graph import model_utils as mu
 from ....graph import node_utils as nu
 from ....graph import save_model
 from ....graph.special_operations import OPERATIONS_WITH_WEIGHTS
-from ....samplers.creator import create_sampler
 from ....utils.logger import get_logger, stdout_redirect
 
 logger = get_logger(__name__)
@@ -74,7 +72,7 @@ class INT4MixedQuantization(AccuracyAwareQuantization):
 
     def _get_nonquantized_model(self, model):
         cut_fqs = []
-        cut_model = deepcopy(model)
+        cut_model = model.snapshot()
         for node in mu.get_nodes_by_type(model, ['FakeQuantize']):
             if node.name not in cut_fqs:
                 cut_model, cut_fq_layers, _ = self._graph_transformer.remove_fq_nodes(
@@ -120,57 +118,15 @@ class INT4MixedQuantization(AccuracyAwareQuantization):
 
     def _modify_model_in_scope(self, model, node_names):
         _, fq_layer_bunch, _ = self._graph_transformer.remove_fq_nodes(
-            deepcopy(model), node_names
+            model.snapshot(), node_names
         )
         model = self._get_nonquantized_model(model)
         requantized_model = self._change_bitwidth_for_scope(model, fq_layer_bunch)
         return requantized_model, fq_layer_bunch, None
 
-    def _calculate_node_importance_scores(self, model, ranking_subset, metric_name):
-        """Cuts out FQ layers one after another and measures metric value on ranking subset.
-        The higher the value, the more important the node.
-        :param model: graph from which to cut nodes
-        :param ranking_subset: subset on which the scores will be calculated
-        :param metric_name: metric to take into account
-        :return a dictionary of node importance {metric_name: score}
-        """
-        cut_fqs = []
-        node_importance_score = {}
-        eu.select_evaluation_dataset(self._engine)
-
-        convolution_fq_nodes = [
-            node
-            for node in model.get_nodes_by_type(['FakeQuantize'])
-            if self._can_set_fq_to_low_bitwidth(node)
-        ]
-
-        for node in convolution_fq_nodes:
-            if node.name not in cut_fqs:
-                cut_model, cut_fq_layers, _ = self._modify_model_in_scope(
-                    model, [node.name]
-                )
-                logger.info(
-                    'Removed a block of %d FQ layers: %s',
-                    len(cut_fq_layers),
-                    cut_fq_layers,
-                )
-                cut_fqs += cut_fq_layers
-                self._engine.set_model(cut_model)
-                self._engine.allow_pairwise_subset = True
-                index_sampler = create_sampler(
-                    self._engine, samples=list(ranking_subset)
-                )
-                metrics, *_ = self._engine.predict(sampler=index_sampler)
-                self._engine.allow_pairwise_subset = False
-                logger.update_progress(self._config.ranking_subset_size)
-                ranking_metric = self._metrics_config[metric_name].ranking
-                node_importance_score[node.name] = ranking_metric.comparator(
-                    metrics[ranking_metric.name]
-                )
-
-        eu.reset_dataset_to_default(self._engine)
-
-        return node_importance_score
+    def _get_nodes_to_rank(self, model):
+        return [node for node in model.get_nodes_by_type(['FakeQuantize'])
+                if self._can_set_fq_to_low_bitwidth(node)]
 
     def _change_quantization_scope(self, model, original_accuracy_drop,
                                    fully_quantized_metrics_per_sample):
@@ -206,7 +162,7 @@ class INT4MixedQuantization(AccuracyAwareQuantization):
                 logger.update_progress(self.total_exec_steps)
                 return model
 
-            model_prev_iter = deepcopy(model)
+            model_prev_iter = model.snapshot()
 
             # greedy requantization of the FQ node with the highest importance score
             fq_name_to_modify = node_importance.pop(0)
@@ -189,14 +189,32 @@ def sort_by_logit_distance(u, v, reverse=False, distance='cosine'):
         'mse': mse_distance,
     }
 
-    distance_between_samples = np.array([distance_function[distance](ui.flatten(), vi.flatten())
-                                         for ui, vi in zip(u, v)])
+    if len({np.size(ui) for ui in u} | {np.size(vi) for vi in v}) == 1:
+        distance_between_samples = batch_logit_distance(np.reshape(u, (len(u), -1)),
+                                                        np.reshape(v, (len(v), -1)), distance)
+    else:
+        distance_between_samples = np.array([distance_function[distance](ui.flatten(), vi.flatten())
+                                             for ui, vi in zip(u, v)])
     sorted_arr = np.argsort(distance_between_samples)
     if reverse:
         sorted_arr = np.flip(sorted_arr)
     return sorted_arr
 
 
+def batch_logit_distance(u, v, distance='cosine'):
+    """ Computes distances between rows of two arrays of logits of shape [samples, logits]
+    """
+    u, v = u.astype(np.float64), v.astype(np.float64)
+    if distance == 'cosine':
+        return 1.0 - np.sum(u * v, axis=1) / (np.linalg.norm(u, axis=1) * np.linalg.norm(v, axis=1))
+    if distance == 'kd':
+        u_probs, v_probs = scipy.special.softmax(u, axis=1), scipy.special.softmax(v, axis=1)
+        return np.sum(scipy.special.rel_entr(u_probs, v_probs), axis=1)
+    if distance == 'mse':
+        return np.mean((u - v) ** 2, axis=1)
+    raise ValueError('Unsupported logit distance type: {}'.format(distance))
+
+
 def sort_by_metric_difference(u, v, comp_fn=lambda a: a, reverse=False):
     if len(u) != len(v):
         raise RuntimeError('Cannot compare samples. '
@@ -310,11 +328,13 @@ def process_raw_output(output, output_node_name):
 
 def process_per_sample_metrics(metrics_per_sample, metrics_config,
                                indices=None, raw_output=None):
-    """Creates a dictionary of per-sample metrics values {metric_name: [values]}
+    """Creates a dictionary of per-sample metrics values {metric_name: values}
             :param metrics_per_sample: list of per-sample metrics
             :param indices: indices of samples to be considered. All if None
             :param raw_output: raw output from the model
-            :return processed dictionary
+            :return processed dictionary. Values of regular metrics are stored in arrays
+            indexed by sample position (NaN for samples without result),
+            values of special metrics are lists of raw outputs
             """
     metrics_to_keep = {config.persample.name: config.persample
                        for config in metrics_config.values()}
@@ -322,21 +342,19 @@ def process_per_sample_metrics(metrics_per_sample, metrics_config,
     if not metrics_to_keep:
         return {}
 
-    processed_metrics_per_sample = dict((name, []) for name in metrics_to_keep)
+    processed_metrics_per_sample = {}
+    results_by_name = dict((name, []) for name in metrics_to_keep)
+    for value in metrics_per_sample:
+        if value['metric_name'] in results_by_name:
+            results_by_name[value['metric_name']].append(value['result'])
 
     for metric_name, metric_params in metrics_to_keep.items():
         if metric_params.is_special:
             processed_metrics_per_sample[metric_name] = raw_output
-
-    for value in metrics_per_sample:
-        if value['metric_name'] in metrics_to_keep:
-            if metrics_to_keep[value['metric_name']].is_special:
-                continue
-            if value['result'] is not None:
-                result_value = np.nanmean(value['result'])
-            else:
-                result_value = None
-            processed_metrics_per_sample[value['metric_name']].append(result_value)
+            continue
+        processed_metrics_per_sample[metric_name] = np.array(
+            [np.nanmean(result) if result is not None else np.nan for result in results_by_name[metric_name]],
+            dtype=np.float64)
 
     # check that all metrics have equal number of samples
     if not len({len(value) for value in processed_metrics_per_sample.values()}) == 1:
@@ -344,6 +362,7 @@ def process_per_sample_metrics(metrics_per_sample, metrics_config,
 
     if indices:
         for name, values in processed_metrics_per_sample.items():
-            processed_metrics_per_sample[name] = [values[i] for i in indices]
+            processed_metrics_per_sample[name] = values[indices] if isinstance(values, np.ndarray) \
+                else [values[i] for i in indices]
 
     return processed_metrics_per_sample
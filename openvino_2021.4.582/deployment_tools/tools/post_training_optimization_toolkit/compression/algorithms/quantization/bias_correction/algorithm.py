@@ -81,7 +81,7 @@ class BiasCorrection(Algorithm):
 
         for node_name in self._subgraphs_data:
             node = mu.get_node_by_name(model, node_name)
-            model_copy = deepcopy(model)
+            model_copy = model.snapshot()
             node_copy = mu.get_node_by_name(model_copy, node_name)
             node_copy_bias_add = self._get_add_node_for_bias(node_copy)
 
@@ -135,7 +135,7 @@ class BiasCorrection(Algorithm):
 
             return False
 
-        model_copy = deepcopy(model)
+        model_copy = model.snapshot()
         subgraphs_data = OrderedDict()
         self._remove_fq_from_inputs(model_copy)
         for node_name in self._nodes_with_bias_names:
@@ -317,8 +317,8 @@ class BiasCorrection(Algorithm):
         fp32_output = agf.mean(self._fp32_statistics[add_name]['mean_per_channel'])
 
         if model_copy.is_cascade:
-            ref_stats_layout = {add_name: {'mean_per_channel': TensorStatisticAxis(asf.mean_per_channel_axis,
-                                                                                   channel=self._channel_axis)}}
+            ref_stats_layout = {add_name: {'mean_per_channel': TensorStatisticAxis(
+                asf.mean_per_channel_axis, channel=self._channel_axis).accumulate('mean')}}
             self._engine.set_model(model_copy)
             _, q_outputs = self._engine.predict(ref_stats_layout, self._sampler)
             q_output = agf.mean(q_outputs[add_name]['mean_per_channel'])
@@ -394,8 +394,8 @@ class BiasCorrection(Algorithm):
                 input_name = biased_after_param_nodes[node.name]
                 statistics_layout[input_name] = {'batch_mean_param_in': agf.batch_mean}
                 self._collected_stat_inputs.append(input_name)
-            statistics_layout[add_node.name] = {'mean_per_channel': TensorStatisticAxis(asf.mean_per_channel_axis,
-                                                                                        channel=self._channel_axis)}
+            statistics_layout[add_node.name] = {'mean_per_channel': TensorStatisticAxis(
+                asf.mean_per_channel_axis, channel=self._channel_axis).accumulate('mean')}
 
         self._stats_collector.register(self.name, statistics_layout, self._sampler)
 
@@ -407,7 +407,7 @@ class BiasCorrection(Algorithm):
         self.total_exec_steps = total_steps
 
     def _get_topological_biased_ops(self, model):
-        quantized_model = deepcopy(model)
+        quantized_model = model.snapshot()
         insert_fake_quantize_nodes(self._config, quantized_model)
         biased_ops_list = []
         ops_list = [op for op in quantized_model.pseudo_topological_sort() if op.kind == 'op']
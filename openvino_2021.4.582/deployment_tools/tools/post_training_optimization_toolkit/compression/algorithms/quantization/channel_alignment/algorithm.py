@@ -9,7 +9,6 @@
 # and your use indicates your acceptance of all such terms. Please refer
 # to the "third-party-programs.txt" or other similarly-named text file
 # included with the Software Package for additional details.
-from copy import deepcopy
 
 import numpy as np
 
@@ -69,7 +68,7 @@ class ActivationChannelAlignment(Algorithm):
         return model
 
     def register_statistics(self, model, stats_collector):
-        model = deepcopy(model)
+        model = model.snapshot()
         activation_statistics_layout = self.get_activations_statistics_layout(model)
         stats_collector.register(self.name, activation_statistics_layout, self._sampler)
         self._stats_collector = stats_collector
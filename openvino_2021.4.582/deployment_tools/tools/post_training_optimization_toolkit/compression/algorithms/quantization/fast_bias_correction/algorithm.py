@@ -10,7 +10,6 @@
 # to the "third-party-programs.txt" or other similarly-named text file
 # included with the Software Package for additional details.
 
-from copy import deepcopy
 
 import numpy as np
 
@@ -46,6 +45,7 @@ class FastBiasCorrection(Algorithm):
         self.total_exec_steps = stat_subset_size
         self._threshold = float(self._config.get('threshold', 2.0))
         self._apply_for_all_nodes = self._config.get('apply_for_all_nodes', False)
+        self._batched_inference = self._config.get('batched_inference', False)
         shuffle_data = self._config.get('shuffle_data', False)
         seed = self._config.get('seed', 0)
         self._sampler = create_sampler(engine, stat_subset_size, shuffle_data, seed)
@@ -65,6 +65,7 @@ class FastBiasCorrection(Algorithm):
         self.find_channel_axis(model)
         launcher = IELauncher()
 
+        nodes_data = []
         for op_node in nodes_with_bias:
             if not nu.node_with_quantized_weights(op_node) and not self._apply_for_all_nodes:
                 continue
@@ -84,25 +85,41 @@ class FastBiasCorrection(Algorithm):
                 input_node = nu.get_node_input(input_node, 0)
                 quantized_node = nu.get_node_input(op_node, 0)
 
-            input_shape = nu.get_input_shape_for_bias(op_node)
-            op_model = mu.build_model_for_node(model, input_node.name, input_shape, op_node, remove_bias=True)
-
             # We need to get output from the biased operation
-            if nu.get_bias_for_node(op_node):
-                bias = nu.get_bias_for_node(op_node)
-                after_biased_conv = nu.get_node_output(bias, 0)[0]
+            after_biased_conv = nu.get_node_output(bias_node, 0)[0]
 
             input_node_name = get_quantized_input_key(quantized_node)
-            fp32_inputs = agf.mean(activations_statistics[input_node_name]["mean_per_channel"])
-            fp32_outputs = agf.mean(activations_statistics[after_biased_conv.name]["mean_per_channel"])
-
-            bias_shift = self._calculate_bias_shift(
-                launcher, input_node.name, input_shape, op_model, fp32_inputs, fp32_outputs)
+            nodes_data.append({
+                'op_node': op_node,
+                'bias_node': bias_node,
+                'input_name': input_node.name,
+                'input_shape': nu.get_input_shape_for_bias(op_node),
+                'input_node_name': input_node_name,
+                'after_biased_conv': after_biased_conv,
+                'fp32_inputs': agf.mean(activations_statistics[input_node_name]["mean_per_channel"]),
+                'fp32_outputs': agf.mean(activations_statistics[after_biased_conv.name]["mean_per_channel"])
+            })
+
+        if self._batched_inference:
+            bias_shifts = self._calculate_bias_shifts_batched(launcher, model, nodes_data)
+        else:
+            bias_shifts = {}
+            for node_data in nodes_data:
+                op_node = node_data['op_node']
+                op_model = mu.build_model_for_node(model, node_data['input_name'], node_data['input_shape'],
+                                                   op_node, remove_bias=True)
+                bias_shifts[op_node.name] = self._calculate_bias_shift(
+                    launcher, node_data['input_name'], node_data['input_shape'], op_model,
+                    node_data['fp32_inputs'], node_data['fp32_outputs'])
+
+        for node_data in nodes_data:
+            op_node, bias_node = node_data['op_node'], node_data['bias_node']
+            bias_shift = bias_shifts[op_node.name]
             current_bias_value = nu.get_node_value(bias_node)
             # Reshaped since bias are broadcasted
-            add_out_shape = nu.get_input_shape_for_bias(after_biased_conv)
+            add_out_shape = nu.get_input_shape_for_bias(node_data['after_biased_conv'])
             bias_shape = np.ones(len(add_out_shape), dtype=np.int)
-            axis_channel = self.get_channel_axis(input_node_name)
+            axis_channel = self.get_channel_axis(node_data['input_node_name'])
             bias_shape[axis_channel] = add_out_shape[axis_channel]
 
             bias_shift = bias_shift.reshape(bias_shape)
@@ -123,7 +140,7 @@ class FastBiasCorrection(Algorithm):
         return model
 
     def register_statistics(self, model, stats_collector):
-        model = deepcopy(model)
+        model = model.snapshot()
         insert_fake_quantize_nodes(self._config, model)
         activation_statistics_layout = self.get_activations_statistics_layout(model)
         stats_collector.register(self.name, activation_statistics_layout, self._sampler)
@@ -149,17 +166,49 @@ class FastBiasCorrection(Algorithm):
                         op_node_output = nu.get_node_output(bias, 0)[0]
                         op_output_name = op_node_output.name
                     inputs_outputs_layout[op_output_name] = {
-                        "mean_per_channel": TensorStatisticAxis(asf.mean_per_channel_axis, channel=self._channel_axis)}
+                        "mean_per_channel": TensorStatisticAxis(asf.mean_per_channel_axis,
+                                                                channel=self._channel_axis).accumulate('mean')}
 
                 input_name = get_quantized_input_key(quantized_node)
                 inputs_outputs_layout[input_name] = {
-                    "mean_per_channel": TensorStatisticAxis(asf.mean_per_channel_axis, channel=self._channel_axis)}
+                    "mean_per_channel": TensorStatisticAxis(asf.mean_per_channel_axis,
+                                                            channel=self._channel_axis).accumulate('mean')}
 
         return inputs_outputs_layout
 
     def _calculate_bias_shift(self, launcher, input_name, input_shape, op_model, fp32_inputs, fp32_outputs):
         launcher.set_model(op_model)
-
+        input_blob = self._create_input_blob(input_name, input_shape, fp32_inputs)
+        q_outputs = launcher.infer(inputs={input_name: input_blob})
+        return self._get_bias_shift(input_name, list(q_outputs.values())[0], fp32_outputs)
+
+    def _calculate_bias_shifts_batched(self, launcher, model, nodes_data):
+        """ Calculates bias shifts for all nodes at once: subgraphs of independent nodes
+        are combined into one model which is compiled and inferred only once
+        :param launcher: IELauncher instance
+        :param model: model to apply algo
+        :param nodes_data: list of dictionaries with nodes info collected in run
+        :return dictionary of bias shifts {op_node_name: bias_shift}
+        """
+        node_data_by_name = {node_data['op_node'].name: node_data for node_data in nodes_data}
+        nodes_inputs = [(node_data['op_node'], node_data['input_name'], node_data['input_shape'])
+                        for node_data in nodes_data]
+        bias_shifts = {}
+        for op_model, op_nodes in mu.build_models_for_nodes(model, nodes_inputs, remove_bias=True):
+            launcher.set_model(op_model)
+            inputs = {}
+            for op_node in op_nodes:
+                node_data = node_data_by_name[op_node.name]
+                inputs[node_data['input_name']] = self._create_input_blob(
+                    node_data['input_name'], node_data['input_shape'], node_data['fp32_inputs'])
+            q_outputs = launcher.infer(inputs=inputs)
+            for op_node in op_nodes:
+                node_data = node_data_by_name[op_node.name]
+                bias_shifts[op_node.name] = self._get_bias_shift(
+                    node_data['input_name'], q_outputs[op_node.name], node_data['fp32_outputs'])
+        return bias_shifts
+
+    def _create_input_blob(self, input_name, input_shape, fp32_inputs):
         if len(input_shape) < 2:
             raise RuntimeError('Invalid input shape for {}'.format(input_name))
 
@@ -168,13 +217,11 @@ class FastBiasCorrection(Algorithm):
         input_blob = np.moveaxis(input_blob, axis, 1)
         for i, value in enumerate(fp32_inputs):
             input_blob[:, i] = value
-        input_blob = np.moveaxis(input_blob, 1, axis)
+        return np.moveaxis(input_blob, 1, axis)
 
-        q_outputs = launcher.infer(inputs={input_name: input_blob})
-        q_outputs = np.squeeze(asf.mean_per_channel_axis(list(q_outputs.values())[0],
-                                                         layer_key=input_name, channel=self._channel_axis))
-        bias_shift = fp32_outputs - q_outputs
-        return bias_shift
+    def _get_bias_shift(self, input_name, q_output, fp32_outputs):
+        q_output = np.squeeze(asf.mean_per_channel_axis(q_output, layer_key=input_name, channel=self._channel_axis))
+        return fp32_outputs - q_output
 
     def find_channel_axis(self, model):
         nodes_with_bias = mu.get_nodes_by_type(model, [op['type'] for op in OPERATIONS_WITH_BIAS])
@@ -10,7 +10,6 @@
 # to the "third-party-programs.txt" or other similarly-named text file
 # included with the Software Package for additional details.
 
-from copy import deepcopy
 
 import os
 import numpy as np
@@ -67,7 +66,7 @@ class MinMaxQuantization(Algorithm):
         return model
 
     def register_statistics(self, model, stats_collector):
-        model = deepcopy(model)
+        model = model.snapshot()
         insert_fake_quantize_nodes(self._config, model)
         activation_statistics_layout = self.__get_activations_statistics_layout(model)
         stats_collector.register(self.name, activation_statistics_layout, self._sampler)
@@ -81,16 +80,18 @@ class MinMaxQuantization(Algorithm):
         """
         fake_quantize_config = compute_stats_layouts(self._config, model)
 
-        activations_stats_layout = self.create_stats_layout(fake_quantize_config, model,
-                                                            for_weights=False)
+        activations_stats_layout = self.create_stats_layout(
+            fake_quantize_config, model, for_weights=False,
+            stream_statistics=self._config.get('stream_statistics', False))
         return activations_stats_layout
 
     @staticmethod
-    def create_stats_layout(fake_quantize_config, model, for_weights=True):
+    def create_stats_layout(fake_quantize_config, model, for_weights=True, stream_statistics=False):
         """ Creates weights layout based on model and config dictionary
         :param fake_quantize_config: dictionary with fake quantize names as a key and its settings as values
         :param model: NXModel instance
         :param for_weights: whether statistic layout is calculated for weights or for activations.
+        :param stream_statistics: whether activations statistics are aggregated during collection.
         :return weights or activations statistics layout. Layout is a dictionary with layer name as
          key and dictionary with statistics {stats_name: stats_fn} as values
         """
@@ -113,7 +114,8 @@ class MinMaxQuantization(Algorithm):
             elif is_weights is False and for_weights is False:
                 fq_input_key = nu.get_quantized_input_key(fq)
                 statistics_layout[fq_input_key] = get_tensor_statistics(layer_config['range_estimator'],
-                                                                        for_weights=False, **ts_args)
+                                                                        for_weights=False,
+                                                                        accumulate=stream_statistics, **ts_args)
         return statistics_layout
 
     @staticmethod
@@ -13,7 +13,6 @@
 import importlib
 import warnings
 import itertools
-from copy import deepcopy
 from functools import partial
 from pathlib import Path
 
@@ -351,7 +350,7 @@ class OptimizationAlgorithm(Algorithm):
                 'name': 'QuantNoiseEstimator',
             }
             noise_estimator = QuantNoiseEstimator(estimator_config, self._engine)
-            noise_data = noise_estimator.full_fq_noise_stats(deepcopy(model))
+            noise_data = noise_estimator.full_fq_noise_stats(model.snapshot())
             error_rate = np.sum(1 / np.array(noise_data['noise_metric']))
             return error_rate, {'quant_noise': error_rate}
 
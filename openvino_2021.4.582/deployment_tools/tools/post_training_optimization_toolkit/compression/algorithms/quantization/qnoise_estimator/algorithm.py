@@ -10,7 +10,6 @@
 # to the "third-party-programs.txt" or other similarly-named text file
 # included with the Software Package for additional details.
 
-from copy import deepcopy
 
 import numpy as np
 import pandas as pd
@@ -63,7 +62,7 @@ class QuantNoiseEstimator(Algorithm):
         pass
 
     def full_fq_noise_stats(self, model):
-        fully_quantized_model = deepcopy(model)
+        fully_quantized_model = model.snapshot()
         model = self.get_nonquantized_model(model)
         for node in mu.get_all_operation_nodes(fully_quantized_model):
             node.name = node.name + self.q_suffix
@@ -109,7 +108,7 @@ class QuantNoiseEstimator(Algorithm):
         return noise_data
 
     def layerwise_fq_noise(self, model):
-        fully_quantized_model = deepcopy(model)
+        fully_quantized_model = model.snapshot()
         model = self.get_nonquantized_model(model)
 
         def get_single_fq_model(model, fq_node):
@@ -145,14 +144,14 @@ class QuantNoiseEstimator(Algorithm):
                     )
                 )
                 single_fq_layer_model = get_single_fq_model(
-                    deepcopy(fully_quantized_model), conv_input_node
+                    fully_quantized_model.snapshot(), conv_input_node
                 )
 
                 for node in mu.get_all_operation_nodes(single_fq_layer_model):
                     node.name = node.name + self.q_suffix
 
                 composite_model = get_composite_model(
-                    deepcopy(model), single_fq_layer_model
+                    model.snapshot(), single_fq_layer_model
                 )
 
                 # collect convolution output residuals for original vs. quantized model
@@ -186,7 +185,7 @@ class QuantNoiseEstimator(Algorithm):
 
     def get_nonquantized_model(self, model):
         cut_fqs = []
-        cut_model = deepcopy(model)
+        cut_model = model.snapshot()
         for node in mu.get_nodes_by_type(model, ['FakeQuantize']):
             if node.name not in cut_fqs:
                 cut_model, cut_fq_layers, _ = self._graph_transformer.remove_fq_nodes(
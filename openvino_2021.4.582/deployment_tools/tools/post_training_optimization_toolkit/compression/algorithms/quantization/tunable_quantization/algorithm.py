@@ -44,7 +44,7 @@ class TunableQuantization(MinMaxQuantization):
                                         self.params)
 
     def register_statistics(self, model, stats_collector):
-        model = deepcopy(model)
+        model = model.snapshot()
         insert_fake_quantize_nodes(self._config, model, self.params)
         activation_statistics_layout = self.__get_activations_statistics_layout(model, qscheme=self.params)
         stats_collector.register(self.name, activation_statistics_layout, self._sampler)
@@ -72,7 +72,7 @@ class TunableQuantization(MinMaxQuantization):
             config['tuning_scope'] = []
 
         hardware_config = load_hardware_config(config)
-        model = deepcopy(model)
+        model = model.snapshot()
         insert_fake_quantize_nodes(config, model)
         fq_configuration = read_all_fake_quantize_configurations(config, hardware_config, model)
 
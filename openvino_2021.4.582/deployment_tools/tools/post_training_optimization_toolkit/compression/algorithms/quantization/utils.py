@@ -276,7 +276,7 @@ def get_hardware_config_operation_type(node, available_types):
     return node.type
 
 
-def get_tensor_statistics(range_estimator_config, for_weights, **kwargs):
+def get_tensor_statistics(range_estimator_config, for_weights, accumulate=False, **kwargs):
     stats = {}
     for stats_name in ['min', 'max']:
         if stats_name not in range_estimator_config:
@@ -293,6 +293,9 @@ def get_tensor_statistics(range_estimator_config, for_weights, **kwargs):
                 q_value = 1 - q_value
             ts_args.update({'q': q_value})
         stats[stat_mod_name] = TensorStatistic(fn, **ts_args)
+        aggregator = range_estimator_config[stats_name].get('aggregator')
+        if accumulate and not for_weights and aggregator:
+            stats[stat_mod_name].accumulate(aggregator)
     return stats
 
 
@@ -163,7 +163,8 @@ class Config(Dict):
             'shuffle_data': None,
             'seed': None,
             'apply_for_all_nodes': None,
-            'threshold': None
+            'threshold': None,
+            'batched_inference': None
         }
 
         layerwise_finetuning_params = {
@@ -190,6 +191,7 @@ class Config(Dict):
                 'stat_subset_size': None,
                 'shuffle_data': None,
                 'seed': None,
+                'stream_statistics': None,
                 'range_estimator': range_estimator_parameters,
                 'weights': weights_params,
                 'activations': activations_params,
@@ -218,7 +220,8 @@ class Config(Dict):
                 'annotation_free': None,
                 'tune_hyperparams': None,
                 'annotation_conf_threshold': None,
-                'convert_to_mixed_preset': None
+                'convert_to_mixed_preset': None,
+                'ranking_workers_number': None
             },
             'RangeOptimization': {
                 'stat_subset_size': None,
@@ -351,6 +354,7 @@ class Config(Dict):
 
         for req_num in ['stat_requests_number', 'eval_requests_number']:
             ac_conf[req_num] = self.engine[req_num] if req_num in self.engine else None
+        ac_conf['stats_cache_dir'] = self.engine['stats_cache_dir'] if 'stats_cache_dir' in self.engine else None
 
         self['engine'] = ac_conf
 
@@ -20,7 +20,7 @@ import numpy as np
 from .utils import append_stats, process_accumulated_stats
 from ..api.engine import Engine
 from ..data_loaders.ac_data_loader import ACDataLoader
-from ..graph.model_utils import save_model, add_outputs
+from ..graph.model_utils import save_model, serialize_model, add_outputs
 from ..utils.ac_imports import create_model_evaluator, _DEFAULT_LOGGER_NAME
 from ..utils.logger import get_logger, stdout_redirect
 from ..utils.utils import create_tmp_dir, convert_output_key
@@ -49,8 +49,10 @@ class ACEngine(Engine):
         self.dump_prediction_to_annotation = False
         self.calculate_metrics = False
         self.annotation_conf_threshold = 0.0
+        self._registered_metrics = []
+        self._registered_postprocessing = []
 
-    def _set_model_from_files(self, paths):
+    def _set_model_from_ir(self, paths):
         # disable accuracy checker info logging
         logging.getLogger(_DEFAULT_LOGGER_NAME).setLevel(logging.WARNING)
         # load IR model
@@ -66,22 +68,31 @@ class ACEngine(Engine):
         and stores it in Engine class
         :param paths: list of dictionaries
         'name': name of the model (only for cascaded models)
-        'model': path to the .xml model file,
-        'weights': path to the .bin weights file
+        'model': path to the .xml model file (or its content as bytes if supports_ir_in_memory),
+        'weights': path to the .bin weights file (or its content as bytes if supports_ir_in_memory)
         """
-        stdout_redirect(self._set_model_from_files, paths)
+        stdout_redirect(self._set_model_from_ir, paths)
 
     def set_model(self, model):
         """ Load NetworkX model into InferenceEngine and stores it in Engine class
         :param model: NXModel instance
         """
         def _set_model(path):
+            if self.supports_ir_in_memory(model):
+                # pass serialized IR to accuracy checker directly to avoid saving it to the disk
+                model_buffers = serialize_model(model, for_stat_collection=True)
+                self._set_model_from_ir(model_buffers)
+                return
             tmp_model_name = 'tmp_model'
             paths = save_model(model, path, tmp_model_name, for_stat_collection=True)
-            self._set_model_from_files(paths)
+            self._set_model_from_ir(paths)
 
         stdout_redirect(_set_model, self._tmp_dir.name)
 
+    def supports_ir_in_memory(self, model):
+        """ Custom evaluators of cascaded models load IR only from files """
+        return not model.is_cascade and hasattr(self._model_evaluator, 'launcher')
+
     def set_dataset_tag(self, dataset_tag: str):
         """ Sets the dataset tag of accuracy checker that will be used in
         the future calls of the method `predict`.
@@ -191,11 +202,11 @@ class ACEngine(Engine):
         return metrics, accumulated_stats
 
     def _load_model(self, paths):
-        """ Loads IR model from disk
+        """ Loads IR model from disk or memory
         :param paths: list of dictionaries:
         'name': name of the model (only for cascaded models)
-        'model': path to the .xml model file,
-        'weights': path to the .bin weights file
+        'model': path to the .xml model file or its content as bytes,
+        'weights': path to the .bin weights file or its content as bytes
         :return list of dictionaries:
         'name': name of the model (only for cascaded models)
         'model': IE model instance
@@ -238,9 +249,21 @@ class ACEngine(Engine):
 
     def add_metric(self, metric_config):
         self._model_evaluator.register_metric(metric_config)
+        self._registered_metrics.append(metric_config)
 
     def add_postprocessing(self, postprocessing_config):
         self._model_evaluator.register_postprocessor(postprocessing_config)
+        self._registered_postprocessing.append(postprocessing_config)
+
+    @property
+    def registered_metrics(self):
+        """ Metrics added to the engine in addition to the ones from config """
+        return self._registered_metrics
+
+    @property
+    def registered_postprocessing(self):
+        """ Postprocessing added to the engine in addition to the one from config """
+        return self._registered_postprocessing
 
     @property
     def evaluation_dataset_tag(self):
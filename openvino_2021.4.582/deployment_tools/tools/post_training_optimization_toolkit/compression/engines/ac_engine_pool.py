@@ -0,0 +1,111 @@
+#
+# Copyright 2020-2021 Intel Corporation.
+#
+# LEGAL NOTICE: Your use of this software and any required dependent software
+# (the "Software Package") is subject to the terms and conditions of
+# the Intel(R) OpenVINO(TM) Distribution License for the Software Package,
+# which may also include notices, disclaimers, or license terms for
+# third party or open source software included in or with the Software Package,
+# and your use indicates your acceptance of all such terms. Please refer
+# to the "third-party-programs.txt" or other similarly-named text file
+# included with the Software Package for additional details.
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+
+from .ac_engine import ACEngine
+from ..graph.model_utils import save_model, serialize_model
+from ..samplers.index_sampler import IndexSampler
+from ..utils.logger import get_logger
+from ..utils.utils import create_tmp_dir
+
+logger = get_logger(__name__)
+
+# ACEngine instance of the worker process
+_worker_engine = None
+
+
+def _init_worker(engine_config, metrics, postprocessing, dataset_tag):
+    global _worker_engine  # pylint: disable=W0603
+    _worker_engine = ACEngine(engine_config)
+    for metric_config in metrics:
+        _worker_engine.add_metric(metric_config)
+    for postprocessing_config in postprocessing:
+        _worker_engine.add_postprocessing(postprocessing_config)
+    _worker_engine.set_dataset_tag(dataset_tag)
+    _worker_engine.calculate_metrics = True
+    _worker_engine.allow_pairwise_subset = True
+
+
+def _evaluate_model(model_ir, subset_indices):
+    _worker_engine.set_model_from_files(model_ir)
+    metrics, _ = _worker_engine.predict(sampler=IndexSampler(subset_indices=subset_indices))
+    return metrics
+
+
+class ACEnginePool:
+    """ Pool of worker processes evaluating several models concurrently.
+    Every worker creates its own ACEngine (and IECore) from the config of the given engine
+    and repeats metrics and postprocessing registered in it.
+    """
+
+    def __init__(self, engine: ACEngine, workers_number):
+        """ Constructor
+        :param engine: ACEngine instance to replicate
+        :param workers_number: number of worker processes
+        """
+        config = deepcopy(engine.config)
+        if config.get('eval_requests_number') is None:
+            # share CPU cores between workers instead of running each of them in throughput mode
+            config['eval_requests_number'] = max(1, multiprocessing.cpu_count() // workers_number)
+        self._engine = engine
+        self._workers_number = workers_number
+        self._tmp_dir = create_tmp_dir()
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers_number, mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(config, engine.registered_metrics, engine.registered_postprocessing, engine.dataset_tag))
+
+    def evaluate(self, models, subset_indices):
+        """ Evaluates models on the dataset subset
+        :param models: iterable of (key, NXModel) pairs. It is consumed lazily,
+        so only a few models are kept in memory at the same time
+        :param subset_indices: list of dataset indices to evaluate models on
+        :return generator of (key, metrics) pairs in the same order as models
+        """
+        pending = deque()
+        subset_indices = list(subset_indices)
+        for model_id, (key, model) in enumerate(models):
+            model_ir = self._get_model_ir(model, model_id)
+            pending.append((key, model_ir, self._executor.submit(_evaluate_model, model_ir, subset_indices)))
+            if len(pending) >= 2 * self._workers_number:
+                yield self._get_result(*pending.popleft())
+        while pending:
+            yield self._get_result(*pending.popleft())
+
+    def close(self):
+        self._executor.shutdown()
+        self._tmp_dir.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _get_model_ir(self, model, model_id):
+        if self._engine.supports_ir_in_memory(model):
+            return serialize_model(model, for_stat_collection=True)
+        return save_model(model, self._tmp_dir.name, 'tmp_model_{}'.format(model_id), for_stat_collection=True)
+
+    @staticmethod
+    def _get_result(key, model_ir, future):
+        metrics = future.result()
+        for model_dict in model_ir:
+            if isinstance(model_dict['model'], str):
+                os.remove(model_dict['model'])
+                os.remove(model_dict['weights'])
+        return key, metrics
@@ -11,21 +11,27 @@
 # included with the Software Package for additional details.
 
 import multiprocessing
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil
-from time import time, sleep
+from time import time
 
 import numpy as np
 from openvino.inference_engine import IECore
 
-from .utils import append_stats, process_accumulated_stats
+from .utils import append_stats, append_computed_stats, compute_stats, process_accumulated_stats
 from ..api.engine import Engine
-from ..graph.model_utils import save_model
+from ..graph.model_utils import serialize_model
 from ..samplers.batch_sampler import BatchSampler
 from ..utils.logger import get_logger
-from ..utils.utils import create_tmp_dir, convert_output_key
+from ..utils.utils import convert_output_key
 
 logger = get_logger(__name__)
 
+# events of the asynchronous inference loop
+INFERENCE_COMPLETED = 'inference_completed'
+STATISTICS_COMPUTED = 'statistics_computed'
+
 
 class IEEngine(Engine):
 
@@ -36,7 +42,6 @@ class IEEngine(Engine):
         self._output_layers = None
         self._accumulated_layer_stats = dict()
         self._per_sample_metrics = []
-        self._tmp_dir = create_tmp_dir()
 
     def set_model(self, model):
         """ Loads NetworkX model into InferenceEngine and stores it in Engine class
@@ -45,7 +50,7 @@ class IEEngine(Engine):
         if model.is_cascade:
             raise Exception('Cascade models are not supported in current engine')
 
-        # save NetworkX graph to IR and use it to initialize IE Network
+        # serialize NetworkX graph to IR in memory and use it to initialize IE Network
         self._model = self._set_model(model)[0]['model']
         self._output_layers = list(self._model.outputs.keys())
 
@@ -60,13 +65,14 @@ class IEEngine(Engine):
                     },
                 ]
         """
-        paths = save_model(model, self._tmp_dir.name, 'tmp_model', for_stat_collection=True)
+        model_buffers = serialize_model(model, for_stat_collection=True)
         ie_networks = []
-        for path_dict in paths:
-            ie_net = {'model': self._ie.read_network(model=path_dict['model'],
-                                                     weights=path_dict['weights'])}
-            if 'name' in path_dict:
-                ie_net.update(name=path_dict['name'])
+        for buffer_dict in model_buffers:
+            ie_net = {'model': self._ie.read_network(model=buffer_dict['model'],
+                                                     weights=buffer_dict['weights'],
+                                                     init_from_buffer=True)}
+            if 'name' in buffer_dict:
+                ie_net.update(name=buffer_dict['name'])
             ie_networks.append(ie_net)
         return ie_networks
 
@@ -177,8 +183,11 @@ class IEEngine(Engine):
         :param stats_layout: dict of stats collection functions {layer_name: [fn]}
         :param annotations: list of annotations [(img_id, annotation)]
         """
-        dataset_index = annotations[0][0] if annotations is not None and annotations[0][0] else 0
-        append_stats(self._accumulated_layer_stats, stats_layout, outputs, dataset_index)
+        append_stats(self._accumulated_layer_stats, stats_layout, outputs, self._get_dataset_index(annotations))
+
+    @staticmethod
+    def _get_dataset_index(annotations):
+        return annotations[0][0] if annotations is not None and annotations[0][0] else 0
 
     def _update_metrics(self, output, annotations, need_metrics_per_sample=False):
         """ Updates metrics.
@@ -199,42 +208,32 @@ class IEEngine(Engine):
                                                          'metric_name': metric_name,
                                                          'result': metric_value[i]})
 
-    def _populate_free_requests(self, free_irs, queued_irs, data_iterator):
+    def _populate_free_requests(self, free_irs, queued_irs, infer_requests, data_iterator):
         """Fills free inference requests with new data batch and start inference
-        :param free_irs: list of completed infer requests
-        :param queued_irs: list of running infer requests with corresponding image ids
+        :param free_irs: list of ids of completed infer requests
+        :param queued_irs: dict of running infer requests ids with corresponding batch data
+        :param infer_requests: list of infer requests
         :param data_iterator: dataset iterator
         """
-        for ir in free_irs:
+        for ir_id in free_irs:
             data_batch = next(data_iterator, None)
             if not data_batch:
                 break
             batch_id, batch = data_batch
             image_ids, images, batch_meta = self._process_batch(batch)
-            ir.async_infer(inputs=self._fill_input(self._model, images))
-            queued_irs.append((batch_id, image_ids, batch_meta, ir))
+            queued_irs[ir_id] = (batch_id, image_ids, batch_meta)
+            infer_requests[ir_id].async_infer(inputs=self._fill_input(self._model, images))
 
         free_irs.clear()
 
     @staticmethod
-    def _wait_for_any(irs):
-        """Waits for any queued infer requests to finish inference.
-        :param irs: list of queued infer requests
-        :return list of results of completed infer requests [(batch_id, annotations, layer_outputs, infer_request)]
-                list of queued infer requests
+    def _get_output_buffers(ir):
+        """Returns outputs of the completed infer request.
+        Arrays share memory with output blobs, so they are valid until the request is started again
+        :param ir: infer request
+        :return dict of layer outputs {layer_name: ndarray}
         """
-        if not irs:
-            return [], []
-
-        result = []
-        free_indexes = []
-        for ir_id, (batch_id, image_annotations, batch_meta, ir) in enumerate(irs):
-            if ir.wait(0) == 0:
-                outputs = {out_name: out_blob.buffer for out_name, out_blob in ir.output_blobs.items()}
-                result.append((batch_id, image_annotations, batch_meta, outputs, ir))
-                free_indexes.append(ir_id)
-        irs = [ir for ir_id, ir in enumerate(irs) if ir_id not in free_indexes]
-        return result, irs
+        return {out_name: out_blob.buffer for out_name, out_blob in ir.output_blobs.items()}
 
     def _fill_input(self, model, image_batch):
         """Matches network input name with corresponding input batch
@@ -293,7 +292,10 @@ class IEEngine(Engine):
 
     def _process_dataset_async(self, stats_layout, sampler, print_progress=False,
                                need_metrics_per_sample=False, requests_num=0):
-        """Performs model inference on specified dataset subset asynchronously
+        """Performs model inference on specified dataset subset asynchronously.
+        Infer requests notify about their completion through the callback. Statistics are computed
+        from output blobs memory in a thread pool, while other requests continue inference.
+        The request is started with the new data batch only after its outputs are processed
         :param stats_layout: dict of stats collection functions {node_name: [fn]}(optional)
         :param sampler: sampling dataset to make inference
         :param print_progress: whether to print inference progress
@@ -307,37 +309,57 @@ class IEEngine(Engine):
         executable_model = self._ie.load_network(network=self._model,
                                                  device_name=self.config.device,
                                                  num_requests=requests_num)
-        free_irs = executable_model.requests
-        queued_irs = []
-        wait_time = 0.01
+        infer_requests = executable_model.requests
+        events = queue.Queue()
+        for ir_id, ir in enumerate(infer_requests):
+            ir.set_completion_callback(
+                lambda status, ir_id: events.put((INFERENCE_COMPLETED, ir_id, status)), ir_id)
+
+        free_irs = list(range(len(infer_requests)))
+        queued_irs = {}
+        stats_executor = ThreadPoolExecutor(max_workers=len(infer_requests)) if stats_layout else None
 
         progress_log_fn('Start inference of %d images', len(sampler))
 
         sampler_iter = iter(enumerate(sampler))
         # Start inference
         start_time = time()
-        while free_irs or queued_irs:
-            self._populate_free_requests(free_irs, queued_irs, sampler_iter)
-
-            ready_irs, queued_irs = self._wait_for_any(queued_irs)
-            if ready_irs:
-                wait_time = 0.01
-                while ready_irs:
-                    batch_id, batch_annotations, batch_meta, predictions, ir = ready_irs.pop(0)
-                    free_irs.append(ir)
-
-                    self._process_infer_output(stats_layout, predictions,
-                                               batch_annotations, batch_meta,
-                                               need_metrics_per_sample)
-
-                    # Print progress
-                    if self._print_inference_progress(progress_log_fn,
-                                                      batch_id, len(sampler),
-                                                      start_time, time()):
-                        start_time = time()
-            else:
-                sleep(wait_time)
-                wait_time = max(wait_time * 2, .16)
+        try:
+            self._populate_free_requests(free_irs, queued_irs, infer_requests, sampler_iter)
+            while queued_irs:
+                event, ir_id, result = events.get()
+                batch_id, batch_annotations, batch_meta = queued_irs[ir_id]
+                predictions = self._get_output_buffers(infer_requests[ir_id])
+
+                if event == INFERENCE_COMPLETED:
+                    if result != 0:
+                        raise RuntimeError('Infer request {} failed with status {}'.format(ir_id, result))
+                    if stats_executor:
+                        future = stats_executor.submit(_compute_stats_from_buffers, stats_layout, predictions)
+                        future.add_done_callback(
+                            lambda f, ir_id=ir_id: events.put((STATISTICS_COMPUTED, ir_id, f)))
+                        continue
+                else:
+                    append_computed_stats(self._accumulated_layer_stats, stats_layout,
+                                          result.result(), self._get_dataset_index(batch_annotations))
+
+                self._process_infer_output(None, predictions,
+                                           batch_annotations, batch_meta,
+                                           need_metrics_per_sample)
+
+                # Outputs are processed, the request can be reused
+                del queued_irs[ir_id]
+                free_irs.append(ir_id)
+                self._populate_free_requests(free_irs, queued_irs, infer_requests, sampler_iter)
+
+                # Print progress
+                if self._print_inference_progress(progress_log_fn,
+                                                  batch_id, len(sampler),
+                                                  start_time, time()):
+                    start_time = time()
+        finally:
+            if stats_executor:
+                stats_executor.shutdown()
 
         progress_log_fn('Inference finished')
 
@@ -428,3 +450,17 @@ class IEEngine(Engine):
         stats_layout_ie_style = {convert_output_key(key): value
                                  for key, value in stats_layout.items()}
         return stats_layout_ie_style, stat_names_aliases
+
+
+def _compute_stats_from_buffers(stats_layout, outputs):
+    """ Computes statistics from output blobs memory. Results which share
+    memory with blobs are copied since the request will be reused for inference
+    """
+    buffers = list(outputs.values())
+    computed_stats = compute_stats(stats_layout, outputs)
+    for layer_stats in computed_stats.values():
+        for stat_name, stat_value in layer_stats.items():
+            if isinstance(stat_value, np.ndarray) and \
+                    any(np.may_share_memory(stat_value, buffer) for buffer in buffers):
+                layer_stats[stat_name] = stat_value.copy()
+    return computed_stats
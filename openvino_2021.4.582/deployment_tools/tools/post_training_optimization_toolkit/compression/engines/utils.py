@@ -13,23 +13,50 @@
 from collections import defaultdict
 import numpy as np
 
-from ..statistics.statistics import compute_statistic
+from ..statistics.statistics import Statistic, compute_statistic
+from ..statistics.function_selector import get_accumulator
+from ..statistics.functions.aggregation import StatisticAccumulator
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 def append_stats(accumulated_layer_stats, stats_layout, value, dataset_index):
+    append_computed_stats(accumulated_layer_stats, stats_layout,
+                          compute_stats(stats_layout, value), dataset_index)
+
+
+def compute_stats(stats_layout, value):
+    """ Computes statistics of layer outputs without accumulating them.
+    Reads outputs only, so it is safe to run it on the memory of an inference request
+    :param stats_layout: dict of stats collection functions {layer_name: {stat_name: fn}}
+    :param value: dict of layer outputs {layer_name: output} or a list of such dicts for sequential models
+    :return dict of computed statistics {layer_name: {stat_name: value}}
+    """
     if isinstance(value, list):
         value = parse_sequential_stats(value, stats_layout)
 
-    for layer in value:
-        if layer in stats_layout:
-            if layer not in accumulated_layer_stats:
-                accumulated_layer_stats[layer] = {stat_name: [] for stat_name in stats_layout[layer]}
-            for stat_name, stat_fn in stats_layout[layer].items():
-                accumulated_layer_stats[layer][stat_name].append(
-                    (dataset_index, compute_statistic(stat_fn, value, layer)))
+    return {layer: {stat_name: compute_statistic(stat_fn, value, layer)
+                    for stat_name, stat_fn in stats_layout[layer].items()}
+            for layer in value if layer in stats_layout}
+
+
+def append_computed_stats(accumulated_layer_stats, stats_layout, computed_stats, dataset_index):
+    for layer, layer_stats in computed_stats.items():
+        if layer not in accumulated_layer_stats:
+            accumulated_layer_stats[layer] = {
+                stat_name: get_accumulator(stat_fn.aggregator) if is_accumulated(stat_fn) else []
+                for stat_name, stat_fn in stats_layout[layer].items()}
+        for stat_name, stat_fn in stats_layout[layer].items():
+            stat_value = layer_stats[stat_name]
+            if is_accumulated(stat_fn):
+                accumulated_layer_stats[layer][stat_name].update(dataset_index, stat_value)
+            else:
+                accumulated_layer_stats[layer][stat_name].append((dataset_index, stat_value))
+
+
+def is_accumulated(stat_fn):
+    return isinstance(stat_fn, Statistic) and stat_fn.aggregator is not None
 
 
 def parse_sequential_stats(value_sequential, stats_layout):
@@ -48,6 +75,8 @@ def parse_sequential_stats(value_sequential, stats_layout):
 def process_accumulated_stats(accumulated_stats, stat_names_aliases=None):
     for layer in accumulated_stats:
         for stat in accumulated_stats[layer]:
+            if isinstance(accumulated_stats[layer][stat], StatisticAccumulator):
+                continue
             accumulated_stats[layer][stat].sort(key=lambda el: el[0])
             accumulated_stats[layer][stat] = [el[1] for el in accumulated_stats[layer][stat]]
 
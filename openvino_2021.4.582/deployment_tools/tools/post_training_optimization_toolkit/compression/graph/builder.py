@@ -83,21 +83,28 @@ def make_copy_fake_quantize(nodes, edges, fq):
 
 
 def make_copy_graph_attrs(model, input_name, input_shape):
+    return make_copy_graph_attrs_for_inputs(model, {input_name: input_shape})
+
+
+def make_copy_graph_attrs_for_inputs(model, inputs):
     graph_attrs = deepcopy(model.graph)
     meta_data = deepcopy(model.meta_data)
 
+    placeholder_shapes = next(iter(inputs.values())) if len(inputs) == 1 else inputs
+    input_shape = ','.join('[{}]'.format(','.join([str(v) for v in shape])) for shape in inputs.values())
+
     # if 'user_shapes' in graph_attrs and graph_attrs['user_shapes'] is not None:
     #     graph_attrs['user_shapes'][graph_attrs['inputs'][0]][0]['shape'] = input_shape
-    graph_attrs['inputs'] = [input_name]
+    graph_attrs['inputs'] = list(inputs)
     graph_attrs['cmd_params'].mean_values = None
-    graph_attrs['cmd_params'].placeholder_shapes = input_shape
-    graph_attrs['cmd_params'].input_shape = '[{}]'.format(','.join([str(v) for v in input_shape]))
+    graph_attrs['cmd_params'].placeholder_shapes = placeholder_shapes
+    graph_attrs['cmd_params'].input_shape = input_shape
     graph_attrs['cmd_params'].scale_values = None
     graph_attrs['cmd_params'].mean_scale_values = None
 
     meta_data['mean_values'] = None
-    meta_data['placeholder_shapes'] = input_shape
-    meta_data['input_shape'] = '[{}]'.format(','.join([str(v) for v in input_shape]))
+    meta_data['placeholder_shapes'] = placeholder_shapes
+    meta_data['input_shape'] = input_shape
     meta_data['scale_values'] = None
     meta_data['mean_scale_values'] = None
     return graph_attrs, meta_data
@@ -113,6 +120,68 @@ def build_graph_for_node(model, input_name, input_shape, node, remove_bias=False
      :param remove_fake_quantize: remove fake quantize nodes in the generated graph
      :return: generated graph.
     """
+    nodes, edges = make_subgraph_for_node(input_name, input_shape, node, remove_bias, remove_fake_quantize)
+    graph = build_graph(*make_copy_graph_attrs(model, input_name, input_shape), nodes, edges)
+    graph.ir_v10 = True
+    return graph
+
+
+def build_graphs_for_nodes(model, nodes_inputs, remove_bias=False, remove_fake_quantize=False):
+    """ Build the Graphs containing independent subgraphs (input - node - output) for several nodes.
+    Subgraphs are combined into as few graphs as possible. Nodes with the same name in different
+    subgraphs are copies of the same node of the source model, so they are shared between subgraphs.
+    Subgraphs are put into different graphs only if the input of one subgraph has the same name
+    as a node of another subgraph or as the input of another shape.
+     :param model: source model
+     :param nodes_inputs: list of tuples (node, input_name, input_shape)
+     :param remove_bias: remove bias in the generated graphs
+     :param remove_fake_quantize: remove fake quantize nodes in the generated graphs
+     :return: list of tuples (generated graph, list of nodes which subgraphs are in the graph)
+    """
+    def has_conflicts(batch, input_name, input_shape, node_names):
+        if input_name in batch['inputs']:
+            if list(batch['inputs'][input_name]) != list(input_shape):
+                return True
+        elif input_name in batch['nodes']:
+            return True
+        return any(name in batch['inputs'] for name in node_names)
+
+    batches = []
+    for node, input_name, input_shape in nodes_inputs:
+        nodes, edges = make_subgraph_for_node(input_name, input_shape, node, remove_bias, remove_fake_quantize)
+        node_names = [subgraph_node[0] for subgraph_node in nodes[1:]]
+        for batch in batches:
+            if not has_conflicts(batch, input_name, input_shape, node_names):
+                break
+        else:
+            batch = {'inputs': {}, 'nodes': {}, 'edges': {}, 'source_nodes': []}
+            batches.append(batch)
+        batch['inputs'][input_name] = input_shape
+        for subgraph_node in nodes:
+            batch['nodes'].setdefault(subgraph_node[0], subgraph_node)
+        for edge in edges:
+            batch['edges'].setdefault((edge[0], edge[1], edge[2]['out'], edge[2]['in']), edge)
+        batch['source_nodes'].append(node)
+
+    graphs = []
+    for batch in batches:
+        graph = build_graph(*make_copy_graph_attrs_for_inputs(model, batch['inputs']),
+                            list(batch['nodes'].values()), list(batch['edges'].values()))
+        graph.ir_v10 = True
+        graphs.append((graph, batch['source_nodes']))
+    return graphs
+
+
+def make_subgraph_for_node(input_name, input_shape, node, remove_bias=False, remove_fake_quantize=False):
+    """ Make nodes and edges of the subgraph (input - node - output) for build_graph.
+    The input node is always the first one in the list of nodes.
+     :param input_name: name of the input node in the generated subgraph
+     :param input_shape: shape of the input node in the generated subgraph
+     :param node: node for which subgraph (input - node - output) will be generated
+     :param remove_bias: remove bias in the generated subgraph
+     :param remove_fake_quantize: remove fake quantize nodes in the generated subgraph
+     :return: tuple of lists of nodes and edges.
+    """
     nodes, edges = [], []
     nodes.append((input_name, 'Parameter', {'name': input_name, 'shape': input_shape, 'type': 'Parameter'}))
 
@@ -146,6 +215,4 @@ def build_graph_for_node(model, input_name, input_shape, node, remove_bias=False
     result_name = '{}/out'.format(node.name)
     nodes.append((result_name, 'Result', {}))
     edges.append((node.name, result_name, {'out': 0, 'in': 0}))
-    graph = build_graph(*make_copy_graph_attrs(model, input_name, input_shape), nodes, edges)
-    graph.ir_v10 = True
-    return graph
+    return nodes, edges
@@ -12,8 +12,10 @@
 import os
 from copy import deepcopy
 
+import numpy as np
+
 from mo.graph.graph import Graph
-from mo.utils.ir_reader.restore_graph import restore_graph_from_ir, save_restored_graph
+from mo.utils.ir_reader.restore_graph import restore_graph_from_ir, save_restored_graph, serialize_restored_graph
 from mo.utils.logger import init_logger
 
 from ..graph.passes import ModelPreprocessor
@@ -61,8 +63,32 @@ def save_graph(graph: Graph, save_path, model_name=None):
             raise PermissionError(
                 'Output directory {} is not writable for the current user. '.format(save_path))
 
-    save_restored_graph(graph=deepcopy(graph), path=save_path, meta_data=graph.meta_data,
-                        name=model_name)
+    save_restored_graph(graph=deepcopy(graph, share_constant_values(graph, {})), path=save_path,
+                        meta_data=graph.meta_data, name=model_name)
+
+
+def serialize_graph(graph: Graph):
+    """ Serialize model to IR in memory
+    :param graph: NetworkX model to serialize
+    :return tuple of IR xml and weights as bytes
+     """
+    return serialize_restored_graph(graph=deepcopy(graph, share_constant_values(graph, {})),
+                                    meta_data=graph.meta_data)
+
+
+def share_constant_values(graph: Graph, memo):
+    """ Adds constant values of the graph to deepcopy memo, so that graph copies share them
+    instead of copying. Shared values are marked as read-only to prevent in-place modification
+    :param graph: NetworkX model
+    :param memo: deepcopy memo dictionary to update
+    :return updated memo
+     """
+    for _, attrs in graph.nodes(data=True):
+        value = attrs.get('value')
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            value.flags.writeable = False
+            memo[id(value)] = value
+    return memo
 
 
 def model_preprocessing(model):
@@ -10,6 +10,8 @@
 # to the "third-party-programs.txt" or other similarly-named text file
 # included with the Software Package for additional details.
 
+from collections import OrderedDict
+
 import networkx as nx
 from mo.graph.graph import Node
 
@@ -42,6 +44,19 @@ def save_model(model: NXModel, save_path, model_name=None, for_stat_collection=F
     return model_paths
 
 
+def serialize_model(model: NXModel, for_stat_collection=False):
+    """ Serialize model as IR in memory
+    :param model: NXModel instance to serialize
+    :param for_stat_collection: whether model is serialized to be used
+    for statistic collection or for normal inference (affects only cascaded models)
+    :return model_buffers: list of dictionaries:
+    'name': model name (for cascade models only)
+    'model': IR xml as bytes
+    'weights': IR weights as bytes
+    """
+    return model.serialize(for_stat_collection=for_stat_collection)
+
+
 def add_outputs(models, node_names):
     """ Applies add_outputs to each model in models
     param models: list of dictionaries
@@ -115,6 +130,33 @@ def build_model_for_node(nx_model, input_name, input_shape, node, remove_bias=Fa
     return NXModel(graph=op_graph)
 
 
+def build_models_for_nodes(nx_model, nodes_inputs, remove_bias=False, remove_fake_quantize=False):
+    """ Build Models containing independent Subgraphs of NXModel (input - node - output) for several nodes.
+    Subgraphs are combined into as few models as possible to infer them at once.
+    The Convolution, FullyConnected node types are supported.
+    :param nx_model: NXModel model
+    :param nodes_inputs: list of tuples (node, input_name, input_shape) where input_name and input_shape
+    are name and shape of the input node of the node subgraph
+    :param remove_bias: remove bias in the generated graphs
+    :param remove_fake_quantize: remove fake quantize nodes in the generated graphs
+    :return: list of tuples (generated NXModel instance, list of nodes which subgraphs are in the model).
+    """
+    nodes_inputs_by_model = OrderedDict()
+    for node, input_name, input_shape in nodes_inputs:
+        candidates = [model_id for model_id, model_dict in enumerate(nx_model.models)
+                      if ge.get_node_by_name(model_dict['model'], input_name)]
+        if len(candidates) > 1:
+            raise RuntimeError('Name collision: {}'.format(input_name))
+        nodes_inputs_by_model.setdefault(candidates[0], []).append((node, input_name, input_shape))
+
+    models = []
+    for model_id, model_nodes_inputs in nodes_inputs_by_model.items():
+        op_graphs = gb.build_graphs_for_nodes(nx_model.models[model_id]['model'], model_nodes_inputs,
+                                              remove_bias, remove_fake_quantize)
+        models.extend((NXModel(graph=op_graph), nodes) for op_graph, nodes in op_graphs)
+    return models
+
+
 def models_union(first_model, second_model):
     """ Return the union of NXModel models
     :return NXModel instance - union of first_model and second_model
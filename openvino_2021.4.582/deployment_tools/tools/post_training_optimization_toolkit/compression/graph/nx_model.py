@@ -15,7 +15,7 @@ from copy import deepcopy
 from addict import Dict
 import networkx as nx
 
-from compression.graph.graph_utils import load_graph, save_graph
+from compression.graph.graph_utils import load_graph, save_graph, serialize_graph, share_constant_values
 from compression.graph import editor as ge
 from compression.graph.utils import is_ignored, preprocess_ignored_params
 from compression.utils.logger import get_logger, stdout_redirect
@@ -75,6 +75,18 @@ class NXModel:
     def models(self):
         return self._models
 
+    def snapshot(self):
+        """ Creates a copy of the model which shares constant values (weights) with this model.
+        Graph structure and node attributes are copied, so the snapshot can be changed independently
+        or kept to restore the model state later. Shared values become read-only: constant values
+        have to be replaced (e.g. by set_node_value), not modified in-place.
+        :return NXModel instance
+        """
+        memo = {}
+        for model_dict in self._models:
+            share_constant_values(model_dict['model'], memo)
+        return deepcopy(self, memo)
+
     @property
     def is_cascade(self):
         return self._is_cascade
@@ -113,6 +125,31 @@ class NXModel:
 
         return model_paths
 
+    def serialize(self, for_stat_collection=False):
+        """ Serialize model to IR in memory
+        :param for_stat_collection: whether model is serialized to be used
+        for statistic collection or for normal inference (affects only cascaded models).
+        If set to False, removes model prefixes from node names.
+        :return model_buffers: list of dictionaries:
+        'name': model name (for cascade models only)
+        'model': IR xml as bytes
+        'weights': IR weights as bytes
+         """
+        if not for_stat_collection:
+            self._remove_models_prefix()
+        model_buffers = []
+        for model_dict in self._models:
+            model_buffer = {}
+            if self._is_cascade:
+                model_buffer['name'] = model_dict['name']
+            model_buffer['model'], model_buffer['weights'] = stdout_redirect(serialize_graph, model_dict['model'])
+            model_buffers.append(model_buffer)
+
+        if not for_stat_collection:
+            self._restore_models_prefix()
+
+        return model_buffers
+
     def pseudo_topological_sort(self):
         return [node for model_dict in self._models
                 for node in model_dict['model'].pseudo_topological_sort()]
@@ -10,6 +10,7 @@
 # to the "third-party-programs.txt" or other similarly-named text file
 # included with the Software Package for additional details.
 
+import multiprocessing
 import os
 import time
 from copy import deepcopy
@@ -22,17 +23,45 @@ import pandas as pd
 import hyperopt as hpo
 from hyperopt import fmin, hp, STATUS_OK, Trials
 
+from addict import Dict
+
+from compression.algorithms.algorithm_selector import get_algorithm
 from compression.benchmark.benchmark import benchmark_embedded, set_benchmark_config
-from compression.graph.model_utils import compress_model_weights
+from compression.engines.ac_engine import ACEngine
+from compression.graph.model_utils import compress_model_weights, load_model, save_model
 from compression.optimization.optimizer import Optimizer
-from compression.optimization.tpe.multinode import Multinode
+from compression.optimization.tpe.local_multinode import LocalMultinode, RESTORATION_TIME_LIMIT_S
+from compression.pipeline.pipeline import Pipeline
 from compression.samplers.index_sampler import IndexSampler
 from compression.utils.logger import get_logger
 from compression.utils.object_dump import object_load, object_dump
 
+try:
+    from compression.optimization.tpe.multinode import Multinode
+except ImportError:
+    Multinode = None
+
 logger = get_logger(__name__)
 
 
+def _run_local_worker(worker_id, optimizer_config, algorithms_config, engine_config, metrics, postprocessing,
+                      dataset_tag, model_config, run_files):
+    """ Entry point of the local multinode client process: recreates engine, pipeline
+    and optimizer from configs of the server process and runs trials
+    """
+    engine = ACEngine(engine_config)
+    for metric_config in metrics:
+        engine.add_metric(metric_config)
+    for postprocessing_config in postprocessing:
+        engine.add_postprocessing(postprocessing_config)
+    engine.set_dataset_tag(dataset_tag)
+    pipeline = Pipeline(engine)
+    for algo_config in algorithms_config:
+        pipeline.add_algo(get_algorithm(algo_config.name)(algo_config.params, engine))
+    optimizer = TpeOptimizer(optimizer_config, pipeline, engine)
+    optimizer.run_local_client(load_model(model_config), worker_id, run_files)
+
+
 class TpeOptimizer(Optimizer):
     def __init__(self, config, pipeline, engine):
         super().__init__(config, pipeline, engine)
@@ -113,7 +142,7 @@ class TpeOptimizer(Optimizer):
 
     def generate_quantized_model(self, params, model):
         self._set_algorithms_params(params)
-        return self._pipeline.run(deepcopy(model))
+        return self._pipeline.run(model.snapshot())
 
     def _set_algorithms_params(self, params):
         for algo in self._pipeline.algo_seq:
@@ -472,6 +501,84 @@ class TpeOptimizer(Optimizer):
         else:
             logger.info('Sorry, TPE can not satisfy accuracy and latency criteria')
 
+    def _create_local_multinode(self, model_name, node_type, name='no_name'):
+        multinode_config = self._config.multinode
+        storage_dir = multinode_config.get('storage_dir') or \
+            os.path.join(self._config.model_log_dir, 'tpe_' + model_name + '_multinode')
+        return LocalMultinode(storage_dir, node_type, multinode_config.get('tag', model_name), name=name,
+                              time_limit=multinode_config.get('time_limit', RESTORATION_TIME_LIMIT_S))
+
+    def _start_local_workers(self, model, run_files):
+        """ Starts client processes evaluating trials concurrently with this (server) process
+        :param model: model to optimize
+        :param run_files: dictionary with paths to files of server process
+        :return list of started processes
+        """
+        workers_number = self._config.multinode.get('workers_number', 1)
+        if workers_number <= 1:
+            return []
+        if not isinstance(self._engine, ACEngine):
+            logger.warning('Local multinode configuration supports only the accuracy checker engine. '
+                           'Trials are evaluated in a single process')
+            return []
+
+        model_paths = save_model(model, os.path.join(self.multinode.storage_dir, 'model'), model.name)
+        model_config = Dict({'model_name': model.name})
+        if model.is_cascade:
+            model_config.cascade = model_paths
+        else:
+            model_config.update(model_paths[0])
+
+        algorithms_config = [Dict({'name': algo.name, 'params': algo.config}) for algo in self._pipeline.algo_seq]
+        optimizer_config = Dict({'name': self.name, 'params': deepcopy(self._config)})
+        optimizer_config.params.multinode.storage_dir = self.multinode.storage_dir
+        optimizer_config.params.trials_load_method = 'cold_start'
+
+        context = multiprocessing.get_context('spawn')
+        workers = []
+        for worker_id in range(1, workers_number):
+            worker = context.Process(
+                target=_run_local_worker,
+                args=(worker_id, optimizer_config, algorithms_config, self._engine.config,
+                      self._engine.registered_metrics, self._engine.registered_postprocessing,
+                      self._engine.dataset_tag, model_config, run_files))
+            worker.start()
+            workers.append(worker)
+        logger.info('Started {} local TPE workers'.format(len(workers)))
+        return workers
+
+    @staticmethod
+    def _join_local_workers(workers, terminate=False):
+        for worker in workers:
+            if terminate:
+                worker.terminate()
+            worker.join()
+            if worker.exitcode:
+                logger.warning('Local TPE worker finished with exit code {}'.format(worker.exitcode))
+
+    def run_local_client(self, model, worker_id, run_files):
+        """ Runs trials in local multinode client process
+        :param model: model to optimize
+        :param worker_id: index of the client process
+        :param run_files: dictionary with paths to files of server process
+        """
+        self._start_time = time.time()
+        self.multinode = self._create_local_multinode(model.name, 'client', name='worker_{}'.format(worker_id))
+        self.multinode.update_or_restore_config(self._config)
+        # server stores fp32 metrics and loss function config before search space
+        self._search_space = self.multinode.restore_remote_search_space()
+        self._configure_hpopt_search_space_and_params(self._search_space)
+        self._fp32_acc, self._fp32_lat = object_load(run_files['fp32_metric_file'])
+        self._restore_tuned_loss_config(run_files['loss_config_file'])
+        self._restore_remote_trials()
+
+        # client keeps its own trials log, the merged one is stored by server
+        worker_suffix = '.worker_{}'.format(worker_id)
+        self._run_trials(self._config.max_trials,
+                         self._config.max_minutes if self._config.max_minutes else 0,
+                         run_files['trials_file'] + worker_suffix,
+                         run_files['best_result_file'] + worker_suffix, model)
+
     def _save_tpe_config(self, tpe_config_file):
         tpe_config_object = self._search_space
         object_dump(tpe_config_object, tpe_config_file)
@@ -513,7 +620,11 @@ class TpeOptimizer(Optimizer):
         best_result_file = os.path.join(self._config.model_log_dir, 'tpe_' + model.name + '_best_result.p')
         loss_config_file = os.path.join(self._config.model_log_dir, 'tpe_' + model.name + '_loss_config.p')
 
-        if 'multinode' in self._config:
+        if 'multinode' in self._config and self._config.multinode.get('type') == 'local':
+            self.multinode = self._create_local_multinode(model.name, 'server')
+        elif 'multinode' in self._config:
+            if Multinode is None:
+                raise ImportError('Pymongo is not installed. Please install it before using multinode configuration.')
             self.multinode = Multinode(self._config, model.name)
             config = self.multinode.update_or_restore_config(self._config)
             if self.multinode.type == "client":
@@ -537,7 +648,24 @@ class TpeOptimizer(Optimizer):
                 os.remove(loss_config_file)
 
         if self._trial_load != 'eval':
-            self.start_trials(model, fp32_metric_file, tpe_config_file, trials_file, best_result_file, loss_config_file)
+            local_workers = []
+            if isinstance(self.multinode, LocalMultinode):
+                local_workers = self._start_local_workers(model, {
+                    'fp32_metric_file': fp32_metric_file, 'loss_config_file': loss_config_file,
+                    'trials_file': trials_file, 'best_result_file': best_result_file})
+                self.multinode.update_or_restore_config(self._config)
+            try:
+                self.start_trials(model, fp32_metric_file, tpe_config_file, trials_file, best_result_file,
+                                  loss_config_file)
+            except BaseException:
+                self._join_local_workers(local_workers, terminate=True)
+                raise
+            self._join_local_workers(local_workers)
+            if local_workers:
+                # collect trials evaluated by local workers
+                self._restore_remote_trials()
+                self._save_trials(trials_file)
+                self._update_best_result(best_result_file)
             if self.multinode is not None:
                 self.multinode.cleanup()
         else:
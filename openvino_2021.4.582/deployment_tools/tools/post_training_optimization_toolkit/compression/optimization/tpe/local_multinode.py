@@ -0,0 +1,214 @@
+#
+# Copyright 2020-2021 Intel Corporation.
+#
+# LEGAL NOTICE: Your use of this software and any required dependent software
+# (the "Software Package") is subject to the terms and conditions of
+# the Intel(R) OpenVINO(TM) Distribution License for the Software Package,
+# which may also include notices, disclaimers, or license terms for
+# third party or open source software included in or with the Software Package,
+# and your use indicates your acceptance of all such terms. Please refer
+# to the "third-party-programs.txt" or other similarly-named text file
+# included with the Software Package for additional details.
+
+import os
+import time
+from contextlib import contextmanager
+from copy import deepcopy
+from pathlib import Path
+
+# pylint: disable=import-error
+from hyperopt import trials_from_docs
+
+from compression.utils.logger import get_logger
+from compression.utils.object_dump import object_dump, object_load
+
+REMOTE_DATA_INFO_FREQ_S = 10
+RESTORATION_TIME_LIMIT_S = 60 * 60
+TRIALS_RESTORATION_TIME_LIMIT_S = 10
+UNLOCK_TIME_LIMIT_S = 60
+LOCK_RETRY_PERIOD_S = 0.1
+
+CONFIG_FILE = 'config_valid'
+SEARCH_SPACE_FILE = 'search_space.p'
+TRIALS_FILE = 'trials.p'
+EVALUATED_PARAMS_FILE = 'evaluated_params.p'
+LOCK_FILE = 'lock'
+
+logger = get_logger(__name__)
+
+
+class LocalMultinode:
+    """ Multi-node configuration for several processes on the same machine.
+    Implements the peer mode of Multinode, but shares search space, trials
+    and evaluated parameters through files in a local directory instead of MongoDB.
+    Updates of trials are guarded by a lock file, files are replaced atomically, so reading needs no lock.
+    """
+
+    def __init__(self, storage_dir, node_type, config_name, name='no_name', time_limit=RESTORATION_TIME_LIMIT_S):
+        """ Constructor
+        :param storage_dir: directory to share data in
+        :param node_type: 'server' or 'client'
+        :param config_name: tag of the group of nodes working together
+        :param name: node name saved in trials results
+        :param time_limit: time limit in seconds to wait for data from server
+        """
+        if node_type not in ['server', 'client']:
+            raise Exception('Illegal value for type in multinode config!')
+        self.type = node_type
+        self.mode = 'peer'
+        self.tag = config_name
+        self.name = name
+        self.time_limit = time_limit
+        self.unlock_time_limit_s = UNLOCK_TIME_LIMIT_S
+        self._storage_dir = Path(storage_dir)
+        self._storage_dir.mkdir(parents=True, exist_ok=True)
+        self._clear_remote_data()
+
+    def _clear_remote_data(self):
+        """ Removes shared data of the previous run """
+        if self.type == 'server':
+            for file_name in [CONFIG_FILE, SEARCH_SPACE_FILE, TRIALS_FILE, EVALUATED_PARAMS_FILE, LOCK_FILE]:
+                if (self._storage_dir / file_name).exists():
+                    (self._storage_dir / file_name).unlink()
+                    logger.info('Shared {} found and removed.'.format(file_name))
+
+    @property
+    def storage_dir(self):
+        return str(self._storage_dir)
+
+    def update_or_restore_config(self, _config, valid=True):
+        """ Mark config as valid (server) or wait for server to do it (client).
+        Config itself is passed to local clients on their start
+        """
+        if self.type == 'client':
+            self._wait_for_file(CONFIG_FILE, self.time_limit)
+            logger.info('Shared config is valid')
+        else:
+            self._update_remote_config(valid)
+            logger.info('Shared config updated')
+        return _config
+
+    def _update_remote_config(self, valid=True):
+        config_file = self._storage_dir / CONFIG_FILE
+        if valid:
+            config_file.touch()
+        elif config_file.exists():
+            config_file.unlink()
+
+    def update_or_restore_fp32(self, _fp32_acc, _fp32_lat):
+        """ All local nodes measure latency themselves (peer mode) """
+        return _fp32_lat
+
+    def update_remote_search_space(self, _search_space):
+        """ Update shared search space."""
+        self._dump(_search_space, SEARCH_SPACE_FILE)
+        logger.info('Shared search space updated under name: {}'.format(self.tag))
+
+    def restore_remote_search_space(self):
+        """ Restore search_space from shared directory."""
+        search_space = object_load(str(self._wait_for_file(SEARCH_SPACE_FILE, self.time_limit)))
+        logger.info('Shared search_space restored')
+        return search_space
+
+    def update_remote_trials(self, _hpopt_trials):
+        """ Write local trials to shared directory.
+            - if some trials already stored, merge the last local trial with them,
+            - if not, store all local trials (for warm start mode),
+        """
+        with self._lock():
+            trials_file = self._storage_dir / TRIALS_FILE
+            if trials_file.exists():
+                remote_trials = object_load(str(trials_file))
+                _hpopt_trials = trials_from_docs(list(remote_trials) +
+                                                 [self._renumber_trial(list(_hpopt_trials)[-1], remote_trials)])
+                logger.info('Shared trials updated. Total: {} (tag: {})'.format(len(_hpopt_trials.trials),
+                                                                                self.tag))
+            else:
+                logger.info('No shared trials. First write for config {}'.format(self.tag))
+            self._dump(_hpopt_trials, TRIALS_FILE)
+        return _hpopt_trials
+
+    @staticmethod
+    def _renumber_trial(trial, remote_trials):
+        """ Local processes generate trial ids concurrently,
+        so the new trial gets the id following ids of already stored trials
+        """
+        tid = max([remote_trial['tid'] for remote_trial in remote_trials], default=-1) + 1
+        trial = deepcopy(trial)
+        trial['tid'] = tid
+        trial['misc']['tid'] = tid
+        trial['misc']['idxs'] = {label: [tid] * len(idxs) for label, idxs in trial['misc']['idxs'].items()}
+        return trial
+
+    def restore_remote_trials(self):
+        """ Restore trials from shared directory."""
+        hpopt_trials = object_load(str(self._wait_for_file(TRIALS_FILE, TRIALS_RESTORATION_TIME_LIMIT_S)))
+        logger.info('Shared trials restored: {}'.format(len(hpopt_trials.trials)))
+        return hpopt_trials
+
+    def update_remote_evaluated_params(self, _evaluated_params):
+        """ Write local evaluated params to shared directory.
+            - if some params already stored, merge the last local params with them,
+            - if not, store all local params (for warm start mode),
+        """
+        with self._lock():
+            params_file = self._storage_dir / EVALUATED_PARAMS_FILE
+            if params_file.exists():
+                remote_params = object_load(str(params_file))
+                if not isinstance(remote_params, list):
+                    raise Exception('Shared parameters object is not a list!!!')
+                _evaluated_params = list(remote_params) + [list(_evaluated_params)[-1]]
+            self._dump(_evaluated_params, EVALUATED_PARAMS_FILE)
+        logger.info('Shared evaluated parameters set updated under name: {}'.format(self.tag))
+        return _evaluated_params
+
+    def restore_remote_evaluated_params(self):
+        """ Restore evaluated_params from shared directory."""
+        evaluated_params = object_load(str(self._wait_for_file(EVALUATED_PARAMS_FILE, self.time_limit)))
+        logger.info('Shared evaluated_params restored')
+        return evaluated_params
+
+    def request_remote_benchmark(self, _model, _iteration):
+        """ Latency is measured by every local node (peer mode) """
+        return None
+
+    def cleanup(self):
+        """ Ending cleanup """
+        if self.type == 'server':
+            self._update_remote_config(valid=False)
+
+    def _dump(self, obj, file_name):
+        """ Writes object to temporary file and renames it, so readers never get partially written data """
+        tmp_file = self._storage_dir / '{}.{}.tmp'.format(file_name, os.getpid())
+        object_dump(obj, str(tmp_file))
+        os.replace(str(tmp_file), str(self._storage_dir / file_name))
+
+    def _wait_for_file(self, file_name, time_limit):
+        file_path = self._storage_dir / file_name
+        time_left = time_limit
+        while time_left:
+            if file_path.exists():
+                return file_path
+            if not time_left % REMOTE_DATA_INFO_FREQ_S:
+                logger.info('Waiting for shared data ({}): {}s'.format(file_name, time_left))
+            time.sleep(1)
+            time_left -= 1
+        raise Exception('WARNING: Time limit for shared data reached!!! config name: {}'.format(self.tag))
+
+    @contextmanager
+    def _lock(self):
+        lock_file = self._storage_dir / LOCK_FILE
+        start_time = time.time()
+        while True:
+            try:
+                lock_fd = os.open(str(lock_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                if time.time() - start_time > self.unlock_time_limit_s:
+                    raise Exception('WARNING: Retry limit for shared data write reached!!!')
+                time.sleep(LOCK_RETRY_PERIOD_S)
+        try:
+            yield
+        finally:
+            os.close(lock_fd)
+            lock_file.unlink()
@@ -0,0 +1,157 @@
+#
+# Copyright 2020-2021 Intel Corporation.
+#
+# LEGAL NOTICE: Your use of this software and any required dependent software
+# (the "Software Package") is subject to the terms and conditions of
+# the Intel(R) OpenVINO(TM) Distribution License for the Software Package,
+# which may also include notices, disclaimers, or license terms for
+# third party or open source software included in or with the Software Package,
+# and your use indicates your acceptance of all such terms. Please refer
+# to the "third-party-programs.txt" or other similarly-named text file
+# included with the Software Package for additional details.
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from ..graph.model_utils import serialize_model
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# engine parameters which do not affect values of collected statistics
+NON_STATISTICS_ENGINE_PARAMS = ['stats_cache_dir', 'stat_requests_number', 'eval_requests_number']
+
+
+class NotCacheableStatistic(Exception):
+    pass
+
+
+class StatisticsCache:
+    """ Persistent storage of collected activation statistics.
+    Every statistic is stored in a separate file, which name is a hash of the model
+    (its IR), the dataset (engine config), the sampled dataset indices, the node name
+    and the statistic function. So statistics collected for the same model and
+    calibration subset in previous runs are not computed again.
+    """
+
+    def __init__(self, cache_dir, engine):
+        """ Constructor
+        :param cache_dir: directory to store statistics in
+        :param engine: engine used for statistics collection
+        """
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # engine config and dataset can be changed after construction, so engine key is computed for every access
+        self._engine = engine
+        self._model_key = None
+
+    def set_model(self, model):
+        """ Sets model which statistics are collected for
+        :param model: NXModel instance
+        """
+        model_hash = hashlib.sha256()
+        for model_buffer in serialize_model(model, for_stat_collection=True):
+            model_hash.update(model_buffer.get('name', '').encode())
+            model_hash.update(model_buffer['model'])
+            model_hash.update(model_buffer['weights'])
+        self._model_key = model_hash.hexdigest()
+
+    def load(self, stats_layout, sampler):
+        """ Loads cached statistics
+        :param stats_layout: dict of stats collection functions {node_name: {stat_fn: stat_fn}}
+        :param sampler: sampler used for statistics collection
+        :return dictionary of found statistics {node_name: {stat_fn: value}}
+        """
+        stats = {}
+        data_key = self._get_data_key(sampler)
+        for node_name, node_stats in stats_layout.items():
+            for stat_fn in node_stats:
+                path = self._get_path(data_key, node_name, stat_fn)
+                if path is None or not path.exists():
+                    continue
+                try:
+                    with path.open('rb') as stat_file:
+                        value = pickle.load(stat_file)
+                except (OSError, EOFError, pickle.UnpicklingError):
+                    logger.debug('Failed to read cached statistic {}, it will be recomputed'.format(path))
+                    continue
+                stats.setdefault(node_name, {})[stat_fn] = value
+        return stats
+
+    def save(self, stats_layout, sampler, stats):
+        """ Stores collected statistics
+        :param stats_layout: dict of stats collection functions {node_name: {stat_fn: stat_fn}}
+        :param sampler: sampler used for statistics collection
+        :param stats: dictionary of collected statistics {node_name: {stat_fn: value}}
+        """
+        data_key = self._get_data_key(sampler)
+        for node_name, node_stats in stats_layout.items():
+            for stat_fn in node_stats:
+                path = self._get_path(data_key, node_name, stat_fn)
+                if path is None or node_name not in stats or stat_fn not in stats[node_name]:
+                    continue
+                # write into temporary file first, so concurrent runs never read partially written statistic
+                fd, tmp_path = tempfile.mkstemp(dir=str(self._cache_dir), suffix='.tmp')
+                with os.fdopen(fd, 'wb') as stat_file:
+                    pickle.dump(stats[node_name][stat_fn], stat_file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, str(path))
+
+    def _get_data_key(self, sampler):
+        return '\n'.join([self._get_engine_key(self._engine), self._get_sampler_key(sampler)])
+
+    def _get_path(self, data_key, node_name, stat_fn):
+        if self._model_key is None:
+            raise RuntimeError('Model should be set before accessing statistics cache')
+        try:
+            stat_key = repr(_make_key(stat_fn))
+        except NotCacheableStatistic:
+            return None
+        key = hashlib.sha256('\n'.join([self._model_key, data_key, node_name, stat_key]).encode())
+        return self._cache_dir / '{}.pickle'.format(key.hexdigest())
+
+    @staticmethod
+    def _get_engine_key(engine):
+        config = {key: value for key, value in dict(engine.config).items()
+                  if key not in NON_STATISTICS_ENGINE_PARAMS}
+        engine_key = {'engine': '{}.{}'.format(type(engine).__module__, type(engine).__qualname__),
+                      'config': config,
+                      'dataset_tag': getattr(engine, 'dataset_tag', None)}
+        return json.dumps(engine_key, sort_keys=True, default=str)
+
+    @staticmethod
+    def _get_sampler_key(sampler):
+        subset_indices = getattr(sampler, '_subset_indices', None)
+        sampler_key = {'sampler': type(sampler).__qualname__,
+                       'batch_size': sampler.batch_size,
+                       'num_samples': sampler.num_samples,
+                       'indices': hashlib.sha256(np.asarray(list(subset_indices), dtype=np.int64).tobytes()).hexdigest()
+                                  if subset_indices is not None else None}
+        return json.dumps(sampler_key, sort_keys=True)
+
+
+def _make_key(value):
+    """ Converts statistic function into hashable structure which is the same across runs.
+    Raises NotCacheableStatistic for functions which can not be identified by name (lambdas, local functions)
+    """
+    if isinstance(value, partial):
+        return 'partial', _make_key(value.func), _make_key(value.args), _make_key(value.keywords)
+    if isinstance(value, dict):
+        return tuple(sorted(((repr(key), _make_key(item)) for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_key(item) for item in value)
+    if isinstance(value, np.ndarray):
+        return 'ndarray', value.dtype.str, value.shape, value.tobytes()
+    if hasattr(value, '__qualname__') and callable(value):
+        if '<' in value.__qualname__:
+            raise NotCacheableStatistic()
+        return '{}.{}'.format(value.__module__, value.__qualname__)
+    if hasattr(value, '__dict__') and not isinstance(value, type):
+        return type(value).__qualname__, _make_key(vars(value))
+    return repr(value)
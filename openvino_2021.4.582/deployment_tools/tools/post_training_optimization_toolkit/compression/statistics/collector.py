@@ -10,6 +10,8 @@
 # to the "third-party-programs.txt" or other similarly-named text file
 # included with the Software Package for additional details.
 
+from .cache import StatisticsCache
+from .functions.aggregation import StatisticAccumulator
 from .utils import merge_algos_by_samplers, merge_stats_by_algo_names
 from ..samplers.sampler import Sampler
 from ..utils.logger import get_logger
@@ -24,6 +26,8 @@ class StatisticsCollector:
         self._layout_by_algo = {}
         self._accumulated_stats_by_algo = {}
         self._samplers = {}
+        cache_dir = engine.config.get('stats_cache_dir')
+        self._cache = StatisticsCache(cache_dir, engine) if cache_dir else None
 
     def register(self, algo_name, stats_layout, sampler: Sampler):
         """
@@ -52,7 +56,9 @@ class StatisticsCollector:
                 self._add_stats_to_accumulated(algo_name_, {})
             return
 
-        self._engine.set_model(model)
+        if self._cache:
+            self._cache.set_model(model)
+        model_is_set = False
 
         predict_iterations = merge_algos_by_samplers(self._samplers)
 
@@ -67,7 +73,22 @@ class StatisticsCollector:
         for algo_names, sampler in predict_iterations:
             combined_stats, stat_aliases_ = merge_stats_by_algo_names(
                 algo_names, self._layout_by_algo)
-            _, stats_ = self._engine.predict(combined_stats, sampler)
+
+            stats_ = self._cache.load(combined_stats, sampler) if self._cache else {}
+            missing_stats = {node_name: {stat_fn: stat_fn for stat_fn in node_stats
+                                         if stat_fn not in stats_.get(node_name, {})}
+                             for node_name, node_stats in combined_stats.items()}
+            if any(missing_stats.values()):
+                if not model_is_set:
+                    self._engine.set_model(model)
+                    model_is_set = True
+                _, computed_stats = self._engine.predict(missing_stats, sampler)
+                if self._cache:
+                    self._cache.save(missing_stats, sampler, computed_stats)
+                for node_name, node_stats in computed_stats.items():
+                    stats_.setdefault(node_name, {}).update(node_stats)
+            else:
+                logger.info('Statistics for algorithms {} are loaded from cache'.format(','.join(algo_names)))
 
             for name in algo_names:
                 self._add_stats_to_accumulated(
@@ -102,10 +123,12 @@ class StatisticsCollector:
         for node_name in stats:
             if node_name in accumulated_stats:
                 for stats_name, value in stats[node_name].items():
-                    if stats_name in accumulated_stats[node_name]:
-                        accumulated_stats[node_name][stats_name].extend(value)
-                    else:
+                    if stats_name not in accumulated_stats[node_name]:
                         accumulated_stats[node_name][stats_name] = value
+                    elif isinstance(value, StatisticAccumulator):
+                        accumulated_stats[node_name][stats_name].merge(value)
+                    else:
+                        accumulated_stats[node_name][stats_name].extend(value)
             else:
                 accumulated_stats[node_name] = stats[node_name]
 
@@ -21,6 +21,8 @@ PERTENSOR = 'pertensor'
 
 AGGREGATION_FN = Registry('AggregationFunctions')
 
+ACCUMULATORS = Registry('AggregationAccumulators')
+
 ACTIVATIONS_STATS_FN = Dict({
     PERCHANNEL: Registry('ActivationsPerchannelFunctions'),
     PERTENSOR: Registry('ActivationsPertensorFunctions')})
@@ -34,6 +36,10 @@ def get_aggregation_function(name):
     return AGGREGATION_FN.get(name)
 
 
+def get_accumulator(name):
+    return ACCUMULATORS.get(name)()
+
+
 def get_stats_function_for_activations(name, granularity):
     return ACTIVATIONS_STATS_FN[granularity].get(name)
 
@@ -9,9 +9,41 @@
 # and your use indicates your acceptance of all such terms. Please refer
 # to the "third-party-programs.txt" or other similarly-named text file
 # included with the Software Package for additional details.
+from functools import partial, wraps
+
 import numpy as np
 
 from ..function_selector import AGGREGATION_FN as aggregator
+from ..function_selector import ACCUMULATORS as accumulator
+
+RESERVOIR_SIZE = 128
+
+
+class StatisticAccumulator:
+    """ Base class for accumulators which reduce per-sample statistics during collection
+    instead of storing values for all samples
+    """
+
+    def update(self, dataset_index, value):
+        raise NotImplementedError
+
+    def merge(self, other):
+        raise NotImplementedError
+
+    def aggregate(self):
+        raise NotImplementedError
+
+
+def accumulated(fn):
+    """ Allows aggregation function to take accumulator instead of the list of per-sample statistics
+    """
+    @wraps(fn)
+    def wrapper(x):
+        if isinstance(x, StatisticAccumulator):
+            return x.aggregate()
+        return fn(x)
+    return wrapper
+
 
 @aggregator.register()
 def batch_mean(x):
@@ -19,69 +51,226 @@ def batch_mean(x):
 
 
 @aggregator.register()
+@accumulated
 def mean(x):
     return np.mean([np.mean(val, axis=0) for val in x], axis=0)
 
 
 @aggregator.register('max')
+@accumulated
 def amax(x):
     return np.max([np.max(val, axis=0) for val in x], axis=0)
 
 
 @aggregator.register('min')
+@accumulated
 def amin(x):
     return np.min([np.min(val, axis=0) for val in x], axis=0)
 
 
 @aggregator.register()
+@accumulated
 def median(x):
     return np.median(x, axis=(0, 1))
 
 
 @aggregator.register()
+@accumulated
 def mean_no_outliers(x):
-    return no_outliers_estimator(np.mean, x)
+    return no_outliers_estimator(np.nanmean, x)
 
 
 @aggregator.register()
+@accumulated
 def median_no_outliers(x):
-    return no_outliers_estimator(np.median, x)
+    return no_outliers_estimator(np.nanmedian, x)
 
 
 @aggregator.register('hl_estimator')
+@accumulated
 def hodges_lehmann_mean(x):
-    """ Outlier-robust mean estimator
+    """ Outlier-robust mean estimator: median of means of all pairs of sample values.
+    Computed for all channels at once without materializing pairs,
+    memory is linear and time is O(n log n) per bisection step
     """
-
-    def hl_functor(x):
-        m = np.add.outer(x, x)
-        ind = np.tril_indices(len(x), -1)
-        return 0.5 * np.median(m[ind])
-
     x = np.array(x)
     if len(x.shape) == 3:
-        result = np.zeros(x.shape[2], x.dtype)
-        for i in range(x.shape[2]):
-            x_ch = x[:, :, i].flatten()
-            result[i] = hl_functor(x_ch)
-    else:
-        result = hl_functor(x.flatten())
-    return result
+        return pairwise_means_median(x.reshape(-1, x.shape[2])).astype(x.dtype)
+    return pairwise_means_median(x.reshape(-1, 1))[0]
 
 
 def no_outliers_estimator(base_estimator, x, alpha=0.01):
     """ Calculate base_estimator function after removal of extreme quantiles
-    from the sample
+    from the sample. base_estimator should ignore NaNs, which replace removed values
     """
     x = np.array(x)
     if len(x.shape) < 3:
         x = np.expand_dims(x, -1)
-    low_value = np.quantile(x, alpha, axis=(0, 1))
-    high_value = np.quantile(x, 1 - alpha, axis=(0, 1))
-
-    result = np.zeros(x.shape[2], x.dtype)
-    for i in range(x.shape[2]):
-        x_ch = x[:, :, i]
-        x_ch = x_ch[(x_ch >= low_value[i]) & (x_ch <= high_value[i])]
-        result[i] = base_estimator(x_ch)
-    return result
+    x = x.reshape(-1, x.shape[2])
+    low_value, high_value = np.quantile(x, [alpha, 1 - alpha], axis=0)
+
+    x_no_outliers = np.where((x >= low_value) & (x <= high_value), x.astype(np.float64), np.nan)
+    return base_estimator(x_no_outliers, axis=0).astype(x.dtype)
+
+
+def pairwise_means_median(x, max_iterations=64):
+    """ Median of (x_i + x_j) / 2 for all i < j, computed independently for every column of x.
+    Pair sums are never materialized: the value of the median is found by bisection, where the number
+    of pairs below a threshold is counted with binary search over sorted columns. When the number of pairs
+    inside the bisection interval becomes small, they are enumerated to select the exact value
+    :param x: array of shape [samples, channels]
+    :param max_iterations: maximal number of bisection steps
+    :return array of medians of shape [channels]
+    """
+    n, channels = x.shape
+    if n < 2:
+        return x.astype(np.float64).mean(axis=0)
+
+    sorted_x = np.sort(x.astype(np.float64), axis=0).T
+    # normalize columns into [0, 1] and shift every column by 4 * column index,
+    # so all columns can be searched at once in a single flattened sorted array
+    x_min = sorted_x[:, :1]
+    x_scale = np.maximum(sorted_x[:, -1:] - x_min, np.finfo(np.float64).tiny)
+    normalized = (sorted_x - x_min) / x_scale
+    offsets = 4 * np.arange(channels, dtype=np.float64)[:, None]
+    keys = (normalized + offsets).ravel()
+    rows = np.arange(channels)[:, None]
+    positions = np.arange(n)[None, :]
+
+    def partners_bound(threshold):
+        """ For every pair start i returns the end of range of partners j > i, such that u_i + u_j <= threshold """
+        bound = np.searchsorted(keys, (offsets + threshold[:, None] - normalized).ravel(), side='right')
+        return np.maximum(bound.reshape(channels, n) - rows * n, positions + 1)
+
+    def count_pairs(threshold):
+        return np.sum(partners_bound(threshold) - positions - 1, axis=1)
+
+    def select(rank):
+        """ Finds rank-th (1-based) smallest pair sum for every column """
+        low, high = np.full(channels, -1.0), np.full(channels, 2.0)
+        low_count = np.zeros(channels, dtype=np.int64)
+        high_count = np.full(channels, n * (n - 1) // 2, dtype=np.int64)
+        for _ in range(max_iterations):
+            if np.all(high_count - low_count <= n):
+                break
+            middle = (low + high) / 2
+            middle_count = count_pairs(middle)
+            go_left = middle_count >= rank
+            high = np.where(go_left, middle, high)
+            high_count = np.where(go_left, middle_count, high_count)
+            low = np.where(go_left, low, middle)
+            low_count = np.where(go_left, low_count, middle_count)
+
+        # value of the bisection interval is used for columns with a lot of equal pair sums
+        result = 2 * x_min[:, 0] + x_scale[:, 0] * high
+        enumerate_pairs = high_count - low_count <= n
+        if np.any(enumerate_pairs):
+            starts, ends = partners_bound(low)[enumerate_pairs], partners_bound(high)[enumerate_pairs]
+            counts = (ends - starts).ravel()
+            group_starts = np.cumsum(counts) - counts
+            first = np.repeat(np.tile(np.arange(n), starts.shape[0]), counts)
+            second = np.repeat(starts.ravel() - group_starts, counts) + np.arange(counts.sum())
+            row_counts = np.sum(ends - starts, axis=1)
+            row_ids = np.repeat(np.arange(starts.shape[0]), row_counts)
+            rows_x = sorted_x[enumerate_pairs]
+            candidates = rows_x[row_ids, first] + rows_x[row_ids, second]
+            candidates = candidates[np.lexsort((candidates, row_ids))]
+            row_starts = np.cumsum(row_counts) - row_counts
+            result[enumerate_pairs] = candidates[row_starts + rank - low_count[enumerate_pairs] - 1]
+        return result
+
+    pairs_number = n * (n - 1) // 2
+    return 0.25 * (select((pairs_number - 1) // 2 + 1) + select(pairs_number // 2 + 1))
+
+
+@accumulator.register('min')
+class MinAccumulator(StatisticAccumulator):
+    """ Running minimum over samples
+    """
+
+    def __init__(self):
+        self._value = None
+
+    def update(self, dataset_index, value):
+        value = np.min(value, axis=0)
+        self._value = value if self._value is None else np.minimum(self._value, value)
+
+    def merge(self, other):
+        if other._value is not None:
+            self.update(None, [other._value])
+
+    def aggregate(self):
+        return self._value
+
+
+@accumulator.register('max')
+class MaxAccumulator(MinAccumulator):
+    """ Running maximum over samples
+    """
+
+    def update(self, dataset_index, value):
+        value = np.max(value, axis=0)
+        self._value = value if self._value is None else np.maximum(self._value, value)
+
+
+@accumulator.register('mean')
+class MeanAccumulator(StatisticAccumulator):
+    """ Running mean of per-sample means
+    """
+
+    def __init__(self):
+        self._sum = None
+        self._dtype = None
+        self._count = 0
+
+    def update(self, dataset_index, value):
+        value = np.mean(value, axis=0)
+        self._dtype = value.dtype
+        value = value.astype(np.float64)
+        self._sum = value if self._sum is None else self._sum + value
+        self._count += 1
+
+    def merge(self, other):
+        if other._count:
+            self._dtype = other._dtype
+            self._sum = other._sum if self._sum is None else self._sum + other._sum
+            self._count += other._count
+
+    def aggregate(self):
+        return (self._sum / self._count).astype(self._dtype)
+
+
+class ReservoirAccumulator(StatisticAccumulator):
+    """ Keeps uniform random subset of at most size samples for the estimators which can not be
+    computed incrementally. Aggregation result is exact while number of samples does not exceed size
+    """
+
+    def __init__(self, aggregation_fn, size=RESERVOIR_SIZE, seed=0):
+        self._aggregation_fn = aggregation_fn
+        self._size = size
+        self._samples = []
+        self._count = 0
+        self._rng = np.random.RandomState(seed)
+
+    def update(self, dataset_index, value):
+        self._count += 1
+        if len(self._samples) < self._size:
+            self._samples.append((dataset_index, value))
+            return
+        sample_id = self._rng.randint(self._count)
+        if sample_id < self._size:
+            self._samples[sample_id] = (dataset_index, value)
+
+    def merge(self, other):
+        for dataset_index, value in other._samples:
+            self.update(dataset_index, value)
+
+    def aggregate(self):
+        return self._aggregation_fn([value for _, value in sorted(self._samples, key=lambda el: el[0])])
+
+
+for robust_estimator_name, robust_estimator in [('median', median),
+                                                ('mean_no_outliers', mean_no_outliers),
+                                                ('median_no_outliers', median_no_outliers),
+                                                ('hl_estimator', hodges_lehmann_mean)]:
+    accumulator.register(robust_estimator_name)(partial(ReservoirAccumulator, robust_estimator))
@@ -18,14 +18,24 @@ class Statistic:
         self.func = func
         self.argv = argv
         self.kwargs = kwargs
+        self.aggregator = None
 
     def compute(self, *input_tensor, **kwargs):
         pass
 
+    def accumulate(self, aggregator):
+        """ Makes per-sample values to be reduced by the accumulator of aggregator during collection,
+        so collected statistic is an accumulator instead of list of values for all samples
+        :param aggregator: name of aggregation function which will be applied to the statistic
+        :return statistic itself
+        """
+        self.aggregator = aggregator
+        return self
+
     def __eq__(self, other):
         if isinstance(other, Statistic):
             return self.func == other.func and self.argv == other.argv \
-                   and self.kwargs == other.kwargs
+                   and self.kwargs == other.kwargs and self.aggregator == other.aggregator
         return False
 
     def __ne__(self, other):
@@ -35,7 +45,7 @@ class Statistic:
         return self.compute(*argv, **kwargs)
 
     def __hash__(self):
-        data = (self.func, frozenset(self.argv), frozenset(self.kwargs))
+        data = (self.func, frozenset(self.argv), frozenset(self.kwargs), self.aggregator)
         if isinstance(self.func, partial):
             data = (*data, frozenset(self.func.keywords))
         return hash(data)
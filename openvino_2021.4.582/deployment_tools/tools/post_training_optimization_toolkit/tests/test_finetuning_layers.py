@@ -0,0 +1,45 @@
+#
+# Copyright 2021 Intel Corporation.
+#
+# LEGAL NOTICE: Your use of this software and any required dependent software
+# (the "Software Package") is subject to the terms and conditions of
+# the Intel(R) OpenVINO(TM) Distribution License for the Software Package,
+# which may also include notices, disclaimers, or license terms for
+# third party or open source software included in or with the Software Package,
+# and your use indicates your acceptance of all such terms. Please refer
+# to the "third-party-programs.txt" or other similarly-named text file
+# included with the Software Package for additional details.
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip('torch')
+
+# pylint: disable=C0413
+from compression.algorithms.finetuning import layers
+
+
+def test_linear_module_does_not_change_shared_constants():
+    weights = np.ones((2, 3), dtype=np.float32)
+    bias = np.zeros((1, 2), dtype=np.float32)
+    # constants shared between model copies are read-only
+    weights.setflags(write=False)
+    bias.setflags(write=False)
+    node = MagicMock(type='MatMul')
+    weight_node, bias_node = MagicMock(), MagicMock()
+    values = {id(weight_node): weights, id(bias_node): bias}
+
+    with patch.object(layers, 'get_weight_node', return_value=weight_node), \
+            patch.object(layers.nu, 'get_bias_for_node', return_value=bias_node), \
+            patch.object(layers.nu, 'get_node_value', side_effect=lambda value_node: values[id(value_node)]):
+        module = layers.LinearModule(node)
+
+    optimizer = torch.optim.SGD(module.parameters(), lr=1.)
+    module(torch.ones((1, 3))).sum().backward()
+    optimizer.step()
+
+    assert not torch.equal(module.weights.detach(), torch.ones((2, 3)))
+    assert np.array_equal(weights, np.ones((2, 3), dtype=np.float32))
+    assert np.array_equal(bias, np.zeros((1, 2), dtype=np.float32))